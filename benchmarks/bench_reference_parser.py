@@ -0,0 +1,56 @@
+import argparse
+import random
+import statistics
+import time
+
+from evidence_extractor.extraction.citations import parse_bibliography
+
+SURNAMES = ["Smith", "Jones", "Garcia", "Nguyen", "Müller", "O'Brien", "Kim", "Rossi"]
+JOURNALS = ["Lancet", "BMJ", "JAMA", "Nature Medicine", "PLoS One", "Trials"]
+
+
+def make_reference_list(n_entries: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    lines = []
+    for i in range(1, n_entries + 1):
+        surname = rng.choice(SURNAMES)
+        coauthor = rng.choice(SURNAMES)
+        year = rng.randint(1990, 2024)
+        journal = rng.choice(JOURNALS)
+        if i % 2:
+            lines.append(
+                f"{i}. {surname} A, {coauthor} B. Outcomes of intervention {i} in "
+                f"adults. {journal}. {year};{rng.randint(1, 400)}:{i}-{i + 9}. "
+                f"doi:10.{rng.randint(1000, 9999)}/ref.{i}. PMID: {10000000 + i}."
+            )
+        else:
+            lines.append(
+                f"{i}. {surname}, A., & {coauthor}, B. ({year}). Cohort study "
+                f"number {i}. {journal}, {rng.randint(1, 60)}(2), 11-19."
+            )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the reference parser.")
+    parser.add_argument("--entries", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    references_text = make_reference_list(args.entries)
+    timings = []
+    for _ in range(args.repeats):
+        start = time.perf_counter()
+        bibliography = parse_bibliography(references_text)
+        timings.append(time.perf_counter() - start)
+
+    assert len(bibliography) == args.entries, "Keys collided or entries were lost."
+    best = min(timings)
+    print(f"entries:     {args.entries}")
+    print(f"best:        {best * 1000:.1f} ms")
+    print(f"median:      {statistics.median(timings) * 1000:.1f} ms")
+    print(f"throughput:  {args.entries / best:,.0f} entries/s")
+
+
+if __name__ == "__main__":
+    main()
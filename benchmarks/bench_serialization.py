@@ -0,0 +1,132 @@
+import argparse
+import json
+import time
+from typing import Callable, List, Tuple
+
+from evidence_extractor.models.schemas import (
+    ArticleExtraction,
+    BibliographyItem,
+    Claim,
+    ExtractedTable,
+    Provenance,
+)
+from evidence_extractor.output.serialization import dumps_extraction, loads_extraction
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def make_extraction(n_claims: int, n_tables: int, rows: int) -> ArticleExtraction:
+    provenance = Provenance(source_filename="paper.pdf", page_number=3)
+    return ArticleExtraction(
+        source_filename="paper.pdf",
+        claims=[
+            Claim(
+                claim_text=f"Intervention {i} reduced the primary outcome by {i}%.",
+                provenance=provenance,
+                linked_citations=[f"Smith{2000 + i % 20}"],
+            )
+            for i in range(n_claims)
+        ],
+        tables=[
+            ExtractedTable(
+                summary=f"Table {t} baseline characteristics.",
+                table_data=[
+                    {f"column_{c}": f"{r * c}.{t} (±{c})" for c in range(8)}
+                    for r in range(rows)
+                ],
+                provenance=provenance,
+            )
+            for t in range(n_tables)
+        ],
+        bibliography={
+            f"Smith{i}": BibliographyItem(
+                citation_key=f"Smith{i}",
+                full_citation=f"Smith A, Jones B. Trial {i}. Lancet. 2020;1:{i}.",
+                authors=["Smith A", "Jones B"],
+                year=2020,
+            )
+            for i in range(n_claims)
+        },
+    )
+
+
+def best_of(func: Callable[[], object], repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare ArticleExtraction serialization paths."
+    )
+    parser.add_argument("--claims", type=int, default=300)
+    parser.add_argument("--tables", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    extraction = make_extraction(args.claims, args.tables, args.rows)
+    pretty = dumps_extraction(extraction, indent=2)
+    compact = dumps_extraction(extraction)
+
+    rows: List[Tuple[str, float, int]] = [
+        (
+            "save json indent=2",
+            best_of(lambda: dumps_extraction(extraction, indent=2), args.repeats),
+            len(pretty),
+        ),
+        (
+            "save json compact",
+            best_of(lambda: dumps_extraction(extraction), args.repeats),
+            len(compact),
+        ),
+        (
+            "load json.load + ArticleExtraction(**data)",
+            best_of(lambda: ArticleExtraction(**json.loads(pretty)), args.repeats),
+            len(pretty),
+        ),
+        (
+            "load validated (model_validate_json)",
+            best_of(lambda: loads_extraction(compact), args.repeats),
+            len(compact),
+        ),
+        (
+            "load trusted (model_construct)",
+            best_of(lambda: loads_extraction(compact, trusted=True), args.repeats),
+            len(compact),
+        ),
+    ]
+    if msgpack is not None:
+        packed = dumps_extraction(extraction, binary=True)
+        rows.append(
+            (
+                "save msgpack",
+                best_of(
+                    lambda: dumps_extraction(extraction, binary=True), args.repeats
+                ),
+                len(packed),
+            )
+        )
+        rows.append(
+            (
+                "load msgpack validated",
+                best_of(lambda: loads_extraction(packed, binary=True), args.repeats),
+                len(packed),
+            )
+        )
+
+    width = max(len(name) for name, _, _ in rows)
+    print(f"{'path':<{width}}  {'best ms':>9}  {'bytes':>10}")
+    for name, seconds, size in rows:
+        print(f"{name:<{width}}  {seconds * 1000:>9.2f}  {size:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+import camelot
+import fitz
+from synthetic_pdf import make_synthetic_pdf
+
+from evidence_extractor.core.preprocess import (
+    clean_and_consolidate_text,
+    extract_text_from_doc,
+)
+from evidence_extractor.core.provenance import find_claim_provenance
+from evidence_extractor.extraction.citations import (
+    build_citation_index,
+    find_references_section,
+    link_in_text_citations,
+    parse_bibliography,
+)
+from evidence_extractor.integration.offline_client import OfflineClient
+from evidence_extractor.pipeline.runner import run_pipeline
+
+RESULTS_SCHEMA = 1
+
+
+def measure(func: Callable[[], Any], repeats: int, warmup: int = 1) -> Dict[str, Any]:
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    # Peak memory is taken from a separate run, so tracing does not skew timings.
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "repeats": repeats,
+        "seconds": {
+            "best": min(samples),
+            "median": statistics.median(samples),
+            "mean": statistics.fmean(samples),
+            "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        },
+        "samples": samples,
+        "peak_memory_bytes": peak,
+    }
+
+
+def stage_benchmarks(pdf_path: str, claims: List[str]) -> Dict[str, Callable]:
+    with fitz.open(pdf_path) as document:
+        pages_text = extract_text_from_doc(document)
+    text_with_newlines, _ = clean_and_consolidate_text(pages_text)
+    references_text, body_end = find_references_section(text_with_newlines)
+    bibliography = parse_bibliography(references_text)
+    body_text = text_with_newlines[:body_end]
+
+    def ingest_text():
+        with fitz.open(pdf_path) as doc:
+            extract_text_from_doc(doc)
+
+    def claim_provenance():
+        for claim in claims:
+            find_claim_provenance(claim, pages_text)
+
+    def citation_index():
+        index = build_citation_index(body_text, bibliography)
+        for claim in claims:
+            index.keys_for_text(claim)
+
+    def table_detection():
+        camelot.read_pdf(pdf_path, pages="all", flavor="lattice")
+        camelot.read_pdf(pdf_path, pages="all", flavor="stream")
+
+    def figure_scan():
+        with fitz.open(pdf_path) as doc:
+            for page in doc:
+                for image in page.get_images(full=True):
+                    doc.extract_image(image[0])
+
+    return {
+        "ingest_text": ingest_text,
+        "clean_text": lambda: clean_and_consolidate_text(pages_text),
+        "claim_provenance": claim_provenance,
+        "references": lambda: parse_bibliography(
+            find_references_section(text_with_newlines)[0]
+        ),
+        "citation_index": citation_index,
+        "link_in_text_citations": lambda: link_in_text_citations(
+            body_text, bibliography
+        ),
+        "table_detection": table_detection,
+        "figure_scan": figure_scan,
+    }
+
+
+def pipeline_benchmark(
+    pdf_path: str, repeats: int, llm_latency: float, max_claims: int
+) -> Dict[str, Dict[str, Any]]:
+    stage_samples: Dict[str, List[float]] = {}
+
+    def extract():
+        client = OfflineClient(max_claims=max_claims, latency=llm_latency)
+        _, report = run_pipeline(pdf_path, client)
+        for name, seconds in report.stage_seconds().items():
+            stage_samples.setdefault(name, []).append(seconds)
+
+    results = {"pipeline": measure(extract, repeats, warmup=0)}
+    for name, samples in stage_samples.items():
+        # The last sample comes from the memory-traced run; leave it out.
+        samples = samples[:repeats]
+        results[f"pipeline.{name}"] = {
+            "repeats": len(samples),
+            "seconds": {
+                "best": min(samples),
+                "median": statistics.median(samples),
+                "mean": statistics.fmean(samples),
+                "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+            },
+            "samples": samples,
+        }
+    return results
+
+
+def environment() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "pymupdf": fitz.VersionBind,
+    }
+
+
+def run_benchmarks(args: argparse.Namespace) -> Dict[str, Any]:
+    parameters = {
+        "pages": args.pages,
+        "references": args.references,
+        "tables": args.tables,
+        "images": args.images,
+        "seed": args.seed,
+        "repeats": args.repeats,
+        "llm_latency": args.llm_latency,
+        "max_claims": args.max_claims,
+    }
+    benchmarks: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        paper = make_synthetic_pdf(
+            os.path.join(workdir, "synthetic.pdf"),
+            args.pages,
+            args.references,
+            args.tables,
+            args.images,
+            args.seed,
+        )
+        claims = paper.claims[: args.max_claims]
+        for name, func in stage_benchmarks(paper.path, claims).items():
+            if args.only and name not in args.only:
+                continue
+            benchmarks[name] = measure(func, args.repeats)
+        if not args.only or "pipeline" in args.only:
+            benchmarks.update(
+                pipeline_benchmark(
+                    paper.path, args.repeats, args.llm_latency, args.max_claims
+                )
+            )
+    return {
+        "schema": RESULTS_SCHEMA,
+        "created_at": datetime.utcnow().isoformat(),
+        "environment": environment(),
+        "parameters": parameters,
+        "benchmarks": benchmarks,
+    }
+
+
+def print_table(results: Dict[str, Any]):
+    print(f"{'benchmark':<32}{'best ms':>10}{'median ms':>11}{'peak KiB':>10}")
+    for name, result in results["benchmarks"].items():
+        seconds = result["seconds"]
+        peak = result.get("peak_memory_bytes")
+        peak_text = f"{peak / 1024:>10.0f}" if peak is not None else f"{'-':>10}"
+        print(
+            f"{name:<32}{seconds['best'] * 1000:>10.1f}"
+            f"{seconds['median'] * 1000:>11.1f}{peak_text}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time each extraction stage and the full pipeline on a "
+        "synthetic PDF, using the offline LLM stand-in."
+    )
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--references", type=int, default=50)
+    parser.add_argument("--tables", type=int, default=2)
+    parser.add_argument("--images", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--max-claims", type=int, default=20)
+    parser.add_argument(
+        "--llm-latency",
+        type=float,
+        default=0.0,
+        help="Seconds the offline LLM stand-in waits per request.",
+    )
+    parser.add_argument(
+        "--only", nargs="+", default=None, help="Run only these benchmarks."
+    )
+    parser.add_argument(
+        "--output", default=None, help="Write JSON results here ('-' for stdout)."
+    )
+    args = parser.parse_args()
+
+    # Library warnings (camelot, the offline table screenshots) would drown the table.
+    logging.disable(logging.WARNING)
+    warnings.filterwarnings("ignore")
+    results = run_benchmarks(args)
+    if args.output == "-":
+        json.dump(results, sys.stdout, indent=2)
+        return
+    print_table(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
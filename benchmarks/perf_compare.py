@@ -0,0 +1,288 @@
+import argparse
+import hashlib
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+DEFAULT_STORE = Path(__file__).resolve().parent / "results"
+DEFAULT_TIME_THRESHOLD = 0.10
+DEFAULT_MEMORY_THRESHOLD = 0.10
+DEFAULT_NOISE_SIGMAS = 3.0
+MIN_TIME_DELTA = 0.001
+MIN_MEMORY_DELTA = 64 * 1024
+
+# Fields that decide whether two timings are comparable at all.
+FINGERPRINT_FIELDS = ("implementation", "python", "machine", "processor", "cpu_count")
+
+
+def machine_fingerprint(environment: Dict[str, Any]) -> str:
+    identity = {field: environment.get(field) for field in FINGERPRINT_FIELDS}
+    # The OS family matters, but not the kernel patch level.
+    identity["system"] = str(environment.get("platform", "")).split("-")[0]
+    digest = hashlib.sha256(json.dumps(identity, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+def current_commit() -> str:
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ["git", *args],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+    try:
+        commit = git("rev-parse", "HEAD")
+        dirty = bool(git("status", "--porcelain", "--untracked-files=no"))
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def record(results: Dict[str, Any], store: Path, commit: Optional[str] = None) -> Path:
+    commit = commit or current_commit()
+    fingerprint = machine_fingerprint(results["environment"])
+    results = {**results, "commit": commit, "machine_fingerprint": fingerprint}
+    target = store / fingerprint / f"{commit}.json"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    return target
+
+
+def stored_runs(store: Path, fingerprint: str) -> List[Dict[str, Any]]:
+    runs = [load_results(path) for path in (store / fingerprint).glob("*.json")]
+    return sorted(runs, key=lambda run: run.get("created_at", ""))
+
+
+def find_baseline(
+    store: Path, fingerprint: str, baseline: Optional[str], exclude_commit: str
+) -> Optional[Dict[str, Any]]:
+    if baseline and Path(baseline).is_file():
+        return load_results(Path(baseline))
+    runs = stored_runs(store, fingerprint)
+    if baseline:
+        matching = [run for run in runs if run["commit"].startswith(baseline)]
+        return matching[-1] if matching else None
+    # A dirty run measured uncommitted code, so it is only used when named.
+    earlier = [
+        run
+        for run in runs
+        if run["commit"] != exclude_commit and not run["commit"].endswith("-dirty")
+    ]
+    return earlier[-1] if earlier else None
+
+
+def compare_metric(
+    base: float,
+    new: float,
+    threshold: float,
+    floor: float,
+    noise: float = 0.0,
+) -> Dict[str, Any]:
+    allowed = max(threshold * base, noise, floor)
+    delta = new - base
+    if delta > allowed:
+        verdict = "regression"
+    elif delta < -allowed:
+        verdict = "improvement"
+    else:
+        verdict = "unchanged"
+    return {
+        "baseline": base,
+        "current": new,
+        "change": delta / base if base else 0.0,
+        "allowed": allowed,
+        "verdict": verdict,
+    }
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    time_threshold: float = DEFAULT_TIME_THRESHOLD,
+    memory_threshold: float = DEFAULT_MEMORY_THRESHOLD,
+    noise_sigmas: float = DEFAULT_NOISE_SIGMAS,
+) -> Dict[str, Dict[str, Any]]:
+    comparison: Dict[str, Dict[str, Any]] = {}
+    for name, result in current["benchmarks"].items():
+        base = baseline["benchmarks"].get(name)
+        if base is None:
+            continue
+        # Noise is the larger of the two runs' spreads; medians resist outliers.
+        spread = max(base["seconds"]["stdev"], result["seconds"]["stdev"])
+        entry = {
+            "time": compare_metric(
+                base["seconds"]["median"],
+                result["seconds"]["median"],
+                time_threshold,
+                MIN_TIME_DELTA,
+                noise_sigmas * spread,
+            )
+        }
+        if (
+            base.get("peak_memory_bytes") is not None
+            and result.get("peak_memory_bytes") is not None
+        ):
+            entry["memory"] = compare_metric(
+                base["peak_memory_bytes"],
+                result["peak_memory_bytes"],
+                memory_threshold,
+                MIN_MEMORY_DELTA,
+            )
+        comparison[name] = entry
+    return comparison
+
+
+def print_comparison(comparison: Dict[str, Dict[str, Any]]):
+    print(f"{'benchmark':<32}{'base ms':>10}{'now ms':>10}{'time':>9}{'memory':>9}")
+    for name, entry in comparison.items():
+        time_entry = entry["time"]
+        memory = entry.get("memory")
+        memory_text = f"{memory['change']:>+9.1%}" if memory else f"{'-':>9}"
+        flags = [
+            f"{metric} {verdict['verdict']}"
+            for metric, verdict in entry.items()
+            if verdict["verdict"] != "unchanged"
+        ]
+        print(
+            f"{name:<32}{time_entry['baseline'] * 1000:>10.1f}"
+            f"{time_entry['current'] * 1000:>10.1f}{time_entry['change']:>+9.1%}"
+            f"{memory_text}  {', '.join(flags)}"
+        )
+
+
+def regressions(comparison: Dict[str, Dict[str, Any]]) -> List[str]:
+    return [
+        f"{name} ({metric})"
+        for name, entry in comparison.items()
+        for metric, verdict in entry.items()
+        if verdict["verdict"] == "regression"
+    ]
+
+
+def command_record(args: argparse.Namespace) -> int:
+    target = record(load_results(Path(args.results)), Path(args.store), args.commit)
+    print(f"Stored results as {target}")
+    return 0
+
+
+def command_compare(args: argparse.Namespace) -> int:
+    current = load_results(Path(args.results))
+    store = Path(args.store)
+    commit = args.commit or current_commit()
+    fingerprint = machine_fingerprint(current["environment"])
+    baseline = find_baseline(store, fingerprint, args.baseline, commit)
+    if baseline is None:
+        print(f"No baseline found for machine {fingerprint}.", file=sys.stderr)
+        if args.record:
+            print(f"Stored results as {record(current, store, commit)}")
+        return 0
+    if machine_fingerprint(baseline["environment"]) != fingerprint:
+        print(
+            "Warning: the baseline was measured on a different machine.",
+            file=sys.stderr,
+        )
+    if baseline.get("parameters") != current.get("parameters"):
+        print(
+            "Warning: benchmark parameters differ from the baseline's.",
+            file=sys.stderr,
+        )
+    comparison = compare_results(
+        baseline,
+        current,
+        args.time_threshold,
+        args.memory_threshold,
+        args.noise_sigmas,
+    )
+    print(f"Baseline: {baseline.get('commit', args.baseline)} on machine {fingerprint}")
+    print_comparison(comparison)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(comparison, f, indent=2)
+    if args.record:
+        print(f"Stored results as {record(current, store, commit)}")
+    flagged = regressions(comparison)
+    if flagged:
+        print(f"Regressions: {', '.join(flagged)}", file=sys.stderr)
+        return 1 if args.fail else 0
+    print("No regressions.")
+    return 0
+
+
+def command_list(args: argparse.Namespace) -> int:
+    store = Path(args.store)
+    for machine in sorted(path for path in store.glob("*") if path.is_dir()):
+        print(machine.name)
+        for run in stored_runs(store, machine.name):
+            print(f"  {run.get('created_at', '?'):<28}{run['commit']}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Store benchmark results per commit and machine, and flag "
+        "time or peak-memory regressions against a baseline."
+    )
+    parser.add_argument(
+        "--store", default=str(DEFAULT_STORE), help="Directory of stored results."
+    )
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subcommands.add_parser("record", help="Store a results file.")
+    record_parser.add_argument("results", help="JSON written by bench_stages.py.")
+    record_parser.add_argument("--commit", default=None)
+    record_parser.set_defaults(handler=command_record)
+
+    compare_parser = subcommands.add_parser(
+        "compare", help="Compare a results file against a stored baseline."
+    )
+    compare_parser.add_argument("results", help="JSON written by bench_stages.py.")
+    compare_parser.add_argument(
+        "--baseline",
+        default=None,
+        help="Commit prefix or results file. Defaults to the latest stored run "
+        "from another clean commit on this machine.",
+    )
+    compare_parser.add_argument("--commit", default=None)
+    compare_parser.add_argument(
+        "--time-threshold", type=float, default=DEFAULT_TIME_THRESHOLD
+    )
+    compare_parser.add_argument(
+        "--memory-threshold", type=float, default=DEFAULT_MEMORY_THRESHOLD
+    )
+    compare_parser.add_argument(
+        "--noise-sigmas",
+        type=float,
+        default=DEFAULT_NOISE_SIGMAS,
+        help="Ignore time changes within this many standard deviations.",
+    )
+    compare_parser.add_argument(
+        "--record", action="store_true", help="Also store the results."
+    )
+    compare_parser.add_argument(
+        "--fail", action="store_true", help="Exit with status 1 on any regression."
+    )
+    compare_parser.add_argument(
+        "--json", default=None, help="Write the comparison as JSON."
+    )
+    compare_parser.set_defaults(handler=command_compare)
+
+    list_parser = subcommands.add_parser("list", help="List stored results.")
+    list_parser.set_defaults(handler=command_list)
+
+    args = parser.parse_args()
+    sys.exit(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
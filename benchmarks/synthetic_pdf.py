@@ -0,0 +1,178 @@
+import argparse
+import random
+import textwrap
+from typing import List, NamedTuple
+
+import fitz
+
+SURNAMES = ["Smith", "Jones", "Garcia", "Nguyen", "Muller", "OBrien", "Kim", "Rossi"]
+JOURNALS = ["Lancet", "BMJ", "JAMA", "Nature Medicine", "PLoS One", "Trials"]
+OUTCOMES = ["mortality", "blood pressure", "hospital admissions", "pain scores"]
+FILLER = [
+    "Participants were recruited from outpatient clinics between 2015 and 2019.",
+    "Baseline characteristics were balanced across the study arms.",
+    "Outcome assessors were blinded to treatment allocation throughout follow-up.",
+    "Missing data were handled with multiple imputation by chained equations.",
+]
+
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842
+MARGIN = 56
+FONT_SIZE = 10
+LEADING = 13
+WRAP_CHARS = 95
+TABLE_ROWS, TABLE_COLUMNS = 6, 4
+TABLE_CELL = (110, 18)
+IMAGE_SIZE = 120
+
+
+class SyntheticPaper(NamedTuple):
+    path: str
+    pages: int
+    claims: List[str]
+    references: int
+    tables: int
+    images: int
+
+
+def make_references(n_references: int, rng: random.Random) -> List[tuple]:
+    return [
+        (
+            i,
+            rng.choice(SURNAMES),
+            rng.choice(SURNAMES),
+            rng.randint(1990, 2024),
+            rng.choice(JOURNALS),
+        )
+        for i in range(1, n_references + 1)
+    ]
+
+
+def make_sentences(references: List[tuple], rng: random.Random):
+    i = 0
+    while True:
+        i += 1
+        if i % 3:
+            yield rng.choice(FILLER), False
+            continue
+        number, surname, _, year, _ = (
+            rng.choice(references) if references else (0, "", "", 0, "")
+        )
+        citation = f" ({surname}, {year}) [{number}]" if references else ""
+        yield (
+            f"Intervention {i} reduced {rng.choice(OUTCOMES)} by "
+            f"{rng.randint(2, 40)}% compared with placebo{citation}.",
+            True,
+        )
+
+
+def _draw_table(page: fitz.Page, top: float, index: int) -> float:
+    width, height = TABLE_CELL
+    for row in range(TABLE_ROWS):
+        for column in range(TABLE_COLUMNS):
+            x0, y0 = MARGIN + column * width, top + row * height
+            page.draw_rect(
+                fitz.Rect(x0, y0, x0 + width, y0 + height), color=(0, 0, 0), width=0.6
+            )
+            label = f"Arm {column}" if row == 0 else f"{row * column + index}.{row}"
+            page.insert_text((x0 + 4, y0 + 13), label, fontsize=9)
+    bottom = top + TABLE_ROWS * height
+    page.insert_text(
+        (MARGIN, bottom + 14), f"Table {index + 1}: Outcomes by arm.", fontsize=9
+    )
+    return bottom + 24
+
+
+def _draw_image(page: fitz.Page, top: float, index: int, rng: random.Random) -> float:
+    pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, IMAGE_SIZE, IMAGE_SIZE), False)
+    pixmap.set_rect(pixmap.irect, tuple(rng.randint(0, 255) for _ in range(3)))
+    rect = fitz.Rect(MARGIN, top, MARGIN + IMAGE_SIZE, top + IMAGE_SIZE)
+    page.insert_image(rect, pixmap=pixmap)
+    page.insert_text(
+        (MARGIN, rect.y1 + 14), f"Figure {index + 1}: Synthetic plot.", fontsize=9
+    )
+    return rect.y1 + 24
+
+
+def make_synthetic_pdf(
+    path: str,
+    pages: int = 10,
+    references: int = 50,
+    tables: int = 2,
+    images: int = 2,
+    seed: int = 0,
+) -> SyntheticPaper:
+    rng = random.Random(seed)
+    reference_list = make_references(references, rng)
+    sentences = make_sentences(reference_list, rng)
+    claims: List[str] = []
+    doc = fitz.open()
+    for page_index in range(pages):
+        page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        y = MARGIN
+        if page_index == 0:
+            page.insert_text((MARGIN, y), "A Synthetic Randomised Trial", fontsize=16)
+            y += 2 * LEADING
+        # Deal tables and images round-robin over the body pages.
+        for table_index in range(page_index, tables, pages):
+            y = _draw_table(page, y, table_index)
+        for image_index in range(page_index, images, pages):
+            y = _draw_image(page, y, image_index, rng)
+        while y < PAGE_HEIGHT - MARGIN - 3 * LEADING:
+            paragraph, paragraph_claims = [], []
+            for _ in range(4):
+                sentence, is_claim = next(sentences)
+                paragraph.append(sentence)
+                if is_claim:
+                    paragraph_claims.append(sentence)
+            lines = textwrap.wrap(" ".join(paragraph), WRAP_CHARS)
+            room = int((PAGE_HEIGHT - MARGIN - 2 * LEADING - y) // LEADING)
+            if len(lines) > room:
+                break
+            for line in lines:
+                page.insert_text((MARGIN, y), line, fontsize=FONT_SIZE)
+                y += LEADING
+            claims.extend(paragraph_claims)
+            y += LEADING / 2
+        page.insert_text(
+            (PAGE_WIDTH / 2, PAGE_HEIGHT - MARGIN / 2), str(page_index + 1), fontsize=9
+        )
+
+    page, y = None, PAGE_HEIGHT
+    heading_done = False
+    for number, surname, coauthor, year, journal in reference_list:
+        entry = (
+            f"{number}. {surname} A, {coauthor} B. Outcomes of intervention {number} "
+            f"in adults. {journal}. {year};{number % 400 + 1}:{number}-{number + 9}."
+        )
+        lines = textwrap.wrap(entry, WRAP_CHARS, subsequent_indent="   ")
+        if page is None or y + len(lines) * LEADING > PAGE_HEIGHT - MARGIN:
+            page, y = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT), MARGIN
+        if not heading_done:
+            page.insert_text((MARGIN, y), "References", fontsize=12)
+            y += 2 * LEADING
+            heading_done = True
+        for line in lines:
+            page.insert_text((MARGIN, y), line, fontsize=FONT_SIZE)
+            y += LEADING
+    doc.save(path, garbage=3, deflate=True)
+    doc.close()
+    return SyntheticPaper(path, pages, claims, references, tables, images)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic research PDF.")
+    parser.add_argument("output")
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--references", type=int, default=50)
+    parser.add_argument("--tables", type=int, default=2)
+    parser.add_argument("--images", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    paper = make_synthetic_pdf(
+        args.output, args.pages, args.references, args.tables, args.images, args.seed
+    )
+    print(f"Wrote {paper.path} with {len(paper.claims)} claim sentences.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
+import itertools
 import json
 import logging
 import sys
-from datetime import datetime
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
 
 import click
 
@@ -10,34 +13,90 @@ from evidence_extractor.core.preprocess import (
     clean_and_consolidate_text,
     extract_text_from_doc,
 )
-from evidence_extractor.core.provenance import find_claim_provenance
-from evidence_extractor.evaluation.metrics import calculate_claim_metrics
-from evidence_extractor.extraction.citations import (
-    find_references_section,
-    link_in_text_citations,
-    parse_bibliography,
+from evidence_extractor.evaluation.harness import (
+    DEFAULT_INPUT_PRICE,
+    DEFAULT_OUTPUT_PRICE,
+    EVALUATION_REPORT_FILENAME,
+    collect_gold_pairs,
+    run_evaluation,
+)
+from evidence_extractor.evaluation.metrics import (
+    DEFAULT_FIELD_THRESHOLD,
+    DEFAULT_MATCH_THRESHOLD,
+    calculate_claim_metrics,
 )
-from evidence_extractor.extraction.figures import extract_figures_and_captions
 from evidence_extractor.extraction.llm_orchestrator import orchestrate_llm_extraction
-from evidence_extractor.extraction.summarization import generate_summary
-from evidence_extractor.extraction.tables import extract_tables_with_llm
-from evidence_extractor.extraction.uncertainty import annotate_claims_in_batch
 from evidence_extractor.integration.gemini_client import GeminiClient
-from evidence_extractor.models.schemas import (
-    PICO,
-    ArticleExtraction,
-    Claim,
-    Provenance,
-    QualityScore,
-    ValidationStatus,
-)
-from evidence_extractor.output.json_builder import save_to_json
+from evidence_extractor.models.schemas import ArticleExtraction, ValidationStatus
+from evidence_extractor.output.json_builder import save_to_json_atomic
+from evidence_extractor.output.jsonl_corpus import CorpusReader, record_key
+from evidence_extractor.output.parquet_export import export_to_parquet
 from evidence_extractor.output.prisma import (
+    count_failed_documents,
+    generate_corpus_prisma_report,
     generate_prisma_text_report,
     save_prisma_report,
+    tally_prisma,
+)
+from evidence_extractor.output.prisma_diagram import (
+    DIAGRAM_FORMATS,
+    DIAGRAM_RENDERERS,
+    generate_prisma_diagram,
+    render_prisma_diagram,
+)
+from evidence_extractor.output.serialization import MSGPACK_SUFFIXES, load_extraction
+from evidence_extractor.output.spreadsheet import (
+    export_corpus_to_excel,
+    export_to_excel,
+)
+from evidence_extractor.pipeline.batch import (
+    CHECKPOINT_DIRNAME,
+    RUN_SUMMARY_FILENAME,
+    collect_pdf_paths,
+    completed_cleanly,
+    default_worker_count,
+    run_batch,
+)
+from evidence_extractor.pipeline.checkpoints import discard_checkpoints
+from evidence_extractor.pipeline.dag import PipelineReport, StageStatus
+from evidence_extractor.pipeline.runner import run_pipeline
+from evidence_extractor.pipeline.update import collect_extraction_paths, run_update
+from evidence_extractor.pipeline.watch import (
+    DEFAULT_POLL_SECONDS,
+    DEFAULT_SETTLE_SECONDS,
+    FolderWatcher,
 )
-from evidence_extractor.output.prisma_diagram import generate_prisma_diagram
-from evidence_extractor.output.spreadsheet import export_to_excel
+from evidence_extractor.pipeline.work_queue import (
+    DEFAULT_LEASE_SECONDS,
+    run_distributed_batch,
+)
+from evidence_extractor.review.journal import (
+    SKIPPED,
+    ReviewJournal,
+    apply_decisions,
+    compact_journal,
+    is_current,
+    item_hash,
+    journal_path_for,
+    review_items,
+    text_digest,
+)
+from evidence_extractor.review.queue import (
+    LEVELS as REVIEW_LEVELS,
+)
+from evidence_extractor.review.queue import (
+    QUEUE_JOURNAL_FILENAME,
+    UNKNOWN_LEVEL,
+    QueueFilter,
+    bulk_decide,
+    iter_directory_queue,
+    iter_store_queue,
+)
+from evidence_extractor.service.jobs import JobQueue
+from evidence_extractor.service.server import serve as serve_forever
+from evidence_extractor.storage.corpus_store import CorpusStore
+from evidence_extractor.storage.reference_store import ReferenceStore
+from evidence_extractor.storage.search_index import SEARCH_KINDS
 from evidence_extractor.utils.logging_config import setup_logging
 
 logger = logging.getLogger(__name__)
@@ -64,158 +123,707 @@ def cli():
     required=True,
     help="The path to save the structured JSON output.",
 )
-def extract(pdf_path: str, output_path: str):
+@click.option(
+    "--reference-store",
+    "reference_store_path",
+    type=click.Path(dir_okay=False, resolve_path=True),
+    help="SQLite database in which to intern the parsed bibliography.",
+)
+@click.option(
+    "--stage-timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Cancel any pipeline stage that runs longer than this many seconds; "
+    "it stops before its next LLM request.",
+)
+@click.option(
+    "--checkpoint-dir",
+    "checkpoint_dir",
+    type=click.Path(file_okay=False, writable=True, resolve_path=True),
+    default=None,
+    help="Where per-stage checkpoints are kept. Defaults to a '.checkpoints' "
+    "directory next to the output.",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Reuse checkpointed stage outputs instead of recomputing them.",
+)
+@click.option(
+    "--store",
+    "store_path",
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+    default=None,
+    help="Also upsert each extraction into this SQLite corpus store, keeping its "
+    "search index current.",
+)
+def extract(
+    pdf_path: str,
+    output_path: str,
+    reference_store_path: str,
+    stage_timeout: float,
+    checkpoint_dir: str,
+    resume: bool,
+    store_path: str,
+):
     click.secho("--- Evidence Extractor ---", fg="cyan", bold=True)
-    logger.info(f"Received request to process PDF: {pdf_path}")
-    extraction_result = ArticleExtraction(source_filename=pdf_path)
     gemini_client = GeminiClient()
     if not gemini_client.is_configured():
         logger.warning("Gemini client not configured.")
-    document = ingest_pdf(pdf_path)
-    if not document:
+    checkpoint_root = checkpoint_dir or str(
+        Path(output_path).parent / CHECKPOINT_DIRNAME
+    )
+    outcome = run_pipeline(
+        pdf_path,
+        gemini_client,
+        reference_store_path,
+        stage_timeout=stage_timeout,
+        checkpoint_root=checkpoint_root,
+        resume=resume,
+    )
+    if outcome is None:
         sys.exit(1)
-    pages_text = extract_text_from_doc(document)
-    text_with_newlines, cleaned_text = clean_and_consolidate_text(pages_text)
-    if not cleaned_text:
-        document.close()
+    extraction_result, report = outcome
+    _echo_stage_report(report)
+    if extraction_result.summary:
+        click.secho("\n--- Generated Summary ---", fg="green")
+        click.echo(extraction_result.summary)
+        click.secho("-----------------------", fg="green")
+    try:
+        save_to_json_atomic(extraction_result, output_path)
+    except Exception as e:
+        click.secho(
+            f"Could not write '{output_path}': {e}. Stage checkpoints are kept in "
+            f"'{checkpoint_root}'; rerun with --resume.",
+            fg="red",
+        )
         sys.exit(1)
-    if gemini_client.is_configured():
-        llm_payload = orchestrate_llm_extraction(gemini_client, cleaned_text[:16000])
-        if llm_payload:
-            if llm_payload.get("pico"):
-                extraction_result.pico_elements = PICO(**llm_payload["pico"])
-            if llm_payload.get("quality"):
-                extraction_result.quality_scores.append(
-                    QualityScore(**llm_payload["quality"])
-                )
-            claim_data = llm_payload.get("claims", [])
-            if claim_data:
-                temp_claims = []
-                for item in claim_data:
-                    text = item.get("claim_text")
-                    if text:
-                        page_num = find_claim_provenance(text, pages_text)
-                        provenance = Provenance(
-                            source_filename=pdf_path, page_number=page_num
-                        )
-                        claim = Claim(claim_text=text, provenance=provenance)
-                        temp_claims.append(claim)
-                annotate_claims_in_batch(gemini_client, temp_claims)
-                extraction_result.claims = temp_claims
-                summary = generate_summary(gemini_client, extraction_result.claims)
-                if summary:
-                    extraction_result.summary = summary
-                    click.secho("\n--- Generated Summary ---", fg="green")
-                    click.echo(summary)
-                    click.secho("-----------------------", fg="green")
-        figures = extract_figures_and_captions(document, gemini_client)
-        if figures:
-            extraction_result.figures = figures
-    if gemini_client.is_configured():
-        tables = extract_tables_with_llm(document, gemini_client)
-        if tables:
-            extraction_result.tables = tables
+    if completed_cleanly(report):
+        discard_checkpoints(checkpoint_root, extraction_result.document_hash)
+    if store_path:
+        with CorpusStore(store_path) as store:
+            store.upsert(extraction_result)
+    click.secho("\nProcessing complete.", fg="green", bold=True)
+
+
+def _echo_stage_report(report: PipelineReport):
+    click.secho("\n--- Pipeline Stages ---", fg="cyan")
+    for name, result in report.stages.items():
+        colour = "green" if result.status == StageStatus.OK else "red"
+        source = " (checkpoint)" if result.from_checkpoint else ""
+        click.secho(
+            f"  {name:<14} {result.status.value:<8} {result.duration:>7.2f}s{source}",
+            fg=colour,
+        )
+    click.echo(
+        f"  Wall time: {report.wall_seconds:.2f}s; critical path: "
+        f"{' -> '.join(report.critical_path)} ({report.critical_path_seconds:.2f}s)"
+    )
+
+
+@cli.command()
+@click.argument("source", type=click.Path(exists=True, resolve_path=True))
+@click.option(
+    "--output-dir",
+    "output_dir",
+    type=click.Path(file_okay=False, writable=True, resolve_path=True),
+    required=True,
+    help="Directory in which to write one JSON file per document.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=default_worker_count,
+    show_default="min(4, CPU count)",
+    help="Number of worker processes.",
+)
+@click.option(
+    "--llm-concurrency",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of Gemini requests in flight across all workers.",
+)
+@click.option(
+    "--recursive",
+    is_flag=True,
+    help="Search SOURCE directory recursively for PDFs.",
+)
+@click.option(
+    "--reference-store",
+    "reference_store_path",
+    type=click.Path(dir_okay=False, resolve_path=True),
+    help="SQLite database in which to intern the parsed bibliographies.",
+)
+@click.option(
+    "--stage-timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Cancel any pipeline stage that runs longer than this many seconds; "
+    "it stops before its next LLM request.",
+)
+@click.option(
+    "--checkpoint-dir",
+    "checkpoint_dir",
+    type=click.Path(file_okay=False, writable=True, resolve_path=True),
+    default=None,
+    help="Where per-stage checkpoints are kept. Defaults to OUTPUT_DIR/.checkpoints.",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Reuse checkpointed stage outputs instead of recomputing them.",
+)
+@click.option(
+    "--corpus",
+    "corpus_path",
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+    default=None,
+    help="Append every extraction to this JSONL corpus (use a .jsonl.zst suffix "
+    "for zstd compression) instead of writing one JSON file per document.",
+)
+@click.option(
+    "--queue-dir",
+    type=click.Path(file_okay=False, writable=True, resolve_path=True),
+    default=None,
+    help="Shared directory used as a work queue so several nodes can split the "
+    "corpus. Run the same command on every node.",
+)
+@click.option(
+    "--lease-seconds",
+    type=click.FloatRange(min=1),
+    default=DEFAULT_LEASE_SECONDS,
+    show_default=True,
+    help="How long a claimed document stays leased without a heartbeat before "
+    "another node may re-claim it.",
+)
+@click.option(
+    "--store",
+    "store_path",
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+    default=None,
+    help="Also upsert each extraction into this SQLite corpus store, keeping its "
+    "search index current.",
+)
+def batch(
+    source: str,
+    output_dir: str,
+    workers: int,
+    llm_concurrency: int,
+    recursive: bool,
+    reference_store_path: str,
+    stage_timeout: float,
+    checkpoint_dir: str,
+    resume: bool,
+    corpus_path: str,
+    queue_dir: str,
+    lease_seconds: float,
+    store_path: str,
+):
+    click.secho("--- Evidence Extractor: Batch Mode ---", fg="cyan", bold=True)
+    pdf_paths = collect_pdf_paths(source, recursive=recursive)
+    if not pdf_paths:
+        click.secho(f"No PDF files found in '{source}'.", fg="red")
+        sys.exit(1)
+    root = Path(source) if Path(source).is_dir() else None
+    pipeline_options = {
+        "reference_store_path": reference_store_path,
+        "stage_timeout": stage_timeout,
+        "checkpoint_root": checkpoint_dir or str(Path(output_dir) / CHECKPOINT_DIRNAME),
+        "resume": resume,
+    }
+    if queue_dir and corpus_path:
+        click.secho(
+            "--corpus cannot be combined with --queue-dir; nodes would append to "
+            "the same file concurrently.",
+            fg="red",
+        )
+        sys.exit(1)
+    if queue_dir and store_path:
+        click.secho(
+            "--store cannot be combined with --queue-dir; run 'ingest' on the "
+            "merged output directory instead.",
+            fg="red",
+        )
+        sys.exit(1)
+    if queue_dir:
+        summary = run_distributed_batch(
+            pdf_paths,
+            output_dir,
+            queue_dir,
+            workers=workers,
+            llm_concurrency=llm_concurrency,
+            root=root,
+            pipeline_options=pipeline_options,
+            lease_seconds=lease_seconds,
+        )
     else:
-        logger.warning(
-            "Skipping advanced table extraction as Gemini client is not configured."
+        summary = run_batch(
+            pdf_paths,
+            output_dir,
+            workers=workers,
+            llm_concurrency=llm_concurrency,
+            root=root,
+            pipeline_options=pipeline_options,
+            corpus_path=corpus_path,
+            store_path=store_path,
         )
-    refs_tuple = find_references_section(text_with_newlines)
-    if refs_tuple:
-        refs_text, start_idx = refs_tuple
-        bib = parse_bibliography(refs_text)
-        extraction_result.bibliography = bib
-        body_text = text_with_newlines[:start_idx]
-        link_in_text_citations(body_text, extraction_result.bibliography)
-    save_to_json(extraction_result, output_path)
-    document.close()
-    click.secho("\nProcessing complete.", fg="green", bold=True)
-    sys.exit(0)
+    for record in summary["documents"]:
+        colour = "green" if record["status"] == "ok" else "red"
+        seconds = record["seconds"] if record["seconds"] is not None else "-"
+        click.secho(
+            f"  [{record['status']:>6}] {seconds:>8}s  {record['pdf_path']}",
+            fg=colour,
+        )
+        if record["error"]:
+            click.echo(f"           {record['error']}")
+    click.secho(
+        f"\n{summary['documents_succeeded']}/{summary['documents_total']} documents "
+        f"processed in {summary['total_seconds']:.1f}s.",
+        fg="green" if not summary["documents_failed"] else "yellow",
+        bold=True,
+    )
+    if summary["documents_failed"]:
+        sys.exit(1)
 
 
 @cli.command()
 @click.argument(
-    "json_path", type=click.Path(exists=True, dir_okay=False, resolve_path=True)
+    "corpus_dir", type=click.Path(exists=True, file_okay=False, resolve_path=True)
 )
-def review(json_path: str):
-    click.echo("--- Interactive Review Session ---")
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Only report which stages are stale; do not re-extract anything.",
+)
+@click.option(
+    "--recursive",
+    is_flag=True,
+    help="Search CORPUS_DIR recursively for JSON outputs.",
+)
+@click.option(
+    "--reference-store",
+    "reference_store_path",
+    type=click.Path(dir_okay=False, resolve_path=True),
+    help="SQLite database in which to intern the parsed bibliographies.",
+)
+@click.option(
+    "--stage-timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Cancel any pipeline stage that runs longer than this many seconds; "
+    "it stops before its next LLM request.",
+)
+def update(
+    corpus_dir: str,
+    dry_run: bool,
+    recursive: bool,
+    reference_store_path: str,
+    stage_timeout: float,
+):
+    click.secho("--- Evidence Extractor: Incremental Update ---", fg="cyan", bold=True)
+    gemini_client = GeminiClient()
+    records = run_update(
+        corpus_dir,
+        gemini_client,
+        dry_run=dry_run,
+        recursive=recursive,
+        pipeline_options={
+            "reference_store_path": reference_store_path,
+            "stage_timeout": stage_timeout,
+        },
+    )
+    colours = {"updated": "green", "up-to-date": "green", "stale": "yellow"}
+    for record in records:
+        if record["status"] == "skipped":
+            continue
+        click.secho(
+            f"  [{record['status']:>10}] {record['output_path']}",
+            fg=colours.get(record["status"], "red"),
+        )
+        if record.get("stale_stages"):
+            click.echo(f"               stale: {', '.join(record['stale_stages'])}")
+        if record.get("error"):
+            click.echo(f"               {record['error']}")
+    counts = {}
+    for record in records:
+        counts[record["status"]] = counts.get(record["status"], 0) + 1
+    click.secho(
+        "\n" + ", ".join(f"{n} {status}" for status, n in sorted(counts.items())),
+        bold=True,
+    )
+    if counts.get("failed"):
+        sys.exit(1)
+
+
+BULK_STATUSES = {
+    "verify": ValidationStatus.VERIFIED.value,
+    "reject": ValidationStatus.REJECTED.value,
+}
+STORE_SUFFIXES = (".sqlite", ".sqlite3", ".db")
+
+
+STORE_OPTION_HELP = (
+    "Read the extraction from this SQLite corpus store; SOURCE is then a document "
+    "hash or source filename instead of a JSON path."
+)
+
+
+def _load_source(source: str, store_path: str) -> ArticleExtraction:
+    if store_path:
+        with CorpusStore(store_path) as store:
+            extraction = store.get(source)
+        if extraction is None:
+            click.secho(f"No article '{source}' in store '{store_path}'.", fg="red")
+            sys.exit(1)
+        return extraction
+    if not Path(source).is_file():
+        click.secho(f"File '{source}' does not exist.", fg="red")
+        sys.exit(1)
+    extraction = load_extraction(source)
+    if extraction is None:
+        click.secho(f"Error loading or parsing JSON file '{source}'.", fg="red")
+        sys.exit(1)
+    return extraction
+
+
+@cli.command()
+@click.argument(
+    "corpus", type=click.Path(exists=True, resolve_path=True), metavar="SOURCE"
+)
+@click.option(
+    "--store",
+    "store_path",
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+    required=True,
+    help="SQLite corpus store to create or update.",
+)
+@click.option(
+    "--recursive",
+    is_flag=True,
+    help="Also ingest JSON outputs in subdirectories of SOURCE.",
+)
+def ingest(corpus: str, store_path: str, recursive: bool):
+    with CorpusStore(store_path) as store:
+        if Path(corpus).is_dir():
+            counts = store.ingest_files(collect_extraction_paths(corpus, recursive))
+        else:
+            counts = store.ingest_corpus(corpus)
+    click.secho(
+        f"{counts['stored']} stored, {counts['unchanged']} unchanged, "
+        f"{counts['skipped']} skipped.",
+        bold=True,
+    )
+
+
+def _show_item(item_id: str, item: Any):
+    kind, _, index = item_id.partition(":")
+    if kind == "pico":
+        click.echo("\n--- Reviewing PICO Elements ---")
+        click.echo(f"  Population: {item.population}")
+        click.echo(f"  Intervention: {item.intervention}")
+        click.echo(f"  Comparison: {item.comparison}")
+        click.echo(f"  Outcome: {item.outcome}")
+    elif kind == "quality":
+        click.echo(f"\n--- Reviewing Quality Score {int(index) + 1} ---")
+        click.echo(f"  Score Name: {item.score_name}")
+        click.echo(f"  Score Value: {item.score_value}")
+        click.echo(f"  Justification: {item.justification}")
+    else:
+        click.echo(f"\n--- Reviewing Claim {int(index) + 1} ---")
+        click.echo(f"  Claim Text: {item.claim_text}")
+        click.echo(f"  Provenance: Page {item.provenance.page_number}")
+    click.echo(f"  Current Status: {item.correction_metadata.status.value}")
+
+
+def _apply_review_journal(
+    journal: ReviewJournal,
+    json_path: Optional[str] = None,
+    store: Optional[CorpusStore] = None,
+):
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        extraction = ArticleExtraction(**data)
-        click.secho(f"Successfully loaded '{json_path}' for review.", fg="green")
+        applied = compact_journal(journal, json_path=json_path, store=store)
     except Exception as e:
-        click.secho(f"Error loading or parsing JSON file: {e}", fg="red")
+        click.secho(
+            f"Could not apply review decisions: {e}. They are kept in "
+            f"'{journal.path}'.",
+            fg="red",
+        )
         sys.exit(1)
-    if extraction.pico_elements:
-        pico = extraction.pico_elements
-        click.echo("\n--- Reviewing PICO Elements ---")
-        click.echo(f"  Population: {pico.population}")
-        click.echo(f"  Intervention: {pico.intervention}")
-        click.echo(f"  Comparison: {pico.comparison}")
-        click.echo(f"  Outcome: {pico.outcome}")
-        click.echo(f"  Current Status: {pico.correction_metadata.status.value}")
-        action = click.prompt(
-            "(v)erify, (r)eject, or (s)kip?", type=str, default="s"
-        ).lower()
-        if action == "v":
-            pico.correction_metadata.status = ValidationStatus.VERIFIED
-            pico.correction_metadata.last_reviewed = datetime.utcnow()
-        elif action == "r":
-            pico.correction_metadata.status = ValidationStatus.REJECTED
-            pico.correction_metadata.last_reviewed = datetime.utcnow()
-            pico.correction_metadata.reviewer_comment = click.prompt(
-                "Rejection reason (optional)", type=str, default=""
+    click.secho(f"Applied {applied} review decision(s).", fg="green")
+
+
+def _compact_review_journal(journal: ReviewJournal, source: str, store_path: str):
+    if store_path:
+        with CorpusStore(store_path) as store:
+            _apply_review_journal(journal, store=store)
+    else:
+        _apply_review_journal(journal, json_path=source)
+
+
+@cli.command()
+@click.argument("source")
+@click.option(
+    "--store",
+    "store_path",
+    type=click.Path(exists=True, dir_okay=False, resolve_path=True),
+    help=STORE_OPTION_HELP,
+)
+@click.option(
+    "--journal",
+    "journal_path",
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+    default=None,
+    help="Append-only file recording each decision as it is made. Defaults to "
+    "SOURCE (or the store) plus '.review.jsonl'.",
+)
+@click.option(
+    "--compact",
+    is_flag=True,
+    help="Apply the journalled decisions to SOURCE or the store and exit.",
+)
+def review(source: str, store_path: str, journal_path: str, compact: bool):
+    click.echo("--- Interactive Review Session ---")
+    if not store_path and not Path(source).is_file():
+        click.secho(f"File '{source}' does not exist.", fg="red")
+        sys.exit(1)
+    journal_path = journal_path or journal_path_for(store_path or source)
+    with ReviewJournal(journal_path) as journal:
+        if compact:
+            _compact_review_journal(journal, source, store_path)
+            return
+        extraction = _load_source(source, store_path)
+        click.secho(f"Successfully loaded '{source}' for review.", fg="green")
+        document = record_key(extraction)
+        decisions = journal.decisions(document)
+        apply_decisions(extraction, decisions)
+        items = review_items(extraction)
+        remaining = [
+            (item_id, item)
+            for item_id, item in items
+            if item_id not in decisions
+            or not is_current(decisions[item_id], item_hash(item))
+        ]
+        if decisions:
+            click.secho(
+                f"Resuming: {len(items) - len(remaining)} of {len(items)} items "
+                "already reviewed.",
+                fg="yellow",
             )
-    for i, score in enumerate(extraction.quality_scores):
-        click.echo(f"\n--- Reviewing Quality Score {i + 1} ---")
-        click.echo(f"  Score Name: {score.score_name}")
-        click.echo(f"  Score Value: {score.score_value}")
-        click.echo(f"  Justification: {score.justification}")
-        click.echo(f"  Current Status: {score.correction_metadata.status.value}")
-        action = click.prompt(
-            "(v)erify, (r)eject, or (s)kip?", type=str, default="s"
-        ).lower()
-        if action == "v":
-            score.correction_metadata.status = ValidationStatus.VERIFIED
-            score.correction_metadata.last_reviewed = datetime.utcnow()
-        elif action == "r":
-            score.correction_metadata.status = ValidationStatus.REJECTED
-            score.correction_metadata.last_reviewed = datetime.utcnow()
-            score.correction_metadata.reviewer_comment = click.prompt(
-                "Rejection reason (optional)", type=str, default=""
+        for item_id, item in remaining:
+            _show_item(item_id, item)
+            action = click.prompt(
+                "(v)erify, (r)eject, (s)kip, or (q)uit?", type=str, default="s"
+            ).lower()
+            if action == "q":
+                break
+            if action == "v":
+                status, comment = ValidationStatus.VERIFIED.value, None
+            elif action == "r":
+                status = ValidationStatus.REJECTED.value
+                comment = click.prompt(
+                    "Rejection reason (optional)", type=str, default=""
+                )
+            else:
+                status, comment = SKIPPED, None
+            journal.record(
+                document, item_id, status, comment, content_hash=item_hash(item)
             )
-    for i, claim in enumerate(extraction.claims):
-        click.echo(f"\n--- Reviewing Claim {i + 1} ---")
-        click.echo(f"  Claim Text: {claim.claim_text}")
-        click.echo(f"  Provenance: Page {claim.provenance.page_number}")
-        click.echo(f"  Current Status: {claim.correction_metadata.status.value}")
-        action = click.prompt(
-            "(v)erify, (r)eject, or (s)kip?", type=str, default="s"
-        ).lower()
-        if action == "v":
-            claim.correction_metadata.status = ValidationStatus.VERIFIED
-            claim.correction_metadata.last_reviewed = datetime.utcnow()
-        elif action == "r":
-            claim.correction_metadata.status = ValidationStatus.REJECTED
-            claim.correction_metadata.last_reviewed = datetime.utcnow()
-            claim.correction_metadata.reviewer_comment = click.prompt(
-                "Rejection reason (optional)", type=str, default=""
+        click.echo("\n--- Review Complete ---")
+        if journal.pending_count() and click.confirm(
+            "Do you want to save your changes?"
+        ):
+            _compact_review_journal(journal, source, store_path)
+        else:
+            click.echo(
+                f"Decisions are kept in '{journal_path}'. Run 'review --compact' "
+                "to apply them."
             )
-    click.echo("\n--- Review Complete ---")
-    if click.confirm("Do you want to save your changes to the file?"):
-        save_to_json(extraction, json_path)
+
+
+@cli.command("review-queue")
+@click.argument("source", type=click.Path(exists=True, resolve_path=True))
+@click.option(
+    "--status",
+    "statuses",
+    type=click.Choice([status.value for status in ValidationStatus]),
+    multiple=True,
+    help="Queue claims with this validation status. Defaults to unverified.",
+)
+@click.option(
+    "--uncertainty",
+    type=click.Choice([*REVIEW_LEVELS, UNKNOWN_LEVEL]),
+    multiple=True,
+    help="Only queue claims annotated with this certainty level.",
+)
+@click.option(
+    "--quality",
+    type=click.Choice([*REVIEW_LEVELS, UNKNOWN_LEVEL]),
+    multiple=True,
+    help="Only queue claims from articles with this methodological quality.",
+)
+@click.option(
+    "--missing-provenance",
+    is_flag=True,
+    help="Only queue claims that could not be located on a page.",
+)
+@click.option(
+    "--bulk",
+    type=click.Choice(list(BULK_STATUSES)),
+    default=None,
+    help="Apply this decision to every queued claim instead of prompting.",
+)
+@click.option("--comment", default=None, help="Reviewer comment for --bulk.")
+@click.option(
+    "--limit", type=click.IntRange(min=1), default=None, help="Stop after N claims."
+)
+@click.option(
+    "--count", "count_only", is_flag=True, help="Only report how many claims match."
+)
+@click.option(
+    "--journal",
+    "journal_path",
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+    default=None,
+    help="Review journal to use. Defaults to one beside the store or inside the "
+    "directory.",
+)
+def review_queue(
+    source: str,
+    statuses: tuple,
+    uncertainty: tuple,
+    quality: tuple,
+    missing_provenance: bool,
+    bulk: str,
+    comment: str,
+    limit: int,
+    count_only: bool,
+    journal_path: str,
+):
+    queue_filter = QueueFilter(
+        statuses=list(statuses) or [ValidationStatus.UNVERIFIED.value],
+        uncertainty=list(uncertainty),
+        quality=list(quality),
+        missing_provenance=missing_provenance,
+    )
+    is_store = Path(source).suffix.lower() in STORE_SUFFIXES
+    if is_store:
+        journal_path = journal_path or journal_path_for(source)
+    elif Path(source).is_dir():
+        journal_path = journal_path or str(Path(source) / QUEUE_JOURNAL_FILENAME)
     else:
-        click.echo("Changes were not saved.")
+        click.secho("SOURCE must be a directory of JSON outputs or a store.", fg="red")
+        sys.exit(1)
+    store = CorpusStore(source) if is_store else None
+    try:
+        with ReviewJournal(journal_path) as journal:
+
+            def queued_items():
+                if store is not None:
+                    items = iter_store_queue(store, queue_filter, journal)
+                else:
+                    items = iter_directory_queue(
+                        collect_extraction_paths(source), queue_filter, journal
+                    )
+                return itertools.islice(items, limit)
+
+            items = queued_items()
+            if count_only:
+                click.echo(f"{sum(1 for _ in items)} claim(s) match.")
+                return
+            if bulk:
+                status = BULK_STATUSES[bulk]
+                narrowed = uncertainty or quality or missing_provenance or limit
+                if not narrowed:
+                    matched = sum(1 for _ in items)
+                    click.confirm(
+                        f"No filter or --limit given; mark all {matched} queued "
+                        f"claim(s) as {status}?",
+                        abort=True,
+                    )
+                    items = queued_items()
+                decided = bulk_decide(items, journal, status, comment)
+                click.secho(f"Marked {decided} claim(s) as {status}.", bold=True)
+            else:
+                for item in items:
+                    click.secho(
+                        f"\n--- {item.source_filename} ({item.item_id}) ---", fg="cyan"
+                    )
+                    click.echo(f"  Claim Text: {item.claim_text}")
+                    click.echo(f"  Uncertainty: {item.uncertainty_annotation}")
+                    click.echo(f"  Provenance: Page {item.page_number}")
+                    click.echo(f"  Article Quality: {item.quality}")
+                    action = click.prompt(
+                        "(v)erify, (r)eject, (s)kip, or (q)uit?", type=str, default="s"
+                    ).lower()
+                    if action == "q":
+                        break
+                    if action == "v":
+                        status, note = ValidationStatus.VERIFIED.value, None
+                    elif action == "r":
+                        status = ValidationStatus.REJECTED.value
+                        note = click.prompt(
+                            "Rejection reason (optional)", type=str, default=""
+                        )
+                    else:
+                        status, note = SKIPPED, None
+                    journal.record(
+                        item.document,
+                        item.item_id,
+                        status,
+                        note,
+                        item.location,
+                        content_hash=text_digest(item.claim_text),
+                    )
+            if journal.pending_count() and click.confirm(
+                "Apply the journalled decisions now?", default=True
+            ):
+                _apply_review_journal(journal, store=store)
+            else:
+                click.echo(f"Decisions are kept in '{journal_path}'.")
+    finally:
+        if store is not None:
+            store.close()
+
+
+def _iter_corpus(source: str) -> Iterator[ArticleExtraction]:
+    path = Path(source)
+    if path.suffix.lower() in (".json", *MSGPACK_SUFFIXES):
+        extraction = load_extraction(source)
+        if extraction is not None:
+            yield extraction
+    elif path.is_dir():
+        for json_path in collect_extraction_paths(source):
+            extraction = load_extraction(str(json_path))
+            if extraction is not None:
+                yield extraction
+    elif path.suffix.lower() in STORE_SUFFIXES:
+        with CorpusStore(source) as store:
+            yield from store.iter_articles()
+    else:
+        yield from CorpusReader(source)
 
 
 @cli.command()
-@click.argument(
-    "json_path", type=click.Path(exists=True, dir_okay=False, resolve_path=True)
+@click.argument("source")
+@click.option(
+    "--store",
+    "store_path",
+    type=click.Path(exists=True, dir_okay=False, resolve_path=True),
+    help=STORE_OPTION_HELP,
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["excel", "parquet"]),
+    default="excel",
+    show_default=True,
+    help="'parquet' writes one typed file per record type into the --output "
+    "directory and accepts a corpus directory, JSONL corpus or store as SOURCE.",
 )
 @click.option(
     "--output",
     "output_path",
-    type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+    type=click.Path(writable=True, resolve_path=True),
     required=True,
 )
 @click.option(
@@ -228,23 +836,185 @@ def review(json_path: str):
     "prisma_diagram_path",
     type=click.Path(dir_okay=False, writable=True, resolve_path=True),
 )
+@click.option(
+    "--diagram-renderer",
+    type=click.Choice(DIAGRAM_RENDERERS),
+    default="builtin",
+    show_default=True,
+    help="'builtin' draws the PRISMA diagram in-process; 'graphviz' needs the "
+    "Graphviz 'dot' binary.",
+)
+@click.option(
+    "--diagram-format",
+    type=click.Choice(DIAGRAM_FORMATS),
+    default="png",
+    show_default=True,
+)
 def export(
-    json_path: str, output_path: str, prisma_path: str, prisma_diagram_path: str
+    source: str,
+    store_path: str,
+    output_format: str,
+    output_path: str,
+    prisma_path: str,
+    prisma_diagram_path: str,
+    diagram_renderer: str,
+    diagram_format: str,
 ):
-    logger.info(f"Loading '{json_path}' for export.")
-    try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        extraction = ArticleExtraction(**data)
-    except Exception as e:
-        logger.error(f"Failed to load or parse JSON file: {e}")
-        sys.exit(1)
+    logger.info(f"Loading '{source}' for export.")
+    if output_format == "parquet":
+        if prisma_path or prisma_diagram_path:
+            click.secho("PRISMA output is only supported for Excel exports.", fg="red")
+            sys.exit(1)
+        if store_path:
+            extractions = [_load_source(source, store_path)]
+        elif Path(source).exists():
+            extractions = _iter_corpus(source)
+        else:
+            click.secho(f"Path '{source}' does not exist.", fg="red")
+            sys.exit(1)
+        try:
+            counts = export_to_parquet(extractions, output_path)
+        except Exception as e:
+            click.secho(f"Export failed; nothing was written: {e}", fg="red")
+            sys.exit(1)
+        click.secho(
+            f"Exported {counts['articles']} articles and {counts['claims']} claims "
+            f"to '{output_path}'.",
+            fg="green",
+        )
+        return
+    extraction = _load_source(source, store_path)
     export_to_excel(extraction, output_path)
     if prisma_path:
         report_content = generate_prisma_text_report(extraction)
         save_prisma_report(report_content, prisma_path)
     if prisma_diagram_path:
-        generate_prisma_diagram(extraction, prisma_diagram_path)
+        generate_prisma_diagram(
+            extraction, prisma_diagram_path, diagram_renderer, diagram_format
+        )
+
+
+@cli.command("export-corpus")
+@click.argument("source", type=click.Path(exists=True, resolve_path=True))
+@click.option(
+    "--output",
+    "output_path",
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+    required=True,
+)
+def export_corpus(source: str, output_path: str):
+    try:
+        count = export_corpus_to_excel(_iter_corpus(source), output_path)
+    except Exception as e:
+        click.secho(f"Export failed; '{output_path}' was not written: {e}", fg="red")
+        sys.exit(1)
+    click.secho(f"Exported {count} articles to '{output_path}'.", fg="green")
+
+
+@cli.command()
+@click.argument("source", type=click.Path(exists=True, resolve_path=True))
+@click.option(
+    "--report",
+    "report_path",
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+    help="Write the corpus PRISMA text report here.",
+)
+@click.option(
+    "--diagram",
+    "diagram_path",
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+    help="Render the corpus PRISMA flow diagram here (the extension is added).",
+)
+@click.option(
+    "--diagram-renderer",
+    type=click.Choice(DIAGRAM_RENDERERS),
+    default="builtin",
+    show_default=True,
+    help="'builtin' draws the PRISMA diagram in-process; 'graphviz' needs the "
+    "Graphviz 'dot' binary.",
+)
+@click.option(
+    "--diagram-format",
+    type=click.Choice(DIAGRAM_FORMATS),
+    default="png",
+    show_default=True,
+)
+def prisma(
+    source: str,
+    report_path: str,
+    diagram_path: str,
+    diagram_renderer: str,
+    diagram_format: str,
+):
+    failed = 0
+    summary_path = Path(source) / RUN_SUMMARY_FILENAME
+    if summary_path.is_file():
+        failed = count_failed_documents(str(summary_path))
+    counts = tally_prisma(_iter_corpus(source), failed_documents=failed)
+    report_content = generate_corpus_prisma_report(counts, source)
+    if report_path:
+        save_prisma_report(report_content, report_path)
+    else:
+        click.echo(report_content)
+    if diagram_path:
+        render_prisma_diagram(counts, diagram_path, diagram_renderer, diagram_format)
+
+
+@cli.command()
+@click.argument("query")
+@click.option(
+    "--store",
+    "store_path",
+    type=click.Path(exists=True, dir_okay=False, resolve_path=True),
+    required=True,
+    help="SQLite corpus store to search.",
+)
+@click.option(
+    "--status",
+    type=click.Choice([status.value for status in ValidationStatus]),
+    default=None,
+    help="Only return items with this validation status.",
+)
+@click.option(
+    "--kind",
+    "kinds",
+    type=click.Choice(list(SEARCH_KINDS)),
+    multiple=True,
+    help="Restrict results to claims, PICO, table summaries or figure captions. "
+    "Repeat to allow several.",
+)
+@click.option(
+    "--population",
+    default=None,
+    help="Only return items from articles whose PICO population matches these terms.",
+)
+@click.option("--limit", type=click.IntRange(min=1), default=20, show_default=True)
+@click.option(
+    "--raw",
+    is_flag=True,
+    help="Pass QUERY to SQLite FTS5 unchanged (supports OR, NEAR, prefix* etc.).",
+)
+def search(
+    query: str,
+    store_path: str,
+    status: str,
+    kinds: tuple,
+    population: str,
+    limit: int,
+    raw: bool,
+):
+    with CorpusStore(store_path) as store:
+        results = store.search(query, status, list(kinds), population, limit, raw)
+    if not results:
+        click.echo("No matches found.")
+        return
+    for result in results:
+        click.secho(
+            f"{result['source_filename']} [{result['kind']} {result['position'] + 1}, "
+            f"{result['status']}]",
+            fg="cyan",
+        )
+        click.echo(f"  {result['snippet']}")
 
 
 @cli.command()
@@ -260,7 +1030,17 @@ def export(
     type=click.Path(exists=True, dir_okay=False, resolve_path=True),
     required=True,
 )
-def evaluate(pdf_path: str, gold_standard_path: str):
+@click.option(
+    "--match-threshold",
+    type=click.FloatRange(min=0, max=100),
+    default=DEFAULT_MATCH_THRESHOLD,
+    show_default=True,
+    help="Similarity an extracted claim must exceed to match a gold claim.",
+)
+@click.option("--show-matches", is_flag=True, help="List matched and unmatched claims.")
+def evaluate(
+    pdf_path: str, gold_standard_path: str, match_threshold: float, show_matches: bool
+):
     logger.info("--- Performance Evaluation Mode ---")
     try:
         with open(gold_standard_path, "r") as f:
@@ -288,7 +1068,9 @@ def evaluate(pdf_path: str, gold_standard_path: str):
             if item.get("claim_text")
         ]
     logger.info(f"Extraction pipeline generated {len(extracted_claims_text)} claims.")
-    metrics = calculate_claim_metrics(extracted_claims_text, gold_claims)
+    metrics = calculate_claim_metrics(
+        extracted_claims_text, gold_claims, threshold=match_threshold
+    )
     click.echo("\n--- Claim Extraction Performance ---")
     click.secho(f"  Precision: {metrics['precision']:.2f}", fg="yellow")
     click.secho(f"  Recall:    {metrics['recall']:.2f}", fg="yellow")
@@ -298,6 +1080,351 @@ def evaluate(pdf_path: str, gold_standard_path: str):
     click.echo(f"  False Positives: {metrics['false_positives']}")
     click.echo(f"  False Negatives: {metrics['false_negatives']}")
     click.echo("------------------------------------")
+    if show_matches:
+        _show_claim_matches(
+            metrics["matched_pairs"], extracted_claims_text, gold_claims
+        )
+
+
+def _show_claim_matches(
+    matched_pairs: List[Dict], extracted_claims: List[str], gold_claims: List[str]
+):
+    for pair in matched_pairs:
+        click.secho(f"\n  Match ({pair['score']:.1f}):", fg="green")
+        click.echo(f"    Extracted: {extracted_claims[pair['extracted_index']]}")
+        click.echo(f"    Gold:      {gold_claims[pair['gold_index']]}")
+    matched_extracted = {pair["extracted_index"] for pair in matched_pairs}
+    matched_gold = {pair["gold_index"] for pair in matched_pairs}
+    for i, claim in enumerate(extracted_claims):
+        if i not in matched_extracted:
+            click.secho(f"\n  False positive: {claim}", fg="red")
+    for i, claim in enumerate(gold_claims):
+        if i not in matched_gold:
+            click.secho(f"\n  Missed gold claim: {claim}", fg="red")
+
+
+@cli.command("evaluate-corpus")
+@click.argument(
+    "source", type=click.Path(exists=True, file_okay=False, resolve_path=True)
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, writable=True, resolve_path=True),
+    default=None,
+    help="Keep extractions here and reuse them while their stages are current.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=default_worker_count,
+    show_default="min(4, CPU count)",
+    help="Number of worker processes.",
+)
+@click.option(
+    "--llm-concurrency",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of Gemini requests in flight across all workers.",
+)
+@click.option(
+    "--recursive", is_flag=True, help="Search SOURCE directory recursively for PDFs."
+)
+@click.option(
+    "--match-threshold",
+    type=click.FloatRange(min=0, max=100),
+    default=DEFAULT_MATCH_THRESHOLD,
+    show_default=True,
+    help="Similarity an extracted claim must exceed to match a gold claim.",
+)
+@click.option(
+    "--field-threshold",
+    type=click.FloatRange(min=0, max=100),
+    default=DEFAULT_FIELD_THRESHOLD,
+    show_default=True,
+    help="Similarity required for PICO fields, quality items and references.",
+)
+@click.option(
+    "--input-price",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_INPUT_PRICE,
+    show_default=True,
+    help="LLM price in USD per million input tokens.",
+)
+@click.option(
+    "--output-price",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_OUTPUT_PRICE,
+    show_default=True,
+    help="LLM price in USD per million output tokens.",
+)
+@click.option(
+    "--report",
+    "report_path",
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+    default=None,
+    help="Write the full evaluation report as JSON. Defaults to "
+    f"CACHE_DIR/{EVALUATION_REPORT_FILENAME} when --cache-dir is given.",
+)
+def evaluate_corpus(
+    source: str,
+    cache_dir: str,
+    workers: int,
+    llm_concurrency: int,
+    recursive: bool,
+    match_threshold: float,
+    field_threshold: float,
+    input_price: float,
+    output_price: float,
+    report_path: str,
+):
+    pairs = collect_gold_pairs(source, recursive=recursive)
+    if not pairs:
+        click.secho(f"No PDF and gold standard pairs found in '{source}'.", fg="red")
+        sys.exit(1)
+    summary = run_evaluation(
+        pairs,
+        cache_dir=cache_dir,
+        workers=workers,
+        llm_concurrency=llm_concurrency,
+        root=Path(source),
+        claim_threshold=match_threshold,
+        field_threshold=field_threshold,
+        input_price=input_price,
+        output_price=output_price,
+    )
+    click.echo("\n--- Component Performance ---")
+    click.echo(f"  {'component':<16}{'precision':>10}{'recall':>10}{'f1':>10}")
+    for component, scores in summary["components"].items():
+        click.echo(
+            f"  {component:<16}{scores['precision']:>10.2f}{scores['recall']:>10.2f}"
+            f"{scores['f1_score']:>10.2f}"
+        )
+    click.echo("\n--- Stage Latency (seconds) ---")
+    click.echo(f"  {'stage':<16}{'runs':>6}{'mean':>10}{'p50':>10}{'p95':>10}")
+    for name, latency in summary["stage_latency"].items():
+        click.echo(
+            f"  {name:<16}{latency['runs']:>6}{latency['mean']:>10.2f}"
+            f"{latency['p50']:>10.2f}{latency['p95']:>10.2f}"
+        )
+    usage = summary["llm_usage"]
+    click.echo(
+        f"\n  LLM: {usage['requests']} request(s), {usage['input_tokens']} input and "
+        f"{usage['output_tokens']} output tokens, ${summary['llm_cost']:.4f}"
+    )
+    click.secho(
+        f"\n{summary['documents_succeeded']}/{summary['documents_total']} documents "
+        f"scored ({summary['documents_cached']} from cache) in "
+        f"{summary['total_seconds']:.1f}s.",
+        bold=True,
+    )
+    report_path = report_path or (
+        str(Path(cache_dir) / EVALUATION_REPORT_FILENAME) if cache_dir else None
+    )
+    if report_path:
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        click.echo(f"Report written to '{report_path}'.")
+
+
+@cli.command()
+@click.argument(
+    "watch_dir", type=click.Path(exists=True, file_okay=False, resolve_path=True)
+)
+@click.option(
+    "--output-dir",
+    "output_dir",
+    type=click.Path(file_okay=False, writable=True, resolve_path=True),
+    required=True,
+    help="Directory in which to write one JSON file per document.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=default_worker_count,
+    show_default="min(4, CPU count)",
+    help="Number of worker processes.",
+)
+@click.option(
+    "--llm-concurrency",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of Gemini requests in flight across all workers.",
+)
+@click.option(
+    "--settle-seconds",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_SETTLE_SECONDS,
+    show_default=True,
+    help="How long a file's size and modification time must stay unchanged "
+    "before it is processed.",
+)
+@click.option(
+    "--poll-seconds",
+    type=click.FloatRange(min=0.1),
+    default=DEFAULT_POLL_SECONDS,
+    show_default=True,
+    help="How often to scan the watched directory.",
+)
+@click.option(
+    "--recursive",
+    is_flag=True,
+    help="Watch subdirectories of WATCH_DIR as well.",
+)
+@click.option(
+    "--reference-store",
+    "reference_store_path",
+    type=click.Path(dir_okay=False, resolve_path=True),
+    help="SQLite database in which to intern the parsed bibliographies.",
+)
+@click.option(
+    "--stage-timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Cancel any pipeline stage that runs longer than this many seconds; "
+    "it stops before its next LLM request.",
+)
+def watch(
+    watch_dir: str,
+    output_dir: str,
+    workers: int,
+    llm_concurrency: int,
+    settle_seconds: float,
+    poll_seconds: float,
+    recursive: bool,
+    reference_store_path: str,
+    stage_timeout: float,
+):
+    click.secho("--- Evidence Extractor: Watch Mode ---", fg="cyan", bold=True)
+    watcher = FolderWatcher(
+        watch_dir,
+        output_dir,
+        workers=workers,
+        llm_concurrency=llm_concurrency,
+        pipeline_options={
+            "reference_store_path": reference_store_path,
+            "stage_timeout": stage_timeout,
+        },
+        settle_seconds=settle_seconds,
+        poll_seconds=poll_seconds,
+        recursive=recursive,
+    )
+    click.echo(f"Watching '{watch_dir}' (Ctrl+C to stop).")
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        click.echo("Stopping watcher.")
+
+
+@cli.command()
+@click.option("--host", default="127.0.0.1", show_default=True, help="Bind address.")
+@click.option("--port", type=int, default=8765, show_default=True, help="Bind port.")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=2,
+    show_default=True,
+    help="Number of documents extracted concurrently.",
+)
+@click.option(
+    "--llm-concurrency",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of Gemini requests in flight across all jobs.",
+)
+@click.option(
+    "--upload-dir",
+    type=click.Path(file_okay=False, writable=True, resolve_path=True),
+    default=None,
+    help="Accept raw PDF uploads and store them in this directory.",
+)
+@click.option(
+    "--input-root",
+    type=click.Path(exists=True, file_okay=False, resolve_path=True),
+    default=None,
+    help="Accept 'pdf_path' submissions, resolved relative to and confined to "
+    "this directory.",
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False, writable=True, resolve_path=True),
+    default=None,
+    help="Also write each job's result to OUTPUT_DIR/<job_id>.json.",
+)
+@click.option(
+    "--reference-store",
+    "reference_store_path",
+    type=click.Path(dir_okay=False, resolve_path=True),
+    help="SQLite database in which to intern the parsed bibliographies.",
+)
+@click.option(
+    "--stage-timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Cancel any pipeline stage that runs longer than this many seconds; "
+    "it stops before its next LLM request.",
+)
+def serve(
+    host: str,
+    port: int,
+    workers: int,
+    llm_concurrency: int,
+    upload_dir: str,
+    input_root: str,
+    output_dir: str,
+    reference_store_path: str,
+    stage_timeout: float,
+):
+    click.secho("--- Evidence Extractor: Service Mode ---", fg="cyan", bold=True)
+    if not upload_dir and not input_root:
+        click.secho(
+            "Pass --upload-dir and/or --input-root; otherwise no job can be submitted.",
+            fg="red",
+        )
+        sys.exit(1)
+    semaphore = threading.BoundedSemaphore(llm_concurrency) if llm_concurrency else None
+    gemini_client = GeminiClient(request_semaphore=semaphore)
+    if not gemini_client.is_configured():
+        click.secho(
+            "Warning: Gemini client not configured; LLM stages will be skipped.",
+            fg="yellow",
+        )
+    job_queue = JobQueue(
+        gemini_client,
+        workers=workers,
+        pipeline_options={
+            "reference_store_path": reference_store_path,
+            "stage_timeout": stage_timeout,
+        },
+        output_dir=output_dir,
+    )
+    click.echo(f"Listening on http://{host}:{port} (Ctrl+C to stop).")
+    serve_forever(
+        job_queue,
+        host=host,
+        port=port,
+        upload_dir=upload_dir,
+        input_root=input_root,
+    )
+
+
+@cli.command("cited-by")
+@click.argument("identifier")
+@click.option(
+    "--reference-store",
+    "reference_store_path",
+    type=click.Path(exists=True, dir_okay=False, resolve_path=True),
+    required=True,
+    help="SQLite reference store populated by 'extract --reference-store'.",
+)
+def cited_by(identifier: str, reference_store_path: str):
+    with ReferenceStore(reference_store_path) as store:
+        articles = store.articles_citing(identifier)
+    if not articles:
+        click.echo(f"No articles in the store cite '{identifier}'.")
+        return
+    click.secho(f"{len(articles)} article(s) cite '{identifier}':", fg="green")
+    for article in articles:
+        click.echo(f"  {article}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,269 @@
+import json
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from evidence_extractor.integration.gemini_client import GeminiClient
+from evidence_extractor.output.json_builder import save_to_json_atomic
+from evidence_extractor.output.serialization import load_extraction
+from evidence_extractor.pipeline.batch import (
+    collect_pdf_paths,
+    completed_cleanly,
+    make_request_semaphore,
+    output_path_for,
+)
+from evidence_extractor.pipeline.runner import run_pipeline
+from evidence_extractor.pipeline.update import plan_update, unrunnable_stages
+
+from .metrics import (
+    DEFAULT_FIELD_THRESHOLD,
+    DEFAULT_MATCH_THRESHOLD,
+    precision_recall_f1,
+    score_extraction,
+)
+
+logger = logging.getLogger(__name__)
+
+GOLD_SUFFIXES = (".gold.json", ".json")
+EVALUATION_REPORT_FILENAME = "evaluation_report.json"
+
+# USD per million tokens; override with the prices of the model you evaluate.
+DEFAULT_INPUT_PRICE = 0.30
+DEFAULT_OUTPUT_PRICE = 2.50
+
+_WORKER_CLIENT: Optional[GeminiClient] = None
+
+
+def collect_gold_pairs(source: str, recursive: bool = False) -> List[Tuple[Path, Path]]:
+    pairs = []
+    for pdf_path in collect_pdf_paths(source, recursive):
+        for suffix in GOLD_SUFFIXES:
+            gold_path = pdf_path.parent / f"{pdf_path.stem}{suffix}"
+            if gold_path.is_file():
+                pairs.append((pdf_path, gold_path))
+                break
+        else:
+            logger.warning(f"No gold standard found for '{pdf_path}'; skipping it.")
+    return pairs
+
+
+def _init_worker(request_semaphore: Optional[Any] = None):
+    global _WORKER_CLIENT
+    _WORKER_CLIENT = GeminiClient(request_semaphore=request_semaphore)
+    if not _WORKER_CLIENT.is_configured():
+        logger.warning("Gemini client not configured in evaluation worker.")
+
+
+def llm_cost(
+    usage: Dict[str, int],
+    input_price: float = DEFAULT_INPUT_PRICE,
+    output_price: float = DEFAULT_OUTPUT_PRICE,
+) -> float:
+    return (
+        usage.get("input_tokens", 0) * input_price
+        + usage.get("output_tokens", 0) * output_price
+    ) / 1_000_000
+
+
+def evaluate_document(
+    pdf_path: str,
+    gold_path: str,
+    cache_path: Optional[str] = None,
+    options: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    if _WORKER_CLIENT is None:
+        _init_worker()
+    options = options or {}
+    record: Dict[str, Any] = {
+        "pdf_path": pdf_path,
+        "gold_path": gold_path,
+        "status": "failed",
+        "error": None,
+        "cached": False,
+        "stages": {},
+        "reused_stages": [],
+        "llm_usage": {},
+    }
+    start = time.perf_counter()
+    try:
+        with open(gold_path, "r", encoding="utf-8") as f:
+            gold = json.load(f)
+        cached = load_extraction(cache_path) if cache_path else None
+        usage_before = _WORKER_CLIENT.usage_snapshot()
+        stale = (
+            plan_update(cached, pdf_path, _WORKER_CLIENT) if cached is not None else []
+        )
+        blocked = unrunnable_stages(stale, _WORKER_CLIENT)
+        if blocked:
+            logger.warning(
+                f"Gemini client is not configured; scoring the cached output for "
+                f"'{pdf_path}' without recomputing {', '.join(blocked)}."
+            )
+        if cached is not None and (not stale or blocked):
+            extraction = cached
+            record["cached"] = True
+        else:
+            outcome = run_pipeline(
+                pdf_path,
+                _WORKER_CLIENT,
+                previous=cached,
+                **options.get("pipeline_options", {}),
+            )
+            if outcome is None:
+                record["error"] = "Document could not be ingested or contained no text."
+                return record
+            extraction, report = outcome
+            if cache_path and completed_cleanly(report):
+                save_to_json_atomic(extraction, cache_path, indent=None)
+            record["stages"] = {
+                name: seconds
+                for name, seconds in report.stage_seconds().items()
+                if not report.stages[name].reused
+            }
+            record["reused_stages"] = [
+                name for name, result in report.stages.items() if result.reused
+            ]
+        usage_after = _WORKER_CLIENT.usage_snapshot()
+        record["llm_usage"] = {
+            name: usage_after[name] - usage_before.get(name, 0) for name in usage_after
+        }
+        record["scores"] = score_extraction(
+            extraction,
+            gold,
+            options.get("claim_threshold", DEFAULT_MATCH_THRESHOLD),
+            options.get("field_threshold", DEFAULT_FIELD_THRESHOLD),
+        )
+        record["status"] = "ok"
+    except Exception as e:
+        logger.error(f"Evaluation failed for '{pdf_path}': {e}")
+        record["error"] = str(e)
+    finally:
+        record["seconds"] = round(time.perf_counter() - start, 3)
+    return record
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarise_evaluation(
+    records: List[Dict[str, Any]],
+    input_price: float = DEFAULT_INPUT_PRICE,
+    output_price: float = DEFAULT_OUTPUT_PRICE,
+) -> Dict[str, Any]:
+    totals: Dict[str, List[int]] = {}
+    stage_seconds: Dict[str, List[float]] = {}
+    usage = {"requests": 0, "input_tokens": 0, "output_tokens": 0}
+    for record in records:
+        for component, scores in record.get("scores", {}).items():
+            counts = totals.setdefault(component, [0, 0, 0])
+            counts[0] += scores["true_positives"]
+            counts[1] += scores["false_positives"]
+            counts[2] += scores["false_negatives"]
+        for name, seconds in record.get("stages", {}).items():
+            stage_seconds.setdefault(name, []).append(seconds)
+        for name in usage:
+            usage[name] += record.get("llm_usage", {}).get(name, 0)
+        record["llm_cost"] = round(
+            llm_cost(record.get("llm_usage", {}), input_price, output_price), 6
+        )
+    document_seconds = [r["seconds"] for r in records if r["status"] == "ok"]
+    return {
+        "documents_total": len(records),
+        "documents_succeeded": len(document_seconds),
+        "documents_cached": sum(1 for r in records if r.get("cached")),
+        "components": {
+            component: precision_recall_f1(*counts)
+            for component, counts in sorted(totals.items())
+        },
+        "stage_latency": {
+            name: {
+                "runs": len(values),
+                "mean": round(sum(values) / len(values), 3),
+                "p50": _percentile(values, 0.5),
+                "p95": _percentile(values, 0.95),
+            }
+            for name, values in stage_seconds.items()
+        },
+        "document_seconds": {
+            "mean": round(sum(document_seconds) / len(document_seconds), 3)
+            if document_seconds
+            else 0.0,
+            "p95": _percentile(document_seconds, 0.95) if document_seconds else 0.0,
+        },
+        "llm_usage": usage,
+        "llm_cost": round(llm_cost(usage, input_price, output_price), 6),
+        "documents": records,
+    }
+
+
+def run_evaluation(
+    pairs: List[Tuple[Path, Path]],
+    cache_dir: Optional[str] = None,
+    workers: int = 1,
+    llm_concurrency: Optional[int] = None,
+    root: Optional[Path] = None,
+    claim_threshold: float = DEFAULT_MATCH_THRESHOLD,
+    field_threshold: float = DEFAULT_FIELD_THRESHOLD,
+    input_price: float = DEFAULT_INPUT_PRICE,
+    output_price: float = DEFAULT_OUTPUT_PRICE,
+    pipeline_options: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    cache_root = Path(cache_dir) if cache_dir else None
+    if cache_root is not None:
+        cache_root.mkdir(parents=True, exist_ok=True)
+    options = {
+        "claim_threshold": claim_threshold,
+        "field_threshold": field_threshold,
+        "pipeline_options": pipeline_options or {},
+    }
+    jobs = [
+        (
+            str(pdf_path),
+            str(gold_path),
+            str(output_path_for(pdf_path, root, cache_root)) if cache_root else None,
+        )
+        for pdf_path, gold_path in pairs
+    ]
+    logger.info(f"Evaluating {len(jobs)} document(s) with {workers} worker(s).")
+    start = time.perf_counter()
+    semaphore = make_request_semaphore(llm_concurrency)
+    records: List[Dict[str, Any]] = []
+    if workers <= 1:
+        _init_worker(semaphore)
+        for pdf_path, gold_path, cache_path in jobs:
+            records.append(evaluate_document(pdf_path, gold_path, cache_path, options))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(semaphore,)
+        ) as pool:
+            futures = {
+                pool.submit(evaluate_document, *job, options): job for job in jobs
+            }
+            for future in as_completed(futures):
+                try:
+                    records.append(future.result())
+                except Exception as e:
+                    logger.error(f"Worker crashed while evaluating document: {e}")
+                    records.append(
+                        {
+                            "pdf_path": futures[future][0],
+                            "gold_path": futures[future][1],
+                            "status": "failed",
+                            "error": str(e),
+                            "seconds": None,
+                        }
+                    )
+    order = {job[0]: i for i, job in enumerate(jobs)}
+    records.sort(key=lambda record: order.get(record["pdf_path"], len(order)))
+    summary = summarise_evaluation(records, input_price, output_price)
+    summary["total_seconds"] = round(time.perf_counter() - start, 3)
+    summary["workers"] = workers
+    logger.info(
+        f"Evaluation complete: {summary['documents_succeeded']}/"
+        f"{summary['documents_total']} document(s) scored."
+    )
+    return summary
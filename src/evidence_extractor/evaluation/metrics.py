@@ -1,43 +1,137 @@
 import logging
-from typing import Dict, List
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
 
-from thefuzz import fuzz
+import numpy as np
+from pydantic import BaseModel
+from rapidfuzz import fuzz, process
+
+from evidence_extractor.models.schemas import (
+    PICO,
+    ArticleExtraction,
+    BibliographyItem,
+    Claim,
+    ExtractedTable,
+    QualityScore,
+)
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MATCH_THRESHOLD = 95.0
+DEFAULT_FIELD_THRESHOLD = 80.0
+PICO_FIELDS = ("population", "intervention", "comparison", "outcome")
 
-def calculate_claim_metrics(
-    extracted_claims: List[str], gold_standard_claims: List[str]
-) -> Dict[str, float]:
-    true_positives = 0
-    false_positives = 0
 
-    if not gold_standard_claims:
-        return {
-            "precision": 0.0,
-            "recall": 0.0,
-            "f1_score": 0.0,
-            "true_positives": 0,
-            "false_positives": len(extracted_claims),
-            "false_negatives": 0,
-        }
-    matched_gold_indices = set()
+class ClaimMatch(BaseModel):
+    extracted_index: int
+    gold_index: int
+    score: float
+
+
+def similarity_matrix(
+    extracted_claims: List[str],
+    gold_standard_claims: List[str],
+    score_cutoff: float = 0.0,
+    workers: int = -1,
+) -> np.ndarray:
+    return process.cdist(
+        [claim.lower() for claim in extracted_claims],
+        [claim.lower() for claim in gold_standard_claims],
+        scorer=fuzz.partial_ratio,
+        score_cutoff=score_cutoff,
+        dtype=np.float32,
+        workers=workers,
+    )
 
-    for extracted in extracted_claims:
-        is_match_found = False
-        for i, gold in enumerate(gold_standard_claims):
-            if fuzz.partial_ratio(extracted.lower(), gold.lower()) > 95:
-                if i not in matched_gold_indices:
-                    true_positives += 1
-                    matched_gold_indices.add(i)
-                    is_match_found = True
-                    break
 
-        if not is_match_found:
-            false_positives += 1
+def _minimum_cost_assignment(cost: np.ndarray) -> List[int]:
+    # Shortest augmenting path (Hungarian) for rows <= columns; returns the
+    # column assigned to each row. The inner loop over columns is vectorised.
+    n, m = cost.shape
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    owner = np.zeros(m + 1, dtype=np.int64)
+    way = np.zeros(m + 1, dtype=np.int64)
+    for row in range(1, n + 1):
+        owner[0] = row
+        column = 0
+        min_slack = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[column] = True
+            current = owner[column]
+            free = ~used[1:]
+            slack = cost[current - 1] - u[current] - v[1:]
+            better = free & (slack < min_slack[1:])
+            min_slack[1:][better] = slack[better]
+            way[1:][better] = column
+            candidates = np.where(free, min_slack[1:], np.inf)
+            next_column = int(np.argmin(candidates)) + 1
+            delta = candidates[next_column - 1]
+            u[owner[used]] += delta
+            v[used] -= delta
+            min_slack[1:][free] -= delta
+            column = next_column
+            if owner[column] == 0:
+                break
+        while column:
+            previous = way[column]
+            owner[column] = owner[previous]
+            column = previous
+    assignment = [0] * n
+    for column in range(1, m + 1):
+        if owner[column]:
+            assignment[owner[column] - 1] = column - 1
+    return assignment
 
-    false_negatives = len(gold_standard_claims) - len(matched_gold_indices)
 
+def optimal_assignment(weights: np.ndarray) -> List[Tuple[int, int]]:
+    if weights.size == 0:
+        return []
+    transposed = weights.shape[0] > weights.shape[1]
+    cost = -(weights.T if transposed else weights).astype(np.float64)
+    pairs = list(enumerate(_minimum_cost_assignment(cost)))
+    if transposed:
+        pairs = [(j, i) for i, j in pairs]
+    return sorted(pairs)
+
+
+def match_claims(
+    extracted_claims: List[str],
+    gold_standard_claims: List[str],
+    threshold: float = DEFAULT_MATCH_THRESHOLD,
+    workers: int = -1,
+) -> List[ClaimMatch]:
+    if not extracted_claims or not gold_standard_claims:
+        return []
+    scores = similarity_matrix(
+        extracted_claims, gold_standard_claims, threshold, workers
+    )
+    candidates = scores > threshold
+    rows = np.flatnonzero(candidates.any(axis=1))
+    columns = np.flatnonzero(candidates.any(axis=0))
+    if not rows.size:
+        return []
+    candidate_scores = scores[np.ix_(rows, columns)]
+    is_candidate = candidates[np.ix_(rows, columns)]
+    # Every candidate pair outweighs any total of similarity scores, so the
+    # assignment maximises the number of matches first and similarity second.
+    bonus = 100.0 * min(rows.size, columns.size) + 1.0
+    weights = np.where(is_candidate, candidate_scores + bonus, 0.0)
+    return [
+        ClaimMatch(
+            extracted_index=int(rows[i]),
+            gold_index=int(columns[j]),
+            score=float(candidate_scores[i, j]),
+        )
+        for i, j in optimal_assignment(weights)
+        if is_candidate[i, j]
+    ]
+
+
+def precision_recall_f1(
+    true_positives: int, false_positives: int, false_negatives: int
+) -> Dict[str, Any]:
     precision = (
         true_positives / (true_positives + false_positives)
         if (true_positives + false_positives) > 0
@@ -53,12 +147,6 @@ def calculate_claim_metrics(
         if (precision + recall) > 0
         else 0.0
     )
-
-    logger.info(
-        f"Evaluation complete: TP={true_positives}, FP={false_positives}, "
-        f"FN={false_negatives}"
-    )
-
     return {
         "precision": precision,
         "recall": recall,
@@ -67,3 +155,167 @@ def calculate_claim_metrics(
         "false_positives": false_positives,
         "false_negatives": false_negatives,
     }
+
+
+def calculate_claim_metrics(
+    extracted_claims: List[str],
+    gold_standard_claims: List[str],
+    threshold: float = DEFAULT_MATCH_THRESHOLD,
+    workers: int = -1,
+) -> Dict[str, Any]:
+    if not gold_standard_claims:
+        return {
+            **precision_recall_f1(0, len(extracted_claims), 0),
+            "matched_pairs": [],
+        }
+    matches = match_claims(extracted_claims, gold_standard_claims, threshold, workers)
+
+    true_positives = len(matches)
+    false_positives = len(extracted_claims) - true_positives
+    false_negatives = len(gold_standard_claims) - true_positives
+
+    logger.info(
+        f"Evaluation complete: TP={true_positives}, FP={false_positives}, "
+        f"FN={false_negatives}"
+    )
+
+    return {
+        **precision_recall_f1(true_positives, false_positives, false_negatives),
+        "matched_pairs": [match.model_dump() for match in matches],
+    }
+
+
+def calculate_pico_metrics(
+    extracted: Optional[PICO],
+    gold: Dict[str, Any],
+    threshold: float = DEFAULT_FIELD_THRESHOLD,
+) -> Dict[str, Any]:
+    true_positives = false_positives = false_negatives = 0
+    for field in PICO_FIELDS:
+        expected = (gold.get(field) or "").strip().lower()
+        found = (getattr(extracted, field, None) or "").strip().lower()
+        if expected and found and fuzz.token_set_ratio(expected, found) > threshold:
+            true_positives += 1
+            continue
+        false_negatives += bool(expected)
+        false_positives += bool(found)
+    return precision_recall_f1(true_positives, false_positives, false_negatives)
+
+
+def _rating(value: str) -> str:
+    words = value.strip().lower().split()
+    return words[0].strip(":,.-") if words else ""
+
+
+def calculate_quality_metrics(
+    extracted: List[QualityScore],
+    gold: List[Dict[str, Any]],
+    threshold: float = DEFAULT_FIELD_THRESHOLD,
+) -> Dict[str, Any]:
+    matches = match_claims(
+        [score.score_name for score in extracted],
+        [item.get("score_name", "") for item in gold],
+        threshold,
+    )
+    agreed = sum(
+        1
+        for match in matches
+        if _rating(extracted[match.extracted_index].score_value)
+        == _rating(str(gold[match.gold_index].get("score_value", "")))
+    )
+    return precision_recall_f1(agreed, len(extracted) - agreed, len(gold) - agreed)
+
+
+def _gold_page(item: Dict[str, Any]) -> Optional[int]:
+    if item.get("page_number") is not None:
+        return item["page_number"]
+    return (item.get("provenance") or {}).get("page_number")
+
+
+def calculate_table_metrics(
+    extracted: List[ExtractedTable], gold: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    found = Counter(table.provenance.page_number for table in extracted)
+    expected = Counter(_gold_page(item) for item in gold)
+    true_positives = sum((found & expected).values())
+    return precision_recall_f1(
+        true_positives, len(extracted) - true_positives, len(gold) - true_positives
+    )
+
+
+def _gold_references(gold: Any) -> List[str]:
+    entries = gold.values() if isinstance(gold, dict) else gold
+    return [
+        entry if isinstance(entry, str) else entry.get("full_citation", "")
+        for entry in entries
+    ]
+
+
+def calculate_reference_metrics(
+    extracted: Dict[str, BibliographyItem],
+    gold: Any,
+    threshold: float = DEFAULT_FIELD_THRESHOLD,
+) -> Dict[str, Any]:
+    references = _gold_references(gold)
+    matches = match_claims(
+        [item.full_citation for item in extracted.values()], references, threshold
+    )
+    return precision_recall_f1(
+        len(matches), len(extracted) - len(matches), len(references) - len(matches)
+    )
+
+
+def calculate_citation_link_metrics(
+    extracted: List[Claim],
+    gold: List[Dict[str, Any]],
+    matched_pairs: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    true_positives = false_positives = false_negatives = 0
+    for pair in matched_pairs:
+        expected_keys = gold[pair["gold_index"]].get("linked_citations")
+        if expected_keys is None:
+            continue
+        expected = {key.lower() for key in expected_keys}
+        found = {
+            key.lower() for key in extracted[pair["extracted_index"]].linked_citations
+        }
+        true_positives += len(found & expected)
+        false_positives += len(found - expected)
+        false_negatives += len(expected - found)
+    return precision_recall_f1(true_positives, false_positives, false_negatives)
+
+
+def score_extraction(
+    extraction: ArticleExtraction,
+    gold: Dict[str, Any],
+    claim_threshold: float = DEFAULT_MATCH_THRESHOLD,
+    field_threshold: float = DEFAULT_FIELD_THRESHOLD,
+) -> Dict[str, Dict[str, Any]]:
+    scores: Dict[str, Dict[str, Any]] = {}
+    if "claims" in gold:
+        gold_claims = [item for item in gold["claims"] if item.get("claim_text")]
+        claims = calculate_claim_metrics(
+            [claim.claim_text for claim in extraction.claims],
+            [item["claim_text"] for item in gold_claims],
+            claim_threshold,
+        )
+        scores["claims"] = claims
+        if any("linked_citations" in item for item in gold_claims):
+            scores["citation_links"] = calculate_citation_link_metrics(
+                extraction.claims, gold_claims, claims["matched_pairs"]
+            )
+    if "pico_elements" in gold:
+        scores["pico"] = calculate_pico_metrics(
+            extraction.pico_elements, gold["pico_elements"] or {}, field_threshold
+        )
+    if "quality_scores" in gold:
+        scores["quality_scores"] = calculate_quality_metrics(
+            extraction.quality_scores, gold["quality_scores"], field_threshold
+        )
+    if "tables" in gold:
+        scores["tables"] = calculate_table_metrics(extraction.tables, gold["tables"])
+    if "bibliography" in gold:
+        scores["references"] = calculate_reference_metrics(
+            extraction.bibliography, gold["bibliography"], field_threshold
+        )
+    return scores
@@ -1,20 +1,28 @@
 from .citations import (
+    CitationIndex,
+    build_citation_index,
     find_references_section,
+    link_claims_to_citations,
     link_in_text_citations,
     parse_bibliography,
 )
 from .figures import extract_figures_and_captions
 from .llm_orchestrator import orchestrate_llm_extraction
+from .sections import detect_sections
 from .summarization import generate_summary
 from .tables import extract_tables_with_llm
 from .uncertainty import annotate_claims_in_batch
 
 __all__ = [
+    "CitationIndex",
+    "build_citation_index",
     "find_references_section",
+    "link_claims_to_citations",
     "link_in_text_citations",
     "parse_bibliography",
     "extract_figures_and_captions",
     "orchestrate_llm_extraction",
+    "detect_sections",
     "generate_summary",
     "extract_tables_with_llm",
     "annotate_claims_in_batch",
@@ -1,11 +1,84 @@
+import bisect
 import logging
 import re
 from typing import Dict, List, Optional, Set, Tuple
 
-from evidence_extractor.models.schemas import BibliographyItem
+from evidence_extractor.models.schemas import BibliographyItem, Claim
+
+from .references import parse_references, split_reference_entries
 
 logger = logging.getLogger(__name__)
 
+MAX_CITATION_RANGE = 100
+
+SENTENCE_BOUNDARY_PATTERN = re.compile(
+    r"(?<=[.!?])(?<!\bal\.)(?<!\bFig\.)\s+(?=[A-Z0-9(\[])"
+)
+NUMERIC_CITATION_PATTERN = re.compile(
+    r"\[(\d{1,4}(?:\s*[-\u2013\u2014]\s*\d{1,4})?"
+    r"(?:\s*[,;]\s*\d{1,4}(?:\s*[-\u2013\u2014]\s*\d{1,4})?)*)\]"
+)
+AUTHOR_YEAR_CITATION_PATTERN = re.compile(
+    r"([A-Z][A-Za-z\u00C0-\u017F'\-]+)"
+    r"(?:\s+et\s+al\.?|\s+(?:and|&)\s+[A-Z][A-Za-z\u00C0-\u017F'\-]+)?"
+    r",?\s*[\(\[]?((?:19|20)\d{2})[a-z]?"
+)
+REFERENCE_NUMBER_PATTERN = re.compile(r"^\s*\[?(\d{1,4})[\].)]\s")
+REFERENCE_AUTHOR_YEAR_PATTERN = re.compile(
+    r"^\s*(?:\[?\d{1,4}[\].)]\s*)?([^\W\d_][\w'\-]*)[^\n]*?\b((?:19|20)\d{2})"
+)
+
+
+class CitationIndex:
+    def __init__(
+        self,
+        text: str,
+        sentence_starts: List[int],
+        sentence_keys: List[List[str]],
+    ):
+        self.text = text
+        self.sentence_starts = sentence_starts
+        self.sentence_keys = sentence_keys
+        self._lowered_text = text.lower()
+
+    def __len__(self) -> int:
+        return len(self.sentence_starts)
+
+    def sentence_span(self, sentence_idx: int) -> Tuple[int, int]:
+        start = self.sentence_starts[sentence_idx]
+        if sentence_idx + 1 < len(self.sentence_starts):
+            return start, self.sentence_starts[sentence_idx + 1]
+        return start, len(self.text)
+
+    def keys_for_span(self, start: int, end: int) -> List[str]:
+        if not self.sentence_starts or end <= start:
+            return []
+        first = max(bisect.bisect_right(self.sentence_starts, start) - 1, 0)
+        last = max(bisect.bisect_left(self.sentence_starts, end) - 1, first)
+        keys: List[str] = []
+        for sentence_idx in range(first, last + 1):
+            for key in self.sentence_keys[sentence_idx]:
+                if key not in keys:
+                    keys.append(key)
+        return keys
+
+    def locate(self, snippet: str) -> Optional[Tuple[int, int]]:
+        needle = re.sub(r"\s+", " ", snippet).strip().lower()
+        if not needle:
+            return None
+        start = self._lowered_text.find(needle)
+        if start == -1 and len(needle) > 60:
+            start = self._lowered_text.find(needle[:60])
+        if start == -1:
+            return None
+        return start, min(start + len(needle), len(self.text))
+
+    def keys_for_text(self, snippet: str) -> List[str]:
+        span = self.locate(snippet)
+        if span is None:
+            return []
+        return self.keys_for_span(*span)
+
 
 def find_references_section(full_text: str) -> Optional[Tuple[str, int]]:
     reference_headers = [
@@ -25,23 +98,8 @@ def find_references_section(full_text: str) -> Optional[Tuple[str, int]]:
 
 
 def parse_bibliography(references_text: str) -> Dict[str, BibliographyItem]:
-    bibliography = {}
-    potential_citations = re.split(r"\n\s*\n*", references_text)
-    ref_count = 0
-    for i, entry in enumerate(potential_citations):
-        if len(entry.strip()) > 20:
-            ref_count += 1
-            author_year_match = re.search(r"([A-Za-z,.\s&]+?)\s*\(?(\d{4})\)?", entry)
-            if author_year_match:
-                author = author_year_match.group(1).split(",")[0].strip()
-                year = author_year_match.group(2)
-                key = f"{author.replace(' ', '')}{year}"
-            else:
-                key = f"ref_{ref_count}"
-            bibliography[key] = BibliographyItem(
-                citation_key=key, full_citation=entry.strip()
-            )
-    return bibliography
+    entries = split_reference_entries(references_text)
+    return {item.citation_key: item for item in parse_references(entries)}
 
 
 def link_in_text_citations(
@@ -68,3 +126,89 @@ def link_in_text_citations(
         "in-text citations."
     )
     return final_links
+
+
+def _expand_numeric_citation(body: str) -> List[int]:
+    numbers: List[int] = []
+    for part in re.split(r"\s*[,;]\s*", body):
+        bounds = re.split(r"\s*[-\u2013\u2014]\s*", part)
+        if len(bounds) == 2:
+            low, high = int(bounds[0]), int(bounds[1])
+            if low <= high and high - low <= MAX_CITATION_RANGE:
+                numbers.extend(range(low, high + 1))
+            continue
+        numbers.append(int(bounds[0]))
+    return numbers
+
+
+def _build_reference_lookups(
+    bibliography: Dict[str, BibliographyItem],
+) -> Tuple[Dict[int, str], Dict[Tuple[str, str], str]]:
+    numbered: Dict[int, str] = {}
+    author_year: Dict[Tuple[str, str], str] = {}
+    for key, item in bibliography.items():
+        number = item.reference_number
+        if number is None:
+            number_match = REFERENCE_NUMBER_PATTERN.match(item.full_citation)
+            number = int(number_match.group(1)) if number_match else None
+        if number is not None:
+            numbered.setdefault(number, key)
+        if item.authors and item.year:
+            surname = item.authors[0].split(",")[0].split()[0].lower()
+            author_year.setdefault((surname, str(item.year)), key)
+            continue
+        author_match = REFERENCE_AUTHOR_YEAR_PATTERN.match(item.full_citation)
+        if author_match:
+            surname = author_match.group(1).lower()
+            author_year.setdefault((surname, author_match.group(2)), key)
+    if not numbered:
+        numbered = {position: key for position, key in enumerate(bibliography, start=1)}
+    return numbered, author_year
+
+
+def build_citation_index(
+    main_body_text: str, bibliography: Dict[str, BibliographyItem]
+) -> CitationIndex:
+    text = re.sub(r"\s+", " ", main_body_text).strip()
+    sentence_starts = [0] + [m.end() for m in SENTENCE_BOUNDARY_PATTERN.finditer(text)]
+    sentence_keys: List[List[str]] = [[] for _ in sentence_starts]
+    if not bibliography:
+        return CitationIndex(text, sentence_starts, sentence_keys)
+
+    numbered, author_year = _build_reference_lookups(bibliography)
+
+    def add_key(offset: int, key: str):
+        keys = sentence_keys[bisect.bisect_right(sentence_starts, offset) - 1]
+        if key not in keys:
+            keys.append(key)
+
+    citation_count = 0
+    for match in NUMERIC_CITATION_PATTERN.finditer(text):
+        for number in _expand_numeric_citation(match.group(1)):
+            key = numbered.get(number)
+            if key:
+                add_key(match.start(), key)
+                citation_count += 1
+    if author_year:
+        for match in AUTHOR_YEAR_CITATION_PATTERN.finditer(text):
+            key = author_year.get((match.group(1).lower(), match.group(2)))
+            if key:
+                add_key(match.start(), key)
+                citation_count += 1
+
+    logger.info(
+        f"Built citation index over {len(sentence_starts)} sentences with "
+        f"{citation_count} resolved in-text citations."
+    )
+    return CitationIndex(text, sentence_starts, sentence_keys)
+
+
+def link_claims_to_citations(claims: List[Claim], index: CitationIndex) -> int:
+    linked = 0
+    for claim in claims:
+        keys = index.keys_for_text(claim.claim_text)
+        if keys:
+            claim.linked_citations = keys
+            linked += 1
+    logger.info(f"Linked {linked} of {len(claims)} claims to bibliography entries.")
+    return linked
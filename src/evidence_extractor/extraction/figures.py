@@ -1,6 +1,7 @@
 import io
 import logging
-from typing import List
+from contextlib import nullcontext
+from typing import Any, List, Optional
 
 import fitz
 from PIL import Image
@@ -14,7 +15,7 @@ logger = logging.getLogger(__name__)
 
 
 def extract_figures_and_captions(
-    doc: fitz.Document, client: GeminiClient
+    doc: fitz.Document, client: GeminiClient, document_lock: Optional[Any] = None
 ) -> List[ExtractedFigure]:
     if not client.is_configured():
         logger.warning("Skipping figure extraction; Gemini client is not configured.")
@@ -22,10 +23,12 @@ def extract_figures_and_captions(
 
     extracted_figures = []
     logger.info("Starting figure and caption extraction.")
+    lock = document_lock or nullcontext()
 
     for page_num in range(len(doc)):
-        page = doc.load_page(page_num)
-        image_list = page.get_images(full=True)
+        with lock:
+            page = doc.load_page(page_num)
+            image_list = page.get_images(full=True)
 
         if not image_list:
             continue
@@ -34,7 +37,8 @@ def extract_figures_and_captions(
 
         for img_index, img_info in enumerate(image_list):
             xref = img_info[0]
-            base_image = doc.extract_image(xref)
+            with lock:
+                base_image = doc.extract_image(xref)
             image_bytes = base_image["image"]
 
             try:
@@ -49,10 +53,12 @@ def extract_figures_and_captions(
             caption_text = client.query_with_image(FIGURE_CAPTION_PROMPT, image)
 
             if caption_text and "no caption found" not in caption_text.lower():
+                with lock:
+                    bounding_box = list(page.get_image_bbox(img_info))
                 provenance = Provenance(
                     source_filename=doc.name,
                     page_number=page_num + 1,
-                    bounding_box=list(page.get_image_bbox(img_info)),
+                    bounding_box=bounding_box,
                 )
                 figure = ExtractedFigure(
                     caption=caption_text.strip(),
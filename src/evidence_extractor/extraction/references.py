@@ -0,0 +1,187 @@
+import logging
+import re
+from string import ascii_lowercase
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from evidence_extractor.models.schemas import BibliographyItem
+
+logger = logging.getLogger(__name__)
+
+MIN_REFERENCE_LENGTH = 20
+
+ENTRY_MARKER_PATTERN = re.compile(r"^\s*(?:\[(\d{1,4})\]|(\d{1,4})[.)])\s+")
+AUTHOR_START_PATTERN = re.compile(r"^[A-Z][\w'\-]+(?:,\s*[A-Z]\.|\s+[A-Z]{1,3}[,.])")
+DOI_PATTERN = re.compile(
+    r"(?:https?://(?:dx\.)?doi\.org/|\bdoi:\s*)?(10\.\d{4,9}/[^\s\"<>]+)",
+    re.IGNORECASE,
+)
+PMID_PATTERN = re.compile(r"\bPMID:?\s*(\d{1,9})\b", re.IGNORECASE)
+URL_PATTERN = re.compile(r"https?://\S+|\bAvailable (?:at|from):?", re.IGNORECASE)
+PAREN_YEAR_PATTERN = re.compile(r"\(\s*((?:19|20)\d{2})[a-z]?\s*\)")
+BARE_YEAR_PATTERN = re.compile(r"\b((?:19|20)\d{2})[a-z]?\b")
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.?!])\s+(?=\S)")
+APA_AUTHOR_SPLIT_PATTERN = re.compile(r"(?<=\.)\s*,\s*(?:&\s*)?|\s*&\s*|\s+and\s+")
+PLAIN_AUTHOR_SPLIT_PATTERN = re.compile(r"\s*,\s*(?:and\s+)?|\s+and\s+|\s*&\s*")
+APA_AUTHOR_STYLE_PATTERN = re.compile(r",\s*[A-Z]\.")
+VENUE_TAIL_PATTERN = re.compile(
+    r"[,;:]?\s*(?:(?:19|20)\d{2}\b|\d+\s*\(|\d+\s*[:,;]|\d).*$"
+)
+TRAILING_PUNCTUATION = ".,;:)]} "
+
+
+def normalize_doi(doi: Optional[str]) -> Optional[str]:
+    if not doi:
+        return None
+    match = DOI_PATTERN.search(doi.strip())
+    if not match:
+        return None
+    return match.group(1).rstrip(TRAILING_PUNCTUATION).lower()
+
+
+def normalize_pmid(pmid: Optional[str]) -> Optional[str]:
+    if not pmid:
+        return None
+    digits = re.sub(r"\D", "", pmid)
+    return digits.lstrip("0") or None
+
+
+def split_reference_entries(references_text: str) -> List[str]:
+    lines = references_text.splitlines()
+    has_markers = any(ENTRY_MARKER_PATTERN.match(line) for line in lines)
+    entries: List[List[str]] = []
+    blank_seen = True
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            blank_seen = True
+            continue
+        starts_entry = blank_seen or not entries
+        if has_markers:
+            starts_entry = starts_entry or bool(ENTRY_MARKER_PATTERN.match(stripped))
+        elif not starts_entry:
+            previous = entries[-1][-1]
+            starts_entry = previous.endswith(".") and bool(
+                AUTHOR_START_PATTERN.match(stripped)
+            )
+        if starts_entry:
+            entries.append([stripped])
+        else:
+            entries[-1].append(stripped)
+        blank_seen = False
+    return [" ".join(entry) for entry in entries]
+
+
+def _split_authors(author_text: str) -> List[str]:
+    author_text = author_text.strip(TRAILING_PUNCTUATION.replace(".", ""))
+    if not author_text:
+        return []
+    if APA_AUTHOR_STYLE_PATTERN.search(author_text):
+        parts = APA_AUTHOR_SPLIT_PATTERN.split(author_text)
+    else:
+        parts = PLAIN_AUTHOR_SPLIT_PATTERN.split(author_text.rstrip("."))
+    return [part.strip(" ,;") for part in parts if part and part.strip(" ,;")]
+
+
+def _surname(author: str) -> str:
+    if "," in author:
+        surname = author.split(",")[0]
+    else:
+        surname = author.split()[0] if author.split() else ""
+    return re.sub(r"[^\w'\-]", "", surname)
+
+
+def _clean_venue(segment: str) -> Optional[str]:
+    venue = VENUE_TAIL_PATTERN.sub("", segment).strip(TRAILING_PUNCTUATION)
+    return venue or None
+
+
+def parse_reference(entry: str) -> Tuple[BibliographyItem, str]:
+    text = entry.strip()
+    reference_number = None
+    marker = ENTRY_MARKER_PATTERN.match(text)
+    if marker:
+        reference_number = int(marker.group(1) or marker.group(2))
+        text = text[marker.end() :]
+
+    doi_match = DOI_PATTERN.search(text)
+    pmid_match = PMID_PATTERN.search(text)
+    working = text
+    if doi_match:
+        working = working.replace(doi_match.group(0), " ")
+    if pmid_match:
+        working = working.replace(pmid_match.group(0), " ")
+    working = re.sub(r"\bdoi:?\s*$", "", URL_PATTERN.sub(" ", working), flags=re.I)
+    working = re.sub(r"\s+", " ", working).strip()
+
+    authors: List[str] = []
+    title = venue = None
+    year = None
+    paren_year = PAREN_YEAR_PATTERN.search(working)
+    if paren_year:
+        year = int(paren_year.group(1))
+        authors = _split_authors(working[: paren_year.start()])
+        segments = SENTENCE_SPLIT_PATTERN.split(
+            working[paren_year.end() :].lstrip(" .")
+        )
+        if segments:
+            title = segments[0].strip(TRAILING_PUNCTUATION) or None
+        if len(segments) > 1:
+            venue = _clean_venue(segments[1])
+    else:
+        segments = SENTENCE_SPLIT_PATTERN.split(working)
+        if len(segments) > 1:
+            authors = _split_authors(segments[0])
+            title = segments[1].strip(TRAILING_PUNCTUATION) or None
+        if len(segments) > 2:
+            venue = _clean_venue(segments[2])
+        bare_year = BARE_YEAR_PATTERN.search(working)
+        if bare_year:
+            year = int(bare_year.group(1))
+
+    surname = _surname(authors[0]) if authors else ""
+    base_key = f"{surname}{year}" if surname and year else ""
+    item = BibliographyItem(
+        citation_key=base_key or f"ref_{reference_number or 0}",
+        full_citation=entry.strip(),
+        reference_number=reference_number,
+        authors=authors,
+        year=year,
+        title=title,
+        venue=venue,
+        doi=normalize_doi(doi_match.group(1)) if doi_match else None,
+        pmid=normalize_pmid(pmid_match.group(1)) if pmid_match else None,
+    )
+    return item, base_key
+
+
+def _unique_key(base_key: str, used_keys: Dict[str, int]) -> str:
+    if base_key not in used_keys:
+        used_keys[base_key] = 1
+        return base_key
+    while True:
+        count = used_keys[base_key]
+        used_keys[base_key] = count + 1
+        if count < len(ascii_lowercase):
+            candidate = f"{base_key}{ascii_lowercase[count]}"
+        else:
+            candidate = f"{base_key}_{count + 1}"
+        if candidate not in used_keys:
+            used_keys[candidate] = 1
+            return candidate
+
+
+def parse_references(entries: Iterable[str]) -> List[BibliographyItem]:
+    items: List[BibliographyItem] = []
+    used_keys: Dict[str, int] = {}
+    position = 0
+    for entry in entries:
+        if len(entry.strip()) <= MIN_REFERENCE_LENGTH:
+            continue
+        position += 1
+        item, base_key = parse_reference(entry)
+        if not base_key:
+            base_key = f"ref_{item.reference_number or position}"
+        item.citation_key = _unique_key(base_key, used_keys)
+        items.append(item)
+    logger.info(f"Parsed {len(items)} structured bibliography entries.")
+    return items
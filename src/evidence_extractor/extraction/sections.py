@@ -1,6 +1,9 @@
 import logging
 import re
-from typing import List
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import fitz
 
 from evidence_extractor.models.schemas import Section
 
@@ -14,47 +17,188 @@ COMMON_SECTION_HEADERS = [
     "methods",
     "methodology",
     "materials and methods",
+    "methods and materials",
+    "patients and methods",
     "experimental setup",
     "results",
     "findings",
+    "results and discussion",
     "discussion",
     "conclusion",
+    "conclusions",
     "summary",
+    "limitations",
     "acknowledgements",
+    "acknowledgments",
     "references",
     "bibliography",
     "literature cited",
+    "works cited",
 ]
 
+HEADER_FONT_SIZE_RATIO = 1.15
+MARGIN_FRACTION = 0.05
+CONTEXT_CHARS = 40
+SECTION_CACHE_SIZE = 32
+BOLD_FLAG = 1 << 4
 
-def detect_sections(text_with_newlines: str) -> List[Section]:
-    sections = []
-    pattern = re.compile(
-        r"^\s*(?:\d\.?|I{1,3}V?|VI{1,3})\s*("
-        + "|".join(COMMON_SECTION_HEADERS)
-        + r")\s*$",
-        re.IGNORECASE | re.MULTILINE,
+_HEADERS_BY_LENGTH = sorted(COMMON_SECTION_HEADERS, key=len, reverse=True)
+HEADER_PATTERN = re.compile(
+    r"^\s*(?:\d{1,2}(?:\.\d{1,2})*\.?\s*|[A-Z]\.\s*|[IVXLC]{1,5}\.?\s+)?("
+    + "|".join(re.escape(header) for header in _HEADERS_BY_LENGTH)
+    + r")\s*[:.—\-]?\s*$",
+    re.IGNORECASE,
+)
+
+_SECTION_CACHE: "OrderedDict[Tuple[str, int, int], List[Section]]" = OrderedDict()
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _is_styled(span: Dict[str, Any], body_size: float) -> bool:
+    if span["size"] >= body_size * HEADER_FONT_SIZE_RATIO:
+        return True
+    return bool(span["flags"] & BOLD_FLAG) or "bold" in span["font"].lower()
+
+
+def _body_font_size(pages: List[Dict[str, Any]]) -> float:
+    sizes: Counter = Counter()
+    for page_dict in pages:
+        for block in page_dict["blocks"]:
+            for line in block.get("lines", []):
+                for span in line["spans"]:
+                    sizes[round(span["size"], 1)] += len(span["text"].strip())
+    return sizes.most_common(1)[0][0] if sizes else 0.0
+
+
+def _line_heading(
+    line: Dict[str, Any], body_size: float
+) -> Optional[Tuple[str, str, str]]:
+    spans = [span for span in line["spans"] if span["text"].strip()]
+    if not spans:
+        return None
+    line_text = _normalize("".join(span["text"] for span in spans))
+    own_line = HEADER_PATTERN.match(line_text)
+    if own_line:
+        return own_line.group(1).lower(), line_text, ""
+
+    styled_prefix = []
+    for span in spans:
+        if not _is_styled(span, body_size):
+            break
+        styled_prefix.append(span["text"])
+    if not styled_prefix or len(styled_prefix) == len(spans):
+        return None
+    heading = _normalize("".join(styled_prefix))
+    inline = HEADER_PATTERN.match(heading)
+    if not inline:
+        return None
+    remainder = _normalize(
+        "".join(span["text"] for span in spans[len(styled_prefix) :])
     )
+    return inline.group(1).lower(), heading, remainder
 
-    matches = list(pattern.finditer(text_with_newlines))
 
-    if not matches:
-        logger.warning("Could not detect any standard section headers.")
-        return []
+def _collect_layout_headings(
+    document: fitz.Document,
+) -> List[Tuple[str, str, str, int]]:
+    pages = []
+    for page_num in range(document.page_count):
+        try:
+            page_dict = document.load_page(page_num).get_text("dict")
+        except Exception as e:
+            logger.error(f"Could not read layout of page {page_num + 1}. Error: {e}")
+            page_dict = {"blocks": [], "height": 0}
+        pages.append(page_dict)
+    body_size = _body_font_size(pages)
 
-    logger.info(f"Found {len(matches)} potential section headers.")
+    headings = []
+    for page_num, page_dict in enumerate(pages):
+        height = page_dict.get("height") or 0
+        lines = [
+            line for block in page_dict["blocks"] for line in block.get("lines", [])
+        ]
+        for line_idx, line in enumerate(lines):
+            top, bottom = line["bbox"][1], line["bbox"][3]
+            if height and (
+                bottom < height * MARGIN_FRACTION
+                or top > height * (1 - MARGIN_FRACTION)
+            ):
+                continue
+            found = _line_heading(line, body_size)
+            if not found:
+                continue
+            title, heading, context = found
+            if not context and line_idx + 1 < len(lines):
+                context = _normalize(
+                    "".join(span["text"] for span in lines[line_idx + 1]["spans"])
+                )
+            headings.append((title, heading, context[:CONTEXT_CHARS], page_num + 1))
+    return headings
 
-    for i, match in enumerate(matches):
-        section_title = match.group(1).strip().lower()
-        start_char = match.end()
-        end_char = (
-            matches[i + 1].start() if i + 1 < len(matches) else len(text_with_newlines)
-        )
-        section_text = text_with_newlines[start_char:end_char].strip()
+
+def _locate_heading(cleaned_lower: str, heading: str, context: str, cursor: int) -> int:
+    heading = heading.lower()
+    if context:
+        context_words = context.lower().split()
+        while context_words:
+            position = cleaned_lower.find(
+                f"{heading} {' '.join(context_words)}", cursor
+            )
+            if position != -1:
+                return position
+            context_words = context_words[:-1]
+    return cleaned_lower.find(heading, cursor)
+
+
+def segment_sections(document: fitz.Document, cleaned_text: str) -> List[Section]:
+    headings = _collect_layout_headings(document)
+    cleaned_lower = cleaned_text.lower()
+    located = []
+    cursor = 0
+    for title, heading, context, page_number in headings:
+        position = _locate_heading(cleaned_lower, heading, context, cursor)
+        if position == -1:
+            logger.debug(f"Could not map heading '{heading}' onto the cleaned text.")
+            continue
+        located.append((title, heading, position, page_number))
+        cursor = position + len(heading)
+
+    sections = []
+    for i, (title, heading, start_char, page_number) in enumerate(located):
+        end_char = located[i + 1][2] if i + 1 < len(located) else len(cleaned_text)
         sections.append(
             Section(
-                title=section_title, text_content=section_text, start_char=match.start()
+                title=title,
+                heading=heading,
+                text_content=cleaned_text[start_char + len(heading) : end_char]
+                .lstrip(" :.—-")
+                .strip(),
+                start_char=start_char,
+                end_char=end_char,
+                page_number=page_number,
             )
         )
+    if not sections:
+        logger.warning("Could not detect any standard section headers.")
+    else:
+        logger.info(f"Detected {len(sections)} sections.")
+    return sections
 
+
+def detect_sections(document: fitz.Document, cleaned_text: str) -> List[Section]:
+    cache_key = (document.name, document.page_count, hash(cleaned_text))
+    if cache_key in _SECTION_CACHE:
+        _SECTION_CACHE.move_to_end(cache_key)
+        return _SECTION_CACHE[cache_key]
+    sections = segment_sections(document, cleaned_text)
+    _SECTION_CACHE[cache_key] = sections
+    if len(_SECTION_CACHE) > SECTION_CACHE_SIZE:
+        _SECTION_CACHE.popitem(last=False)
     return sections
+
+
+def clear_section_cache():
+    _SECTION_CACHE.clear()
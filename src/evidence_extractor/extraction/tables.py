@@ -1,7 +1,8 @@
 import io
 import json
 import logging
-from typing import List
+from contextlib import nullcontext
+from typing import Any, List, Optional
 
 import camelot
 import fitz
@@ -16,7 +17,7 @@ logger = logging.getLogger(__name__)
 
 
 def extract_tables_with_llm(
-    doc: fitz.Document, client: GeminiClient
+    doc: fitz.Document, client: GeminiClient, document_lock: Optional[Any] = None
 ) -> List[ExtractedTable]:
     if not client.is_configured():
         logger.warning("Skipping table extraction; Gemini client is not configured.")
@@ -24,6 +25,7 @@ def extract_tables_with_llm(
 
     extracted_tables = []
     logger.info("Starting advanced table extraction process.")
+    lock = document_lock or nullcontext()
 
     try:
         tables_lattice = camelot.read_pdf(doc.name, pages="all", flavor="lattice")
@@ -38,13 +40,13 @@ def extract_tables_with_llm(
 
     for i, table_area in enumerate(all_tables):
         page_num = table_area.page - 1
-        page = doc.load_page(page_num)
-
         x0, y0, x1, y1 = table_area._bbox
         rect = fitz.Rect(x0, y1, x1, y0)
 
         try:
-            pix = page.get_pixmap(clip=rect, dpi=300)
+            with lock:
+                page = doc.load_page(page_num)
+                pix = page.get_pixmap(clip=rect, dpi=300)
             image = Image.open(io.BytesIO(pix.tobytes()))
         except Exception as e:
             logger.warning(
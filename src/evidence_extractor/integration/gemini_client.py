@@ -1,6 +1,8 @@
 import logging
 import os
-from typing import Optional
+import threading
+from contextlib import nullcontext
+from typing import Any, Dict, Optional
 
 import google.generativeai as genai
 from dotenv import load_dotenv
@@ -14,10 +16,20 @@ class GeminiClient:
         self,
         text_model_name: str = "gemini-2.5-flash",
         vision_model_name: str = "gemini-2.5-flash",
+        request_semaphore: Optional[Any] = None,
     ):
+        self.text_model_name = text_model_name
+        self.vision_model_name = vision_model_name
+        self.request_semaphore = request_semaphore
         self.text_model = None
         self.vision_model = None
         self.api_key = None
+        self.usage: Dict[str, int] = {
+            "requests": 0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+        }
+        self._usage_lock = threading.Lock()
         self._configure_api()
         if self.api_key:
             self.text_model = genai.GenerativeModel(text_model_name)
@@ -45,13 +57,35 @@ class GeminiClient:
     def is_configured(self) -> bool:
         return self.api_key is not None
 
+    def _record_usage(self, response: Any):
+        metadata = getattr(response, "usage_metadata", None)
+        with self._usage_lock:
+            self.usage["requests"] += 1
+            self.usage["input_tokens"] += (
+                getattr(metadata, "prompt_token_count", 0) or 0
+            )
+            self.usage["output_tokens"] += (
+                getattr(metadata, "candidates_token_count", 0) or 0
+            )
+
+    def usage_snapshot(self) -> Dict[str, int]:
+        with self._usage_lock:
+            return dict(self.usage)
+
+    def _request_slot(self):
+        if self.request_semaphore is None:
+            return nullcontext()
+        return self.request_semaphore
+
     def query(self, prompt: str) -> Optional[str]:
         if not self.text_model:
             logger.error("Cannot query text model. Client is not configured.")
             return None
         logger.info(f"Sending text query to model '{self.text_model.model_name}'...")
         try:
-            response = self.text_model.generate_content(prompt)
+            with self._request_slot():
+                response = self.text_model.generate_content(prompt)
+            self._record_usage(response)
             return response.text
         except Exception as e:
             logger.error(f"An error occurred during text query: {e}")
@@ -66,7 +100,9 @@ class GeminiClient:
             f"Sending multimodal query to model '{self.vision_model.model_name}'..."
         )
         try:
-            response = self.vision_model.generate_content([prompt, image])
+            with self._request_slot():
+                response = self.vision_model.generate_content([prompt, image])
+            self._record_usage(response)
             return response.text
         except Exception as e:
             logger.error(f"An error occurred during multimodal query: {e}")
@@ -0,0 +1,120 @@
+import json
+import logging
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from PIL import Image
+
+from evidence_extractor.extraction.prompts import (
+    FIGURE_CAPTION_PROMPT,
+    TABLE_PARSING_PROMPT,
+)
+
+logger = logging.getLogger(__name__)
+
+OFFLINE_MODEL_NAME = "offline-stand-in"
+CHARS_PER_TOKEN = 4
+MIN_CLAIM_CHARS = 40
+
+SENTENCE_PATTERN = re.compile(r"[^.!?]+[.!?]")
+TEXT_SECTION = re.compile(r"--- TEXT ---\n(.*)\n--- END TEXT ---", re.DOTALL)
+CLAIM_LIST_SECTION = re.compile(
+    r"--- (?:CLAIM LIST|KEY FINDINGS) ---\n(.*)\n--- END", re.DOTALL
+)
+
+
+# Deterministic stand-in for GeminiClient that never touches the network. Claims
+# are sentences lifted from the prompt text, so provenance matching and citation
+# linking downstream do real work; `latency` approximates a remote model.
+class OfflineClient:
+    def __init__(
+        self,
+        max_claims: int = 10,
+        latency: float = 0.0,
+        request_semaphore: Optional[Any] = None,
+    ):
+        self.text_model_name = OFFLINE_MODEL_NAME
+        self.vision_model_name = OFFLINE_MODEL_NAME
+        self.max_claims = max_claims
+        self.latency = latency
+        self.request_semaphore = request_semaphore
+        self.usage: Dict[str, int] = {
+            "requests": 0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+        }
+        self._usage_lock = threading.Lock()
+
+    def is_configured(self) -> bool:
+        return True
+
+    def usage_snapshot(self) -> Dict[str, int]:
+        with self._usage_lock:
+            return dict(self.usage)
+
+    def _respond(self, prompt: str, response: str) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        with self._usage_lock:
+            self.usage["requests"] += 1
+            self.usage["input_tokens"] += len(prompt) // CHARS_PER_TOKEN
+            self.usage["output_tokens"] += len(response) // CHARS_PER_TOKEN
+        return response
+
+    def _claims(self, text: str) -> List[str]:
+        sentences = (
+            match.group(0).strip() for match in SENTENCE_PATTERN.finditer(text)
+        )
+        return [s for s in sentences if len(s) >= MIN_CLAIM_CHARS][: self.max_claims]
+
+    def query(self, prompt: str) -> Optional[str]:
+        text_match = TEXT_SECTION.search(prompt)
+        if text_match:
+            payload = {
+                "pico": {
+                    "population": "Adults in the synthetic cohort",
+                    "intervention": "Synthetic intervention",
+                    "comparison": "Placebo",
+                    "outcome": "Primary outcome",
+                },
+                "quality": {
+                    "score_name": "Methodological Quality",
+                    "score_value": "Medium",
+                    "justification": "Offline stand-in response.",
+                },
+                "claims": [
+                    {"claim_text": claim} for claim in self._claims(text_match.group(1))
+                ],
+            }
+            return self._respond(prompt, json.dumps(payload))
+        list_match = CLAIM_LIST_SECTION.search(prompt)
+        items = list_match.group(1).splitlines() if list_match else []
+        if "--- CLAIM LIST ---" in prompt:
+            annotations = [
+                {"claim_index": i, "annotation": "Medium: offline stand-in."}
+                for i in range(1, len(items) + 1)
+            ]
+            return self._respond(prompt, json.dumps(annotations))
+        if "--- KEY FINDINGS ---" in prompt:
+            findings = " ".join(item.lstrip("- ").strip() for item in items[:3])
+            return self._respond(prompt, f"The synthetic study reports: {findings}")
+        logger.warning("Offline client received an unrecognised text prompt.")
+        return None
+
+    def query_with_image(self, prompt: str, image: Image.Image) -> Optional[str]:
+        if prompt == FIGURE_CAPTION_PROMPT:
+            return self._respond(
+                prompt, f"Figure: Synthetic image ({image.width}x{image.height})."
+            )
+        if prompt == TABLE_PARSING_PROMPT:
+            payload = {
+                "summary": "Synthetic table parsed offline.",
+                "structured_data": [
+                    {"width": image.width, "height": image.height, "mode": image.mode}
+                ],
+            }
+            return self._respond(prompt, json.dumps(payload))
+        logger.warning("Offline client received an unrecognised image prompt.")
+        return None
@@ -75,6 +75,22 @@ class ExtractedFigure(BaseModel):
 class BibliographyItem(BaseModel):
     citation_key: str = Field(...)
     full_citation: str = Field(...)
+    reference_number: Optional[int] = Field(None)
+    authors: List[str] = Field(default_factory=list)
+    year: Optional[int] = Field(None)
+    title: Optional[str] = Field(None)
+    venue: Optional[str] = Field(None)
+    doi: Optional[str] = Field(None)
+    pmid: Optional[str] = Field(None)
+
+
+class Section(BaseModel):
+    title: str = Field(...)
+    heading: str = Field(...)
+    text_content: str = Field(...)
+    start_char: int = Field(...)
+    end_char: int = Field(...)
+    page_number: Optional[int] = Field(None)
 
 
 class ArticleExtraction(BaseModel):
@@ -89,3 +105,5 @@ class ArticleExtraction(BaseModel):
     tables: List[ExtractedTable] = Field(default_factory=list)
     figures: List[ExtractedFigure] = Field(default_factory=list)
     bibliography: Dict[str, BibliographyItem] = Field(default_factory=dict)
+    document_hash: Optional[str] = Field(None)
+    stage_fingerprints: Dict[str, str] = Field(default_factory=dict)
@@ -1,16 +1,26 @@
 import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
 
 from evidence_extractor.models.schemas import ArticleExtraction
 
+from .serialization import dumps_extraction, is_binary_path
+
 logger = logging.getLogger(__name__)
 
 
-def save_to_json(extraction_result: ArticleExtraction, output_path: str):
+def save_to_json(
+    extraction_result: ArticleExtraction, output_path: str, indent: Optional[int] = 2
+):
     logger.info(f"Attempting to save extraction results to '{output_path}'...")
     try:
-        json_output = extraction_result.model_dump_json(indent=2)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(json_output)
+        payload = dumps_extraction(
+            extraction_result, indent=indent, binary=is_binary_path(output_path)
+        )
+        with open(output_path, "wb") as f:
+            f.write(payload)
         logger.info(f"Successfully saved structured JSON output to '{output_path}'.")
     except TypeError as e:
         logger.error(f"A TypeError occurred during JSON serialization: {e}")
@@ -18,3 +28,28 @@ def save_to_json(extraction_result: ArticleExtraction, output_path: str):
         logger.error(f"An IOError occurred while writing to file '{output_path}': {e}")
     except Exception as e:
         logger.error(f"An unexpected error occurred during JSON output generation: {e}")
+
+
+def save_to_json_atomic(
+    extraction_result: ArticleExtraction, output_path: str, indent: Optional[int] = 2
+):
+    # Unlike save_to_json this raises on failure, and a crash mid-write leaves the
+    # previous file intact, so callers can safely discard other copies afterwards.
+    payload = dumps_extraction(
+        extraction_result, indent=indent, binary=is_binary_path(output_path)
+    )
+    directory = Path(output_path).parent
+    fd, temp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{Path(output_path).name}."
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    logger.info(f"Saved structured JSON output to '{output_path}'.")
@@ -0,0 +1,230 @@
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from evidence_extractor.models.schemas import ArticleExtraction
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".idx"
+ZSTD_SUFFIX = ".zst"
+SCAN_CHUNK_BYTES = 1 << 20
+
+
+def _zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "Compressed corpora require the 'zstandard' package. Install it with "
+            "'pip install evidence_extractor[zstd]'."
+        ) from e
+    return zstandard
+
+
+def index_path_for(corpus_path: str) -> Path:
+    return Path(f"{corpus_path}{INDEX_SUFFIX}")
+
+
+def record_key(extraction: ArticleExtraction) -> str:
+    return extraction.document_hash or extraction.source_filename
+
+
+def _read_index(index_path: Path) -> List[Dict[str, Any]]:
+    entries = []
+    if not index_path.exists():
+        return entries
+    with open(index_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                logger.warning(f"Dropping truncated index entry in '{index_path}'.")
+                break
+    return entries
+
+
+class CorpusWriter:
+    def __init__(self, path: str, compress: Optional[bool] = None):
+        self.path = Path(path)
+        self.index_path = index_path_for(path)
+        self.compress = path.endswith(ZSTD_SUFFIX) if compress is None else compress
+        self._compressor = _zstandard().ZstdCompressor() if self.compress else None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._recover()
+        self._data = open(self.path, "ab")
+        self._index = open(self.index_path, "a", encoding="utf-8")
+
+    def _record_key(self, payload: bytes) -> Optional[str]:
+        try:
+            if self.compress:
+                payload = _zstandard().ZstdDecompressor().decompress(payload)
+            record = json.loads(payload)
+        except Exception:
+            return None
+        if not isinstance(record, dict):
+            return None
+        return record.get("document_hash") or record.get("source_filename")
+
+    def _entry_is_intact(self, entry: Dict[str, Any]) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(entry["offset"])
+            return self._record_key(f.read(entry["length"])) == entry["key"]
+
+    def _complete_lines(self, f: BinaryIO, offset: int) -> Iterator[Tuple[int, bytes]]:
+        for line in f:
+            if not line.endswith(b"\n"):
+                return
+            yield offset, line
+            offset += len(line)
+
+    def _complete_frames(self, f: BinaryIO, offset: int) -> Iterator[Tuple[int, bytes]]:
+        zstandard = _zstandard()
+        pending = b""
+        while True:
+            frame = zstandard.ZstdDecompressor().decompressobj()
+            data = pending
+            try:
+                if data:
+                    frame.decompress(data)
+                while not frame.eof:
+                    chunk = f.read(SCAN_CHUNK_BYTES)
+                    if not chunk:
+                        return
+                    data += chunk
+                    frame.decompress(chunk)
+            except zstandard.ZstdError:
+                return
+            pending = frame.unused_data
+            payload = data[: len(data) - len(pending)]
+            yield offset, payload
+            offset += len(payload)
+
+    def _scan_records(self, start: int) -> Tuple[List[Dict[str, Any]], int]:
+        entries: List[Dict[str, Any]] = []
+        end = start
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            records = (
+                self._complete_frames(f, start)
+                if self.compress
+                else self._complete_lines(f, start)
+            )
+            for offset, payload in records:
+                end = offset + len(payload)
+                key = self._record_key(payload)
+                if key is None:
+                    logger.warning(
+                        f"Record at byte {offset} of '{self.path}' is not valid "
+                        "JSON; leaving it unindexed."
+                    )
+                    continue
+                entries.append({"key": key, "offset": offset, "length": len(payload)})
+        return entries, end
+
+    def _recover(self):
+        size = self.path.stat().st_size if self.path.exists() else 0
+        entries = [
+            entry
+            for entry in _read_index(self.index_path)
+            if entry["offset"] + entry["length"] <= size
+        ]
+        if entries and not self._entry_is_intact(entries[-1]):
+            logger.warning(
+                f"Index '{self.index_path}' does not match '{self.path}'; "
+                "rebuilding it from the data file."
+            )
+            entries = []
+        end = entries[-1]["offset"] + entries[-1]["length"] if entries else 0
+        if end < size:
+            # Records past the indexed end are complete unless the writer died
+            # mid-append; re-index them and drop only a trailing partial record.
+            recovered, end = self._scan_records(end)
+            if recovered:
+                logger.info(
+                    f"Re-indexed {len(recovered)} record(s) missing from "
+                    f"'{self.index_path}'."
+                )
+            entries.extend(recovered)
+        if size != end:
+            logger.warning(
+                f"Truncating '{self.path}' from {size} to {end} bytes to drop a "
+                "partially written record."
+            )
+            with open(self.path, "ab") as f:
+                f.truncate(end)
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def __enter__(self) -> "CorpusWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self._data.close()
+        self._index.close()
+
+    def append_json(self, key: str, record_json: str) -> int:
+        payload = record_json.encode("utf-8") + b"\n"
+        if self._compressor is not None:
+            payload = self._compressor.compress(payload)
+        offset = self._data.tell()
+        self._data.write(payload)
+        self._data.flush()
+        os.fsync(self._data.fileno())
+        entry = {"key": key, "offset": offset, "length": len(payload)}
+        self._index.write(json.dumps(entry) + "\n")
+        self._index.flush()
+        os.fsync(self._index.fileno())
+        return offset
+
+    def append(self, extraction: ArticleExtraction) -> int:
+        return self.append_json(record_key(extraction), extraction.model_dump_json())
+
+
+class CorpusReader:
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.compressed = str(path).endswith(ZSTD_SUFFIX)
+        self._decompressor = (
+            _zstandard().ZstdDecompressor() if self.compressed else None
+        )
+        self.entries = _read_index(index_path_for(path))
+        self._positions = {entry["key"]: i for i, entry in enumerate(self.entries)}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def keys(self) -> List[str]:
+        return list(self._positions)
+
+    def _decode(self, payload: bytes) -> ArticleExtraction:
+        if self._decompressor is not None:
+            payload = self._decompressor.decompress(payload)
+        return ArticleExtraction.model_validate_json(payload)
+
+    def read_at(self, position: int) -> ArticleExtraction:
+        entry = self.entries[position]
+        with open(self.path, "rb") as f:
+            f.seek(entry["offset"])
+            return self._decode(f.read(entry["length"]))
+
+    def get(self, key: str) -> Optional[ArticleExtraction]:
+        position = self._positions.get(key)
+        return self.read_at(position) if position is not None else None
+
+    def __iter__(self) -> Iterator[ArticleExtraction]:
+        latest = set(self._positions.values())
+        with open(self.path, "rb") as f:
+            for position, entry in enumerate(self.entries):
+                if position not in latest:
+                    continue
+                f.seek(entry["offset"])
+                yield self._decode(f.read(entry["length"]))
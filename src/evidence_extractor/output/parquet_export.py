@@ -0,0 +1,290 @@
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from evidence_extractor.models.schemas import ArticleExtraction
+
+from .jsonl_corpus import record_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_ROWS = 10_000
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Parquet export requires the 'pyarrow' package. Install it with "
+            "'pip install evidence_extractor[parquet]'."
+        ) from e
+    return pyarrow
+
+
+def _schemas(pa: Any) -> Dict[str, Any]:
+    review = [
+        ("status", pa.string()),
+        ("reviewer_comment", pa.string()),
+        ("last_reviewed", pa.timestamp("us")),
+    ]
+    provenance = [
+        ("page_number", pa.int32()),
+        ("line_number", pa.int32()),
+        ("bounding_box", pa.list_(pa.float64())),
+    ]
+    article = [("document_key", pa.string()), ("source_filename", pa.string())]
+    return {
+        "articles": pa.schema(
+            article
+            + [
+                ("document_hash", pa.string()),
+                ("title", pa.string()),
+                ("authors", pa.list_(pa.string())),
+                ("summary", pa.string()),
+                ("records_excluded_count", pa.int32()),
+                ("claims", pa.int32()),
+                ("tables", pa.int32()),
+                ("figures", pa.int32()),
+                ("references", pa.int32()),
+            ]
+        ),
+        "claims": pa.schema(
+            article
+            + [
+                ("claim_index", pa.int32()),
+                ("claim_text", pa.string()),
+                ("linked_citations", pa.list_(pa.string())),
+                ("uncertainty_annotation", pa.string()),
+            ]
+            + provenance
+            + review
+        ),
+        "pico": pa.schema(
+            article
+            + [
+                ("population", pa.string()),
+                ("intervention", pa.string()),
+                ("comparison", pa.string()),
+                ("outcome", pa.string()),
+                ("pages", pa.list_(pa.int32())),
+            ]
+            + review
+        ),
+        "quality_scores": pa.schema(
+            article
+            + [
+                ("score_index", pa.int32()),
+                ("score_name", pa.string()),
+                ("score_value", pa.string()),
+                ("justification", pa.string()),
+                ("page_number", pa.int32()),
+            ]
+            + review
+        ),
+        "tables": pa.schema(
+            article
+            + [
+                ("table_index", pa.int32()),
+                ("summary", pa.string()),
+                ("page_number", pa.int32()),
+                ("row_index", pa.int32()),
+                ("column", pa.string()),
+                ("value", pa.string()),
+            ]
+            + review
+        ),
+        "bibliography": pa.schema(
+            article
+            + [
+                ("citation_key", pa.string()),
+                ("reference_number", pa.int32()),
+                ("full_citation", pa.string()),
+                ("authors", pa.list_(pa.string())),
+                ("year", pa.int32()),
+                ("title", pa.string()),
+                ("venue", pa.string()),
+                ("doi", pa.string()),
+                ("pmid", pa.string()),
+            ]
+        ),
+    }
+
+
+def _review(metadata: Any) -> Dict[str, Any]:
+    return {
+        "status": metadata.status.value,
+        "reviewer_comment": metadata.reviewer_comment,
+        "last_reviewed": metadata.last_reviewed,
+    }
+
+
+def _cell_text(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def flatten_extraction(extraction: ArticleExtraction) -> Dict[str, List[Dict]]:
+    article = {
+        "document_key": record_key(extraction),
+        "source_filename": extraction.source_filename,
+    }
+    rows: Dict[str, List[Dict]] = {
+        "articles": [
+            {
+                **article,
+                "document_hash": extraction.document_hash,
+                "title": extraction.title,
+                "authors": extraction.authors,
+                "summary": extraction.summary,
+                "records_excluded_count": extraction.records_excluded_count,
+                "claims": len(extraction.claims),
+                "tables": len(extraction.tables),
+                "figures": len(extraction.figures),
+                "references": len(extraction.bibliography),
+            }
+        ],
+        "claims": [],
+        "pico": [],
+        "quality_scores": [],
+        "tables": [],
+        "bibliography": [],
+    }
+    for i, claim in enumerate(extraction.claims):
+        rows["claims"].append(
+            {
+                **article,
+                "claim_index": i,
+                "claim_text": claim.claim_text,
+                "linked_citations": claim.linked_citations,
+                "uncertainty_annotation": claim.uncertainty_annotation,
+                "page_number": claim.provenance.page_number,
+                "line_number": claim.provenance.line_number,
+                "bounding_box": claim.provenance.bounding_box,
+                **_review(claim.correction_metadata),
+            }
+        )
+    pico = extraction.pico_elements
+    if pico is not None:
+        rows["pico"].append(
+            {
+                **article,
+                "population": pico.population,
+                "intervention": pico.intervention,
+                "comparison": pico.comparison,
+                "outcome": pico.outcome,
+                "pages": [p.page_number for p in pico.provenance],
+                **_review(pico.correction_metadata),
+            }
+        )
+    for i, score in enumerate(extraction.quality_scores):
+        rows["quality_scores"].append(
+            {
+                **article,
+                "score_index": i,
+                "score_name": score.score_name,
+                "score_value": score.score_value,
+                "justification": score.justification,
+                "page_number": score.provenance.page_number
+                if score.provenance
+                else None,
+                **_review(score.correction_metadata),
+            }
+        )
+    for i, table in enumerate(extraction.tables):
+        table_row = {
+            **article,
+            "table_index": i,
+            "summary": table.summary,
+            "page_number": table.provenance.page_number,
+            "row_index": None,
+            "column": None,
+            "value": None,
+            **_review(table.correction_metadata),
+        }
+        if not table.table_data:
+            rows["tables"].append(table_row)
+        for row_index, row_dict in enumerate(table.table_data):
+            for column, value in row_dict.items():
+                rows["tables"].append(
+                    {
+                        **table_row,
+                        "row_index": row_index,
+                        "column": column,
+                        "value": _cell_text(value),
+                    }
+                )
+    for citation_key, item in extraction.bibliography.items():
+        rows["bibliography"].append(
+            {
+                **article,
+                "citation_key": citation_key,
+                "reference_number": item.reference_number,
+                "full_citation": item.full_citation,
+                "authors": item.authors,
+                "year": item.year,
+                "title": item.title,
+                "venue": item.venue,
+                "doi": item.doi,
+                "pmid": item.pmid,
+            }
+        )
+    return rows
+
+
+def export_to_parquet(
+    extractions: Iterable[ArticleExtraction],
+    output_dir: str,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+) -> Dict[str, int]:
+    pa = _pyarrow()
+    schemas = _schemas(pa)
+    output_root = Path(output_dir)
+    output_root.mkdir(parents=True, exist_ok=True)
+    logger.info(f"Starting streaming Parquet export to '{output_dir}'.")
+    # Each file is written under a temporary name and only moved into place once
+    # every article was read, so a failed export never leaves truncated files.
+    targets = {name: output_root / f"{name}.parquet" for name in schemas}
+    temp_paths = {
+        name: path.with_name(f".{path.name}.tmp") for name, path in targets.items()
+    }
+    writers = {
+        name: pa.parquet.ParquetWriter(str(temp_paths[name]), schema)
+        for name, schema in schemas.items()
+    }
+    buffers: Dict[str, List[Dict]] = {name: [] for name in schemas}
+    counts = {name: 0 for name in schemas}
+
+    def flush(name: str):
+        if buffers[name]:
+            writers[name].write_table(
+                pa.Table.from_pylist(buffers[name], schema=schemas[name])
+            )
+            counts[name] += len(buffers[name])
+            buffers[name] = []
+
+    try:
+        for extraction in extractions:
+            for name, rows in flatten_extraction(extraction).items():
+                buffers[name].extend(rows)
+                if len(buffers[name]) >= batch_rows:
+                    flush(name)
+        for name in schemas:
+            flush(name)
+        for writer in writers.values():
+            writer.close()
+        for name, temp_path in temp_paths.items():
+            os.replace(temp_path, targets[name])
+    except Exception as e:
+        logger.error(f"Parquet export to '{output_dir}' failed; nothing written: {e}")
+        for writer in writers.values():
+            writer.close()
+        for temp_path in temp_paths.values():
+            if temp_path.exists():
+                temp_path.unlink()
+        raise
+    logger.info(
+        f"Exported {counts['articles']} articles to Parquet files in '{output_dir}'."
+    )
+    return counts
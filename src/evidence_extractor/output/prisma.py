@@ -1,10 +1,89 @@
+import json
 import logging
 from datetime import datetime
+from typing import Dict, Iterable, Optional
 
-from evidence_extractor.models.schemas import ArticleExtraction
+from pydantic import BaseModel, Field
+
+from evidence_extractor.models.schemas import ArticleExtraction, ValidationStatus
+
+from .jsonl_corpus import record_key
 
 logger = logging.getLogger(__name__)
 
+REASON_EXTRACTION_FAILED = "Full text could not be extracted"
+REASON_MARKED_EXCLUDED = "Marked as excluded"
+REASON_PICO_REJECTED = "PICO rejected by reviewer"
+REASON_NO_EVIDENCE = "No PICO or claims extracted"
+
+
+class PrismaCounts(BaseModel):
+    identified: int = 0
+    duplicates: int = 0
+    screened: int = 0
+    excluded: int = 0
+    included: int = 0
+    exclusion_reasons: Dict[str, int] = Field(default_factory=dict)
+
+    def exclude(self, reason: str):
+        self.excluded += 1
+        self.exclusion_reasons[reason] = self.exclusion_reasons.get(reason, 0) + 1
+
+
+def exclusion_reason(extraction: ArticleExtraction) -> Optional[str]:
+    if extraction.records_excluded_count > 0:
+        return REASON_MARKED_EXCLUDED
+    pico = extraction.pico_elements
+    if (
+        pico is not None
+        and pico.correction_metadata.status == ValidationStatus.REJECTED
+    ):
+        # Reviewer comments are free text; bucketing on them would give every
+        # rejected record its own line in the report and box in the diagram.
+        return REASON_PICO_REJECTED
+    if pico is None and not extraction.claims:
+        return REASON_NO_EVIDENCE
+    return None
+
+
+def count_failed_documents(summary_path: str) -> int:
+    try:
+        with open(summary_path, "r", encoding="utf-8") as f:
+            summary = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read run summary '{summary_path}': {e}")
+        return 0
+    return sum(
+        1 for record in summary.get("documents", []) if record.get("status") != "ok"
+    )
+
+
+def tally_prisma(
+    extractions: Iterable[ArticleExtraction], failed_documents: int = 0
+) -> PrismaCounts:
+    counts = PrismaCounts(identified=failed_documents, screened=failed_documents)
+    for _ in range(failed_documents):
+        counts.exclude(REASON_EXTRACTION_FAILED)
+    seen = set()
+    for extraction in extractions:
+        counts.identified += 1
+        key = record_key(extraction)
+        if key in seen:
+            counts.duplicates += 1
+            continue
+        seen.add(key)
+        counts.screened += 1
+        reason = exclusion_reason(extraction)
+        if reason is None:
+            counts.included += 1
+        else:
+            counts.exclude(reason)
+    logger.info(
+        f"PRISMA tally: {counts.identified} identified, {counts.duplicates} "
+        f"duplicates, {counts.excluded} excluded, {counts.included} included."
+    )
+    return counts
+
 
 def generate_prisma_text_report(extraction: ArticleExtraction) -> str:
     logger.info("Generating PRISMA text report.")
@@ -54,6 +133,35 @@ def generate_prisma_text_report(extraction: ArticleExtraction) -> str:
     return "\n".join(report_lines)
 
 
+def generate_corpus_prisma_report(counts: PrismaCounts, source: str = "") -> str:
+    logger.info("Generating corpus PRISMA text report.")
+    now = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+    report_lines = [
+        "=" * 50,
+        "PRISMA-Style Extraction Report (Corpus)",
+        f"Generated on: {now}",
+        "=" * 50,
+    ]
+    if source:
+        report_lines.append(f"\nSource: {source}")
+    report_lines.append("\n--- Identification ---")
+    report_lines.append(f"Records identified: {counts.identified}")
+    report_lines.append(f"Duplicate records removed: {counts.duplicates}")
+    report_lines.append("\n--- Screening ---")
+    report_lines.append(f"Records screened: {counts.screened}")
+    report_lines.append(f"Records excluded: {counts.excluded}")
+    for reason, n in sorted(
+        counts.exclusion_reasons.items(), key=lambda item: (-item[1], item[0])
+    ):
+        report_lines.append(f"  - {reason}: {n}")
+    report_lines.append("\n--- Included ---")
+    report_lines.append(f"Studies included in synthesis: {counts.included}")
+    report_lines.append("\n" + "=" * 50)
+    report_lines.append("End of Report")
+    report_lines.append("=" * 50)
+    return "\n".join(report_lines)
+
+
 def save_prisma_report(report_content: str, output_path: str):
     logger.info(f"Saving PRISMA report to '{output_path}'...")
     try:
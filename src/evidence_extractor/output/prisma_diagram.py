@@ -1,14 +1,33 @@
 import logging
+from typing import Optional
 
 from graphviz import Digraph
 
 from evidence_extractor.models.schemas import ArticleExtraction
 
+from .prisma import PrismaCounts
+from .prisma_svg import save_prisma_svg
+
 logger = logging.getLogger(__name__)
 
+SINGLE_FILE_REASON = "N/A for single-file tool"
+
+DIAGRAM_RENDERERS = ("builtin", "graphviz")
+DIAGRAM_FORMATS = ("svg", "png")
+
+
+def single_article_counts(extraction: ArticleExtraction) -> PrismaCounts:
+    n_excluded = extraction.records_excluded_count
+    return PrismaCounts(
+        identified=1,
+        screened=1,
+        excluded=n_excluded,
+        included=1 - n_excluded,
+        exclusion_reasons={SINGLE_FILE_REASON: n_excluded} if n_excluded else {},
+    )
+
 
-def generate_prisma_diagram(extraction: ArticleExtraction, output_path: str):
-    logger.info(f"Generating PRISMA flow diagram at '{output_path}.png'")
+def build_prisma_digraph(counts: PrismaCounts) -> Digraph:
     dot = Digraph("PRISMA Flow Diagram")
     dot.attr("graph", rankdir="TB", splines="ortho", ranksep="0.6")
     dot.attr(
@@ -19,31 +38,65 @@ def generate_prisma_diagram(extraction: ArticleExtraction, output_path: str):
         fontname="helvetica",
     )
     dot.attr("edge", fontname="helvetica", fontsize="10")
-    n_identified = 1
-    n_screened = 1
-    n_excluded = extraction.records_excluded_count
-    n_included = n_screened - n_excluded
-    dot.node("identification", f"Records identified (n = {n_identified})")
-    dot.node("screening", f"Records screened (n = {n_screened})")
-    dot.node("included", f"Studies included in synthesis (n = {n_included})")
-    if n_excluded > 0:
+    dot.node("identification", f"Records identified (n = {counts.identified})")
+    dot.node("screening", f"Records screened (n = {counts.screened})")
+    dot.node("included", f"Studies included in synthesis (n = {counts.included})")
+    if counts.duplicates > 0:
         dot.node(
-            "excluded", f"Records excluded (n = {n_excluded})", fillcolor="lightcoral"
+            "duplicates",
+            f"Duplicate records removed (n = {counts.duplicates})",
+            fillcolor="lightgrey",
         )
+        dot.edge("identification", "duplicates")
     dot.edge("identification", "screening", arrowhead="none")
-    if n_excluded > 0:
-        dot.edge(
-            "screening",
+    if counts.excluded > 0:
+        reasons = "".join(
+            f"\\l{reason} (n = {n})"
+            for reason, n in sorted(
+                counts.exclusion_reasons.items(), key=lambda item: (-item[1], item[0])
+            )
+        )
+        dot.node(
             "excluded",
-            label="  Exclusion reason: N/A for single-file tool",
+            f"Records excluded (n = {counts.excluded}){reasons}\\l",
+            fillcolor="lightcoral",
         )
+        dot.edge("screening", "excluded")
     dot.edge("screening", "included", arrowhead="none")
+    return dot
+
 
+def render_prisma_diagram(
+    counts: PrismaCounts,
+    output_path: str,
+    renderer: str = "builtin",
+    image_format: str = "png",
+) -> Optional[str]:
+    image_path = f"{output_path}.{image_format}"
+    logger.info(f"Generating PRISMA flow diagram at '{image_path}'")
     try:
-        dot.render(output_path, format="png", cleanup=True)
+        if renderer == "graphviz":
+            build_prisma_digraph(counts).render(
+                output_path, format=image_format, cleanup=True
+            )
+        else:
+            save_prisma_svg(counts, image_path, image_format)
         logger.info("PRISMA diagram generated successfully.")
+        return image_path
     except Exception as e:
-        logger.error(
-            "Failed to generate PRISMA diagram. Is Graphviz installed on your "
-            f"system? Error: {e}"
+        hint = (
+            " Is Graphviz installed on your system?" if renderer == "graphviz" else ""
         )
+        logger.error(f"Failed to generate PRISMA diagram.{hint} Error: {e}")
+        return None
+
+
+def generate_prisma_diagram(
+    extraction: ArticleExtraction,
+    output_path: str,
+    renderer: str = "builtin",
+    image_format: str = "png",
+) -> Optional[str]:
+    return render_prisma_diagram(
+        single_article_counts(extraction), output_path, renderer, image_format
+    )
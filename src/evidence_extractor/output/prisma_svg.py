@@ -0,0 +1,146 @@
+import logging
+import math
+import textwrap
+from typing import List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+import fitz
+
+from .prisma import PrismaCounts
+
+logger = logging.getLogger(__name__)
+
+FONT_FAMILY = "Helvetica, Arial, sans-serif"
+FONT_SIZE = 14
+LINE_HEIGHT = 18
+CHAR_WIDTH = 7.8
+PADDING = 12
+MIN_BOX_WIDTH = 240
+MARGIN = 20
+GAP_X = 60
+GAP_Y = 40
+WRAP_CHARS = 48
+ARROW_SIZE = 9
+
+MAIN_FILL = "#f5f5f5"
+DUPLICATES_FILL = "#d3d3d3"
+EXCLUDED_FILL = "#f08080"
+
+
+def _box_size(lines: List[str]) -> Tuple[float, float]:
+    width = max(len(line) for line in lines) * CHAR_WIDTH + 2 * PADDING
+    return max(width, MIN_BOX_WIDTH), len(lines) * LINE_HEIGHT + 2 * PADDING
+
+
+def _box(
+    x: float, y: float, width: float, height: float, lines: List[str], fill: str
+) -> str:
+    centred = fill == MAIN_FILL
+    text_x = x + width / 2 if centred else x + PADDING
+    anchor = "middle" if centred else "start"
+    spans = "".join(
+        f'<tspan x="{text_x:.1f}" dy="{LINE_HEIGHT if i else 0}">{escape(line)}</tspan>'
+        for i, line in enumerate(lines)
+    )
+    baseline = y + PADDING + FONT_SIZE
+    return (
+        f'<rect x="{x:.1f}" y="{y:.1f}" width="{width:.1f}" height="{height:.1f}" '
+        f'rx="8" ry="8" fill="{fill}" stroke="#333333" stroke-width="1.2"/>'
+        f'<text x="{text_x:.1f}" y="{baseline:.1f}" text-anchor="{anchor}">'
+        f"{spans}</text>"
+    )
+
+
+def _arrow(x1: float, y1: float, x2: float, y2: float) -> str:
+    length = math.hypot(x2 - x1, y2 - y1) or 1.0
+    ux, uy = (x2 - x1) / length, (y2 - y1) / length
+    bx, by = x2 - ux * ARROW_SIZE, y2 - uy * ARROW_SIZE
+    half = ARROW_SIZE / 2
+    head = (
+        f"{x2:.1f},{y2:.1f} {bx - uy * half:.1f},{by + ux * half:.1f} "
+        f"{bx + uy * half:.1f},{by - ux * half:.1f}"
+    )
+    return (
+        f'<line x1="{x1:.1f}" y1="{y1:.1f}" x2="{bx:.1f}" y2="{by:.1f}" '
+        'stroke="#333333" stroke-width="1.2"/>'
+        f'<polygon points="{head}" fill="#333333"/>'
+    )
+
+
+def _excluded_lines(counts: PrismaCounts) -> List[str]:
+    lines = [f"Records excluded (n = {counts.excluded})"]
+    for reason, n in sorted(
+        counts.exclusion_reasons.items(), key=lambda item: (-item[1], item[0])
+    ):
+        wrapped = textwrap.wrap(f"{reason} (n = {n})", WRAP_CHARS)
+        lines.append(f"- {wrapped[0]}")
+        lines.extend(f"  {line}" for line in wrapped[1:])
+    return lines
+
+
+def render_prisma_svg(counts: PrismaCounts) -> str:
+    main = [
+        [f"Records identified (n = {counts.identified})"],
+        [f"Records screened (n = {counts.screened})"],
+        [f"Studies included in synthesis (n = {counts.included})"],
+    ]
+    side: List[Optional[Tuple[List[str], str]]] = [None, None, None]
+    if counts.duplicates > 0:
+        side[0] = (
+            [f"Duplicate records removed (n = {counts.duplicates})"],
+            DUPLICATES_FILL,
+        )
+    if counts.excluded > 0:
+        side[1] = (_excluded_lines(counts), EXCLUDED_FILL)
+
+    main_width = max(_box_size(lines)[0] for lines in main)
+    side_x = MARGIN + main_width + GAP_X
+    elements = []
+    right = MARGIN + main_width
+    y = MARGIN
+    previous_bottom = None
+    for lines, side_box in zip(main, side):
+        main_height = _box_size(lines)[1]
+        row_height = main_height
+        if side_box is not None:
+            side_width, side_height = _box_size(side_box[0])
+            row_height = max(main_height, side_height)
+        main_y = y + (row_height - main_height) / 2
+        centre_x = MARGIN + main_width / 2
+        if previous_bottom is not None:
+            elements.append(_arrow(centre_x, previous_bottom, centre_x, main_y))
+        elements.append(_box(MARGIN, main_y, main_width, main_height, lines, MAIN_FILL))
+        if side_box is not None:
+            side_y = y + (row_height - side_height) / 2
+            elements.append(_box(side_x, side_y, side_width, side_height, *side_box))
+            middle = main_y + main_height / 2
+            elements.append(_arrow(MARGIN + main_width, middle, side_x, middle))
+            right = max(right, side_x + side_width)
+        previous_bottom = main_y + main_height
+        y += row_height + GAP_Y
+
+    width = right + MARGIN
+    height = y - GAP_Y + MARGIN
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" '
+        f'width="{width:.0f}" height="{height:.0f}" '
+        f'viewBox="0 0 {width:.0f} {height:.0f}" '
+        f'font-family="{FONT_FAMILY}" font-size="{FONT_SIZE}">'
+        f'<rect width="{width:.0f}" height="{height:.0f}" fill="white"/>'
+        f"{''.join(elements)}</svg>"
+    )
+
+
+def svg_to_png(svg: str, output_path: str, zoom: float = 2.0):
+    with fitz.open(stream=svg.encode("utf-8"), filetype="svg") as doc:
+        pixmap = doc[0].get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+        pixmap.save(output_path)
+
+
+def save_prisma_svg(counts: PrismaCounts, output_path: str, image_format: str = "svg"):
+    svg = render_prisma_svg(counts)
+    if image_format == "png":
+        svg_to_png(svg, output_path)
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(svg)
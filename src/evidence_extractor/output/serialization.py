@@ -0,0 +1,153 @@
+import json
+import logging
+import typing
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from evidence_extractor.models.schemas import ArticleExtraction
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+MSGPACK_SUFFIXES = (".msgpack", ".mpk")
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_CONVERTERS: Dict[Any, Callable[[Any], Any]] = {}
+_FIELD_PLANS: Dict[type, Dict[str, Callable[[Any], Any]]] = {}
+
+
+def _msgpack() -> Any:
+    try:
+        import msgpack
+    except ImportError as e:
+        raise ImportError(
+            "The binary extraction format requires the 'msgpack' package. Install "
+            "it with 'pip install evidence_extractor[fast]'."
+        ) from e
+    return msgpack
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _parse_datetime(value: Any) -> Any:
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return value
+
+
+def _optional_of(inner: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def convert(value: Any) -> Any:
+        return None if value is None else inner(value)
+
+    return convert
+
+
+def _list_of(item: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def convert(value: Any) -> Any:
+        return [item(v) for v in value]
+
+    return convert
+
+
+def _dict_of(item: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def convert(value: Any) -> Any:
+        return {k: item(v) for k, v in value.items()}
+
+    return convert
+
+
+def _model_of(model_cls: type) -> Callable[[Any], Any]:
+    def convert(value: Any) -> Any:
+        return construct_trusted(model_cls, value)
+
+    return convert
+
+
+def _converter(annotation: Any) -> Callable[[Any], Any]:
+    if annotation in _CONVERTERS:
+        return _CONVERTERS[annotation]
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    converter: Callable[[Any], Any] = _identity
+    if origin is typing.Union:
+        members = [arg for arg in args if arg is not type(None)]
+        if len(members) == 1 and _converter(members[0]) is not _identity:
+            converter = _optional_of(_converter(members[0]))
+    elif origin is list and args and _converter(args[0]) is not _identity:
+        converter = _list_of(_converter(args[0]))
+    elif origin is dict and len(args) == 2 and _converter(args[1]) is not _identity:
+        converter = _dict_of(_converter(args[1]))
+    elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        converter = _model_of(annotation)
+    elif isinstance(annotation, type) and issubclass(annotation, Enum):
+        converter = annotation
+    elif annotation is datetime:
+        converter = _parse_datetime
+    _CONVERTERS[annotation] = converter
+    return converter
+
+
+def _field_plan(model_cls: type) -> Dict[str, Callable[[Any], Any]]:
+    plan = _FIELD_PLANS.get(model_cls)
+    if plan is None:
+        plan = {
+            name: _converter(field.annotation)
+            for name, field in model_cls.model_fields.items()
+        }
+        _FIELD_PLANS[model_cls] = plan
+    return plan
+
+
+def construct_trusted(model_cls: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+    values = {
+        name: convert(data[name])
+        for name, convert in _field_plan(model_cls).items()
+        if name in data
+    }
+    return model_cls.model_construct(**values)
+
+
+def is_binary_path(path: str) -> bool:
+    return Path(path).suffix.lower() in MSGPACK_SUFFIXES
+
+
+def dumps_extraction(
+    extraction: ArticleExtraction, indent: Optional[int] = None, binary: bool = False
+) -> bytes:
+    if binary:
+        return _msgpack().packb(extraction.model_dump(mode="json"), use_bin_type=True)
+    return extraction.model_dump_json(indent=indent).encode("utf-8")
+
+
+def loads_extraction(
+    raw: bytes, trusted: bool = False, binary: bool = False
+) -> ArticleExtraction:
+    if binary:
+        data = _msgpack().unpackb(raw, raw=False)
+    elif not trusted:
+        return ArticleExtraction.model_validate_json(raw)
+    else:
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    if trusted:
+        return construct_trusted(ArticleExtraction, data)
+    return ArticleExtraction.model_validate(data)
+
+
+def load_extraction(path: str, trusted: bool = False) -> Optional[ArticleExtraction]:
+    try:
+        raw = Path(path).read_bytes()
+        return loads_extraction(raw, trusted=trusted, binary=is_binary_path(path))
+    except Exception as e:
+        logger.error(f"Failed to load extraction from '{path}': {e}")
+        return None
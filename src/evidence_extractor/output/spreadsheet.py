@@ -1,7 +1,9 @@
 import logging
 import re
+from typing import Any, Iterable, List
 
 from openpyxl import Workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
 
 from evidence_extractor.models.schemas import ArticleExtraction
 
@@ -104,3 +106,124 @@ def export_to_excel(extraction: ArticleExtraction, output_path: str):
         logger.info(f"Successfully exported data to '{output_path}'.")
     except Exception as e:
         logger.error(f"An unexpected error occurred during Excel export: {e}")
+
+
+SUMMARY_HEADERS = [
+    "Source Filename",
+    "Title",
+    "Generated Summary",
+    "Population",
+    "Intervention",
+    "Comparison",
+    "Outcome",
+    "PICO Status",
+    "Quality Scores",
+    "Claims",
+    "Tables",
+    "Records Excluded",
+]
+CLAIM_HEADERS = [
+    "Source Filename",
+    "Claim Text",
+    "Uncertainty Annotation",
+    "Page Number",
+    "Validation Status",
+    "Reviewer Comment",
+]
+TABLE_HEADERS = [
+    "Source Filename",
+    "Table",
+    "Page Number",
+    "AI Summary",
+    "Row",
+    "Column",
+    "Value",
+]
+
+
+def _cell(value: Any) -> Any:
+    if isinstance(value, (list, dict)):
+        value = str(value)
+    if isinstance(value, str):
+        return ILLEGAL_CHARACTERS_RE.sub("", value)
+    return value
+
+
+def _summary_row(extraction: ArticleExtraction) -> List[Any]:
+    pico = extraction.pico_elements
+    scores = "; ".join(
+        f"{score.score_name}: {score.score_value}"
+        for score in extraction.quality_scores
+    )
+    return [
+        extraction.source_filename,
+        extraction.title,
+        extraction.summary,
+        pico.population if pico else None,
+        pico.intervention if pico else None,
+        pico.comparison if pico else None,
+        pico.outcome if pico else None,
+        pico.correction_metadata.status.value if pico else None,
+        scores or None,
+        len(extraction.claims),
+        len(extraction.tables),
+        extraction.records_excluded_count,
+    ]
+
+
+def export_corpus_to_excel(
+    extractions: Iterable[ArticleExtraction], output_path: str
+) -> int:
+    logger.info(f"Starting streaming corpus export to Excel file: '{output_path}'")
+    wb = Workbook(write_only=True)
+    ws_summary = wb.create_sheet("Summary")
+    ws_claims = wb.create_sheet("Claims")
+    ws_tables = wb.create_sheet("Tables")
+    ws_summary.append(SUMMARY_HEADERS)
+    ws_claims.append(CLAIM_HEADERS)
+    ws_tables.append(TABLE_HEADERS)
+    count = 0
+    # Errors propagate: a partially read corpus must not look like a finished
+    # export, and nothing is written unless every article was read.
+    try:
+        for extraction in extractions:
+            source = extraction.source_filename
+            ws_summary.append([_cell(value) for value in _summary_row(extraction)])
+            for claim in extraction.claims:
+                ws_claims.append(
+                    [
+                        _cell(source),
+                        _cell(claim.claim_text),
+                        _cell(claim.uncertainty_annotation),
+                        claim.provenance.page_number,
+                        claim.correction_metadata.status.value,
+                        _cell(claim.correction_metadata.reviewer_comment),
+                    ]
+                )
+            for i, table in enumerate(extraction.tables):
+                prefix = [
+                    _cell(source),
+                    i + 1,
+                    table.provenance.page_number,
+                    _cell(table.summary),
+                ]
+                if not table.table_data:
+                    ws_tables.append(prefix)
+                for row_number, row_dict in enumerate(table.table_data, start=1):
+                    for column, value in row_dict.items():
+                        ws_tables.append(
+                            prefix + [row_number, _cell(column), _cell(value)]
+                        )
+            count += 1
+        wb.save(output_path)
+        logger.info(f"Successfully exported {count} articles to '{output_path}'.")
+    except Exception as e:
+        logger.error(
+            f"Corpus Excel export failed after {count} articles; "
+            f"'{output_path}' was not written: {e}"
+        )
+        # Finish the write-only sheets so their temporary files are released.
+        for worksheet in (ws_summary, ws_claims, ws_tables):
+            worksheet.close()
+        raise
+    return count
@@ -0,0 +1,17 @@
+from .batch import collect_pdf_paths, run_batch
+from .dag import PipelineReport, Stage, StageResult, StageStatus, run_stages
+from .runner import run_extraction, run_pipeline
+from .update import run_update
+
+__all__ = [
+    "collect_pdf_paths",
+    "run_batch",
+    "PipelineReport",
+    "Stage",
+    "StageResult",
+    "StageStatus",
+    "run_stages",
+    "run_extraction",
+    "run_pipeline",
+    "run_update",
+]
@@ -0,0 +1,235 @@
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from evidence_extractor.integration.gemini_client import GeminiClient
+from evidence_extractor.output.json_builder import save_to_json_atomic
+from evidence_extractor.output.jsonl_corpus import CorpusWriter, record_key
+from evidence_extractor.output.serialization import load_extraction, loads_extraction
+from evidence_extractor.storage.corpus_store import CorpusStore
+
+from .checkpoints import discard_checkpoints
+from .dag import PipelineReport, StageStatus
+from .runner import run_pipeline
+
+logger = logging.getLogger(__name__)
+
+RUN_SUMMARY_FILENAME = "run_summary.json"
+CHECKPOINT_DIRNAME = ".checkpoints"
+
+_WORKER_CLIENT: Optional[GeminiClient] = None
+
+
+def collect_pdf_paths(source: str, recursive: bool = False) -> List[Path]:
+    source_path = Path(source)
+    if source_path.is_dir():
+        pattern = "**/*" if recursive else "*"
+        return sorted(
+            path
+            for path in source_path.glob(pattern)
+            if path.is_file() and path.suffix.lower() == ".pdf"
+        )
+    pdf_paths = []
+    with open(source_path, "r", encoding="utf-8") as f:
+        for line in f:
+            entry = line.strip()
+            if not entry or entry.startswith("#"):
+                continue
+            path = Path(entry)
+            if not path.is_absolute():
+                path = source_path.parent / path
+            pdf_paths.append(path.resolve())
+    return pdf_paths
+
+
+def output_path_for(pdf_path: Path, root: Optional[Path], output_dir: Path) -> Path:
+    try:
+        relative = pdf_path.relative_to(root) if root else None
+    except ValueError:
+        relative = None
+    if relative is not None:
+        name = "__".join(relative.with_suffix("").parts)
+    else:
+        # Manifest entries share no root, so same-named files from different
+        # directories are told apart by a short hash of their resolved path.
+        digest = hashlib.sha1(str(Path(pdf_path).resolve()).encode("utf-8"))
+        name = f"{pdf_path.stem}-{digest.hexdigest()[:8]}"
+    return output_dir / f"{name}.json"
+
+
+def make_request_semaphore(llm_concurrency: Optional[int]) -> Optional[Any]:
+    if not llm_concurrency:
+        return None
+    return multiprocessing.BoundedSemaphore(llm_concurrency)
+
+
+def _init_worker(request_semaphore: Optional[Any] = None):
+    global _WORKER_CLIENT
+    _WORKER_CLIENT = GeminiClient(request_semaphore=request_semaphore)
+    if not _WORKER_CLIENT.is_configured():
+        logger.warning("Gemini client not configured in batch worker.")
+
+
+def completed_cleanly(report: PipelineReport) -> bool:
+    return all(result.status == StageStatus.OK for result in report.stages.values())
+
+
+def process_document(
+    pdf_path: str,
+    output_path: Optional[str],
+    pipeline_options: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    if _WORKER_CLIENT is None:
+        _init_worker()
+    start = time.perf_counter()
+    record: Dict[str, Any] = {
+        "pdf_path": pdf_path,
+        "output_path": output_path,
+        "status": "failed",
+        "error": None,
+    }
+    try:
+        outcome = run_pipeline(pdf_path, _WORKER_CLIENT, **(pipeline_options or {}))
+        if outcome is None:
+            record["error"] = "Document could not be ingested or contained no text."
+        else:
+            extraction, report = outcome
+            checkpoint_root = (pipeline_options or {}).get("checkpoint_root")
+            if output_path:
+                save_to_json_atomic(extraction, output_path, indent=None)
+                # Failed stages keep their siblings' checkpoints for --resume.
+                if completed_cleanly(report):
+                    discard_checkpoints(checkpoint_root, extraction.document_hash)
+            else:
+                record["extraction"] = extraction.model_dump_json()
+                record["key"] = record_key(extraction)
+                if completed_cleanly(report):
+                    record["document_hash"] = extraction.document_hash
+            record["status"] = "ok"
+            record["claims"] = len(extraction.claims)
+            record["stages"] = report.stage_seconds()
+            record["resumed_stages"] = [
+                name for name, result in report.stages.items() if result.from_checkpoint
+            ]
+            record["critical_path"] = report.critical_path
+    except Exception as e:
+        logger.error(f"Extraction failed for '{pdf_path}': {e}")
+        record["error"] = str(e)
+    record["seconds"] = round(time.perf_counter() - start, 3)
+    return record
+
+
+def run_batch(
+    pdf_paths: List[Path],
+    output_dir: str,
+    workers: int = 1,
+    llm_concurrency: Optional[int] = None,
+    root: Optional[Path] = None,
+    pipeline_options: Optional[Dict[str, Any]] = None,
+    corpus_path: Optional[str] = None,
+    store_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    output_root = Path(output_dir)
+    output_root.mkdir(parents=True, exist_ok=True)
+    jobs = [
+        (
+            str(pdf_path),
+            None if corpus_path else str(output_path_for(pdf_path, root, output_root)),
+        )
+        for pdf_path in pdf_paths
+    ]
+    records: List[Dict[str, Any]] = []
+    corpus = CorpusWriter(corpus_path) if corpus_path else None
+    store = CorpusStore(store_path) if store_path else None
+
+    def collect(record: Dict[str, Any]):
+        extraction_json = record.pop("extraction", None)
+        key = record.pop("key", None)
+        doc_hash = record.pop("document_hash", None)
+        if corpus is not None and extraction_json is not None:
+            corpus.append_json(key, extraction_json)
+            record["output_path"] = corpus_path
+            discard_checkpoints(
+                (pipeline_options or {}).get("checkpoint_root"), doc_hash
+            )
+        if store is not None and record["status"] == "ok":
+            extraction = (
+                loads_extraction(extraction_json.encode("utf-8"))
+                if extraction_json is not None
+                else load_extraction(record["output_path"])
+            )
+            if extraction is not None:
+                store.upsert(extraction)
+        records.append(record)
+
+    logger.info(f"Starting batch of {len(jobs)} documents with {workers} worker(s).")
+    started_at = datetime.utcnow()
+    start = time.perf_counter()
+    semaphore = make_request_semaphore(llm_concurrency)
+
+    if workers <= 1:
+        _init_worker(semaphore)
+        for pdf_path, output_path in jobs:
+            collect(process_document(pdf_path, output_path, pipeline_options))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(semaphore,)
+        ) as pool:
+            futures = {
+                pool.submit(
+                    process_document, pdf_path, output_path, pipeline_options
+                ): pdf_path
+                for pdf_path, output_path in jobs
+            }
+            for future in as_completed(futures):
+                try:
+                    collect(future.result())
+                except Exception as e:
+                    logger.error(f"Worker crashed while processing document: {e}")
+                    records.append(
+                        {
+                            "pdf_path": futures[future],
+                            "output_path": None,
+                            "status": "failed",
+                            "error": str(e),
+                            "seconds": None,
+                        }
+                    )
+
+    if corpus is not None:
+        corpus.close()
+    if store is not None:
+        store.close()
+    order = {pdf_path: i for i, (pdf_path, _) in enumerate(jobs)}
+    records.sort(key=lambda record: order.get(record["pdf_path"], len(order)))
+    succeeded = sum(1 for record in records if record["status"] == "ok")
+    summary = {
+        "started_at": started_at.isoformat(),
+        "finished_at": datetime.utcnow().isoformat(),
+        "total_seconds": round(time.perf_counter() - start, 3),
+        "workers": workers,
+        "llm_concurrency": llm_concurrency,
+        "documents_total": len(records),
+        "documents_succeeded": succeeded,
+        "documents_failed": len(records) - succeeded,
+        "documents": records,
+    }
+    summary_path = output_root / RUN_SUMMARY_FILENAME
+    with open(summary_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    logger.info(
+        f"Batch complete: {succeeded}/{len(records)} succeeded. "
+        f"Summary written to '{summary_path}'."
+    )
+    return summary
+
+
+def default_worker_count() -> int:
+    return max(1, min(4, os.cpu_count() or 1))
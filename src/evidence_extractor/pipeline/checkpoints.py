@@ -0,0 +1,113 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_SUFFIX = ".json"
+DOCUMENT_HASH_LENGTH = 16
+
+
+def document_hash(pdf_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(pdf_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def checkpoint_dir_for(root: str, pdf_path: str) -> Path:
+    return Path(root) / document_hash(pdf_path)[:DOCUMENT_HASH_LENGTH]
+
+
+def discard_checkpoints(root: Optional[str], doc_hash: Optional[str]):
+    if not root or not doc_hash:
+        return
+    directory = Path(root) / doc_hash[:DOCUMENT_HASH_LENGTH]
+    if directory.is_dir():
+        shutil.rmtree(directory, ignore_errors=True)
+        logger.debug(f"Removed checkpoints in '{directory}'.")
+
+
+def write_json_atomic(path: Path, payload: Any):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class CheckpointStore:
+    def __init__(self, directory: str, source_filename: Optional[str] = None):
+        self.directory = Path(directory)
+        self.source_filename = source_filename
+        self._adapters: Dict[Any, TypeAdapter] = {}
+
+    def _adapter(self, output_type: Any) -> TypeAdapter:
+        if output_type not in self._adapters:
+            self._adapters[output_type] = TypeAdapter(output_type)
+        return self._adapters[output_type]
+
+    def path_for(self, stage_name: str) -> Path:
+        return self.directory / f"{stage_name}{CHECKPOINT_SUFFIX}"
+
+    def completed_stages(self) -> List[str]:
+        if not self.directory.is_dir():
+            return []
+        return sorted(
+            path.stem
+            for path in self.directory.glob(f"*{CHECKPOINT_SUFFIX}")
+            if not path.name.startswith(".")
+        )
+
+    def save(self, stage: Any, output: Any):
+        adapter = self._adapter(stage.output_type)
+        record = {
+            "stage": stage.name,
+            "fingerprint": getattr(stage, "fingerprint", None),
+            "source_filename": self.source_filename,
+            "saved_at": datetime.utcnow().isoformat(),
+            "output": adapter.dump_python(output, mode="json"),
+        }
+        write_json_atomic(self.path_for(stage.name), record)
+        logger.debug(f"Checkpointed stage '{stage.name}' to '{self.directory}'.")
+
+    def load(self, stage: Any) -> Tuple[bool, Any]:
+        path = self.path_for(stage.name)
+        if not path.exists():
+            return False, None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+            fingerprint = getattr(stage, "fingerprint", None)
+            if fingerprint and record.get("fingerprint") != fingerprint:
+                logger.info(
+                    f"Ignoring stale checkpoint for stage '{stage.name}'; "
+                    "its inputs have changed."
+                )
+                return False, None
+            output = self._adapter(stage.output_type).validate_python(record["output"])
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable checkpoint '{path}': {e}")
+            return False, None
+        logger.info(f"Resuming stage '{stage.name}' from checkpoint.")
+        return True, output
+
+    def clear(self):
+        for path in self.directory.glob(f"*{CHECKPOINT_SUFFIX}"):
+            path.unlink()
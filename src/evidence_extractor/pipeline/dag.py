@@ -0,0 +1,295 @@
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+
+class StageStatus(str, Enum):
+    RUNNING = "running"
+    OK = "ok"
+    FAILED = "failed"
+    TIMEOUT = "timeout"
+    SKIPPED = "skipped"
+
+
+class StageCancelled(RuntimeError):
+    pass
+
+
+# A timed-out stage cannot be killed from outside its thread. Instead its
+# cancel_event is set, and the stage is expected to check it (for example before
+# each LLM request) and stop; run_stages waits for it before returning.
+class Stage:
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Any],
+        depends_on: Iterable[str] = (),
+        timeout: Optional[float] = None,
+        output_type: Any = Any,
+        checkpoint: bool = True,
+    ):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+        self.timeout = timeout
+        self.output_type = output_type
+        self.checkpoint = checkpoint
+        self.fingerprint: Optional[str] = None
+        self.cancel_event = threading.Event()
+
+    def check_cancelled(self):
+        if self.cancel_event.is_set():
+            raise StageCancelled(f"Stage '{self.name}' was cancelled.")
+
+
+class StageResult(BaseModel):
+    name: str
+    status: StageStatus
+    started_at: Optional[float] = Field(None)
+    finished_at: Optional[float] = Field(None)
+    error: Optional[str] = Field(None)
+    from_checkpoint: bool = Field(False)
+    reused: bool = Field(False)
+    output: Any = Field(None, exclude=True)
+
+    @property
+    def duration(self) -> float:
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+
+class PipelineReport(BaseModel):
+    stages: Dict[str, StageResult] = Field(default_factory=dict)
+    wall_seconds: float = Field(0.0)
+    critical_path: List[str] = Field(default_factory=list)
+    critical_path_seconds: float = Field(0.0)
+
+    def output(self, name: str, default: Any = None) -> Any:
+        result = self.stages.get(name)
+        if result is None or result.status != StageStatus.OK:
+            return default
+        return result.output
+
+    def stage_seconds(self) -> Dict[str, float]:
+        return {name: round(result.duration, 3) for name, result in self.stages.items()}
+
+
+def topological_order(stages: List[Stage]) -> List[Stage]:
+    by_name: Dict[str, Stage] = {}
+    for stage in stages:
+        if stage.name in by_name:
+            raise ValueError(f"Duplicate stage name '{stage.name}'.")
+        by_name[stage.name] = stage
+    for stage in stages:
+        for dependency in stage.depends_on:
+            if dependency not in by_name:
+                raise ValueError(
+                    f"Stage '{stage.name}' depends on unknown stage '{dependency}'."
+                )
+
+    ordered: List[Stage] = []
+    state: Dict[str, int] = {}
+
+    def visit(stage: Stage, trail: List[str]):
+        if state.get(stage.name) == 2:
+            return
+        if state.get(stage.name) == 1:
+            cycle = " -> ".join(trail + [stage.name])
+            raise ValueError(f"Stage graph contains a cycle: {cycle}.")
+        state[stage.name] = 1
+        for dependency in stage.depends_on:
+            visit(by_name[dependency], trail + [stage.name])
+        state[stage.name] = 2
+        ordered.append(stage)
+
+    for stage in stages:
+        visit(stage, [])
+    return ordered
+
+
+def critical_path(ordered: List[Stage], results: Dict[str, StageResult]) -> List[str]:
+    path_seconds: Dict[str, float] = {}
+    previous: Dict[str, Optional[str]] = {}
+    for stage in ordered:
+        result = results.get(stage.name)
+        duration = result.duration if result else 0.0
+        best_dependency = max(
+            stage.depends_on, key=lambda name: path_seconds[name], default=None
+        )
+        path_seconds[stage.name] = duration + (
+            path_seconds[best_dependency] if best_dependency else 0.0
+        )
+        previous[stage.name] = best_dependency
+    if not path_seconds:
+        return []
+    name: Optional[str] = max(path_seconds, key=lambda stage: path_seconds[stage])
+    path = []
+    while name is not None:
+        path.append(name)
+        name = previous[name]
+    return list(reversed(path))
+
+
+def run_stages(
+    stages: List[Stage],
+    max_workers: Optional[int] = None,
+    checkpoints: Optional[Any] = None,
+    resume: bool = False,
+    precomputed: Optional[Dict[str, Any]] = None,
+) -> PipelineReport:
+    ordered = topological_order(stages)
+    results: Dict[str, StageResult] = {}
+    pending = {stage.name: stage for stage in ordered}
+    running: Dict[Future, Stage] = {}
+    deadlines: Dict[Future, float] = {}
+    abandoned: List[Stage] = []
+    origin = time.perf_counter()
+    for stage in ordered:
+        stage.cancel_event.clear()
+
+    def clock() -> float:
+        return time.perf_counter() - origin
+
+    def finish(
+        stage: Stage,
+        status: StageStatus,
+        output: Any = None,
+        error: Optional[str] = None,
+    ):
+        result = results.get(stage.name) or StageResult(name=stage.name, status=status)
+        result.status = status
+        result.output = output
+        result.error = error
+        result.finished_at = clock()
+        results[stage.name] = result
+        if status != StageStatus.OK:
+            logger.warning(f"Stage '{stage.name}' ended with status '{status.value}'.")
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers or max(1, len(ordered)),
+        thread_name_prefix="stage",
+    )
+    try:
+        while pending or running:
+            for name in list(pending):
+                stage = pending[name]
+                dependency_states = [
+                    results[d].status if d in results else StageStatus.RUNNING
+                    for d in stage.depends_on
+                ]
+                if any(
+                    s not in (StageStatus.RUNNING, StageStatus.OK)
+                    for s in dependency_states
+                ):
+                    del pending[name]
+                    results[name] = StageResult(
+                        name=name,
+                        status=StageStatus.SKIPPED,
+                        error="An upstream stage did not complete.",
+                    )
+                    logger.warning(f"Skipping stage '{name}'; a dependency failed.")
+                    continue
+                if StageStatus.RUNNING in dependency_states:
+                    continue
+                del pending[name]
+                if precomputed and name in precomputed:
+                    now = clock()
+                    results[name] = StageResult(
+                        name=name,
+                        status=StageStatus.OK,
+                        started_at=now,
+                        finished_at=now,
+                        reused=True,
+                        output=precomputed[name],
+                    )
+                    logger.debug(f"Reusing previous output for stage '{name}'.")
+                    continue
+                if checkpoints is not None and resume and stage.checkpoint:
+                    found, output = checkpoints.load(stage)
+                    if found:
+                        now = clock()
+                        results[name] = StageResult(
+                            name=name,
+                            status=StageStatus.OK,
+                            started_at=now,
+                            finished_at=now,
+                            from_checkpoint=True,
+                            output=output,
+                        )
+                        continue
+                inputs = {d: results[d].output for d in stage.depends_on}
+                results[name] = StageResult(
+                    name=name, status=StageStatus.RUNNING, started_at=clock()
+                )
+                logger.debug(f"Starting stage '{name}'.")
+                future = executor.submit(stage.func, inputs)
+                running[future] = stage
+                if stage.timeout:
+                    deadlines[future] = time.perf_counter() + stage.timeout
+            if not running:
+                continue
+
+            wait_timeout = None
+            if deadlines:
+                wait_timeout = max(0.0, min(deadlines.values()) - time.perf_counter())
+            done, _ = wait(
+                list(running), timeout=wait_timeout, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                stage = running.pop(future)
+                deadlines.pop(future, None)
+                try:
+                    output = future.result()
+                except Exception as e:
+                    logger.error(f"Stage '{stage.name}' raised an error: {e}")
+                    finish(stage, StageStatus.FAILED, error=str(e))
+                    continue
+                finish(stage, StageStatus.OK, output=output)
+                if checkpoints is not None and stage.checkpoint:
+                    try:
+                        checkpoints.save(stage, output)
+                    except Exception as e:
+                        logger.error(f"Could not checkpoint stage '{stage.name}': {e}")
+            now = time.perf_counter()
+            for future, deadline in list(deadlines.items()):
+                if deadline <= now and future in running:
+                    stage = running.pop(future)
+                    del deadlines[future]
+                    stage.cancel_event.set()
+                    if not future.cancel():
+                        abandoned.append(stage)
+                    finish(
+                        stage,
+                        StageStatus.TIMEOUT,
+                        error=f"Stage exceeded its {stage.timeout:g}s timeout.",
+                    )
+    finally:
+        for stage in ordered:
+            stage.cancel_event.set()
+        if abandoned or running:
+            names = ", ".join(s.name for s in abandoned + list(running.values()))
+            logger.warning(f"Waiting for cancelled stage(s) to stop: {names}.")
+        # Stages may still hold the caller's document or client, so they must
+        # finish before the caller tears those down.
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    path = critical_path(ordered, results)
+    report = PipelineReport(
+        stages={stage.name: results[stage.name] for stage in ordered},
+        wall_seconds=round(clock(), 3),
+        critical_path=path,
+        critical_path_seconds=round(sum(results[n].duration for n in path), 3),
+    )
+    logger.info(
+        f"Pipeline finished in {report.wall_seconds:.2f}s; critical path "
+        f"{' -> '.join(path)} ({report.critical_path_seconds:.2f}s)."
+    )
+    return report
@@ -0,0 +1,50 @@
+import hashlib
+import json
+import logging
+from typing import Dict, List, Mapping, Sequence
+
+from evidence_extractor import __version__
+
+logger = logging.getLogger(__name__)
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def compute_fingerprints(
+    dependencies: Mapping[str, Sequence[str]],
+    fingerprint_parts: Mapping[str, Sequence[str]],
+    document_hash: str,
+) -> Dict[str, str]:
+    fingerprints: Dict[str, str] = {}
+
+    def visit(name: str, trail: List[str]) -> str:
+        if name in fingerprints:
+            return fingerprints[name]
+        if name in trail:
+            raise ValueError(f"Stage graph contains a cycle: {' -> '.join(trail)}.")
+        upstream = {
+            dependency: visit(dependency, trail + [name])
+            for dependency in sorted(dependencies.get(name, ()))
+        }
+        basis = json.dumps(
+            {
+                "stage": name,
+                "document": document_hash,
+                "package_version": __version__,
+                "parts": list(fingerprint_parts.get(name, ())),
+                "upstream": upstream,
+            },
+            sort_keys=True,
+        )
+        fingerprints[name] = hashlib.sha256(basis.encode("utf-8")).hexdigest()[:24]
+        return fingerprints[name]
+
+    for name in dependencies:
+        visit(name, [])
+    return fingerprints
+
+
+def stale_stages(current: Mapping[str, str], recorded: Mapping[str, str]) -> List[str]:
+    return [name for name, value in current.items() if recorded.get(name) != value]
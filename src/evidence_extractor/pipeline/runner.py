@@ -0,0 +1,434 @@
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import fitz
+
+from evidence_extractor.core.ingest import ingest_pdf
+from evidence_extractor.core.preprocess import (
+    clean_and_consolidate_text,
+    extract_text_from_doc,
+)
+from evidence_extractor.core.provenance import find_claim_provenance
+from evidence_extractor.extraction.citations import (
+    build_citation_index,
+    find_references_section,
+    parse_bibliography,
+)
+from evidence_extractor.extraction.figures import extract_figures_and_captions
+from evidence_extractor.extraction.llm_orchestrator import orchestrate_llm_extraction
+from evidence_extractor.extraction.prompts import (
+    FIGURE_CAPTION_PROMPT,
+    ORCHESTRATION_PROMPT,
+    SUMMARY_PROMPT,
+    TABLE_PARSING_PROMPT,
+    UNCERTAINTY_PROMPT,
+)
+from evidence_extractor.extraction.summarization import generate_summary
+from evidence_extractor.extraction.tables import extract_tables_with_llm
+from evidence_extractor.extraction.uncertainty import annotate_claims_in_batch
+from evidence_extractor.integration.gemini_client import GeminiClient
+from evidence_extractor.models.schemas import (
+    PICO,
+    ArticleExtraction,
+    BibliographyItem,
+    Claim,
+    ExtractedFigure,
+    ExtractedTable,
+    Provenance,
+    QualityScore,
+)
+from evidence_extractor.storage.reference_store import ReferenceStore
+
+from .checkpoints import DOCUMENT_HASH_LENGTH, CheckpointStore, document_hash
+from .dag import PipelineReport, Stage, StageStatus, run_stages
+from .fingerprints import compute_fingerprints, text_hash
+
+logger = logging.getLogger(__name__)
+
+LLM_TEXT_LIMIT = 16000
+
+# PyMuPDF is not thread-safe, even across different documents, so every fitz call
+# made by pipelines running in the same process is serialised on this lock. LLM
+# requests happen outside it and still overlap.
+FITZ_LOCK = threading.Lock()
+
+STAGE_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    "orchestrator": (),
+    "claims": ("orchestrator",),
+    "uncertainty": ("claims",),
+    "summary": ("claims",),
+    "figures": (),
+    "tables": (),
+    "bibliography": (),
+    "citations": ("claims", "bibliography"),
+}
+
+# Bump a stage's version whenever its code changes in a way that alters output.
+STAGE_CODE_VERSIONS: Dict[str, int] = {name: 1 for name in STAGE_DEPENDENCIES}
+
+LLM_STAGES = ("orchestrator", "uncertainty", "summary", "figures", "tables")
+
+
+def client_dependent_stages() -> List[str]:
+    dependent = set(LLM_STAGES)
+    for name in STAGE_DEPENDENCIES:
+        pending = list(STAGE_DEPENDENCIES[name])
+        while pending:
+            upstream = pending.pop()
+            if upstream in LLM_STAGES:
+                dependent.add(name)
+                break
+            pending.extend(STAGE_DEPENDENCIES[upstream])
+    return [name for name in STAGE_DEPENDENCIES if name in dependent]
+
+
+# Stages whose outputs can be rebuilt from a saved ArticleExtraction. The others
+# are cheap and deterministic, so they are always recomputed during an update.
+REUSABLE_STAGES = (
+    "orchestrator",
+    "claims",
+    "uncertainty",
+    "summary",
+    "figures",
+    "tables",
+)
+
+
+def stage_fingerprint_parts(gemini_client: GeminiClient) -> Dict[str, List[str]]:
+    configured = gemini_client.is_configured()
+    text_model = str(gemini_client.text_model_name) if configured else "unconfigured"
+    vision_model = (
+        str(gemini_client.vision_model_name) if configured else "unconfigured"
+    )
+    parts = {
+        "orchestrator": [
+            text_model,
+            text_hash(ORCHESTRATION_PROMPT),
+            str(LLM_TEXT_LIMIT),
+        ],
+        "claims": [],
+        "uncertainty": [text_model, text_hash(UNCERTAINTY_PROMPT)],
+        "summary": [text_model, text_hash(SUMMARY_PROMPT)],
+        "figures": [vision_model, text_hash(FIGURE_CAPTION_PROMPT)],
+        "tables": [vision_model, text_hash(TABLE_PARSING_PROMPT)],
+        "bibliography": [],
+        "citations": [],
+    }
+    for name, version in STAGE_CODE_VERSIONS.items():
+        parts[name].append(f"v{version}")
+    return parts
+
+
+def extraction_fingerprints(
+    doc_hash: str, gemini_client: GeminiClient
+) -> Dict[str, str]:
+    return compute_fingerprints(
+        STAGE_DEPENDENCIES, stage_fingerprint_parts(gemini_client), doc_hash
+    )
+
+
+def reusable_outputs(extraction: ArticleExtraction) -> Dict[str, Any]:
+    quality = extraction.quality_scores[0] if extraction.quality_scores else None
+    return {
+        "orchestrator": {
+            "pico": (
+                extraction.pico_elements.model_dump(mode="json")
+                if extraction.pico_elements
+                else None
+            ),
+            "quality": quality.model_dump(mode="json") if quality else None,
+            "claims": [{"claim_text": c.claim_text} for c in extraction.claims],
+        },
+        "claims": [claim.model_copy(deep=True) for claim in extraction.claims],
+        "uncertainty": [claim.uncertainty_annotation for claim in extraction.claims],
+        "summary": extraction.summary,
+        "figures": list(extraction.figures),
+        "tables": list(extraction.tables),
+    }
+
+
+class CancellableClient:
+    def __init__(self, client: GeminiClient, stage: Stage):
+        self._client = client
+        self._stage = stage
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    def query(self, prompt: str) -> Optional[str]:
+        self._stage.check_cancelled()
+        return self._client.query(prompt)
+
+    def query_with_image(self, prompt: str, image: Any) -> Optional[str]:
+        self._stage.check_cancelled()
+        return self._client.query_with_image(prompt, image)
+
+
+def build_extraction_stages(
+    pdf_path: str,
+    document: fitz.Document,
+    pages_text: Dict[int, str],
+    text_with_newlines: str,
+    cleaned_text: str,
+    gemini_client: GeminiClient,
+    document_lock: Any,
+    stage_timeout: Optional[float] = None,
+) -> List[Stage]:
+    # Filled in once the stages exist; each LLM call checks its stage's cancel
+    # event first, so a timed-out stage stops before spending another request.
+    clients: Dict[str, CancellableClient] = {}
+
+    def orchestrator(_: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if not gemini_client.is_configured():
+            return None
+        llm_payload = orchestrate_llm_extraction(
+            clients["orchestrator"], cleaned_text[:LLM_TEXT_LIMIT]
+        )
+        if llm_payload is None:
+            raise RuntimeError("Orchestrated LLM extraction returned no usable data.")
+        return llm_payload
+
+    def claims(inputs: Dict[str, Any]) -> List[Claim]:
+        llm_payload = inputs["orchestrator"] or {}
+        extracted_claims = []
+        for item in llm_payload.get("claims", []) or []:
+            text = item.get("claim_text")
+            if text:
+                page_num = find_claim_provenance(text, pages_text)
+                provenance = Provenance(source_filename=pdf_path, page_number=page_num)
+                extracted_claims.append(Claim(claim_text=text, provenance=provenance))
+        return extracted_claims
+
+    def uncertainty(inputs: Dict[str, Any]) -> List[Optional[str]]:
+        annotated = [claim.model_copy(deep=True) for claim in inputs["claims"]]
+        if not annotated or not gemini_client.is_configured():
+            return [None] * len(annotated)
+        annotate_claims_in_batch(clients["uncertainty"], annotated)
+        annotations = [claim.uncertainty_annotation for claim in annotated]
+        if not any(annotations):
+            raise RuntimeError("Uncertainty annotation returned no usable data.")
+        return annotations
+
+    def summary(inputs: Dict[str, Any]) -> Optional[str]:
+        if not inputs["claims"] or not gemini_client.is_configured():
+            return None
+        summary_text = generate_summary(clients["summary"], inputs["claims"])
+        if summary_text is None:
+            raise RuntimeError("Summary generation returned no usable data.")
+        return summary_text
+
+    def figures(_: Dict[str, Any]):
+        if not gemini_client.is_configured():
+            return []
+        return extract_figures_and_captions(document, clients["figures"], document_lock)
+
+    def tables(_: Dict[str, Any]):
+        if not gemini_client.is_configured():
+            logger.warning(
+                "Skipping advanced table extraction as Gemini client is not configured."
+            )
+            return []
+        return extract_tables_with_llm(document, clients["tables"], document_lock)
+
+    def bibliography(_: Dict[str, Any]) -> Tuple[Dict[str, BibliographyItem], int]:
+        refs_tuple = find_references_section(text_with_newlines)
+        if not refs_tuple:
+            return {}, len(text_with_newlines)
+        refs_text, start_idx = refs_tuple
+        return parse_bibliography(refs_text), start_idx
+
+    def citations(inputs: Dict[str, Any]) -> List[List[str]]:
+        entries, body_end = inputs["bibliography"]
+        if not entries or not inputs["claims"]:
+            return [[] for _ in inputs["claims"]]
+        body_text = text_with_newlines[:body_end]
+        index = build_citation_index(body_text, entries)
+        return [index.keys_for_text(claim.claim_text) for claim in inputs["claims"]]
+
+    stages = [
+        Stage(
+            "orchestrator",
+            orchestrator,
+            timeout=stage_timeout,
+            output_type=Optional[Dict[str, Any]],
+        ),
+        Stage(
+            "claims",
+            claims,
+            STAGE_DEPENDENCIES["claims"],
+            timeout=stage_timeout,
+            output_type=List[Claim],
+        ),
+        Stage(
+            "uncertainty",
+            uncertainty,
+            STAGE_DEPENDENCIES["uncertainty"],
+            timeout=stage_timeout,
+            output_type=List[Optional[str]],
+        ),
+        Stage(
+            "summary",
+            summary,
+            STAGE_DEPENDENCIES["summary"],
+            timeout=stage_timeout,
+            output_type=Optional[str],
+        ),
+        Stage(
+            "figures",
+            figures,
+            timeout=stage_timeout,
+            output_type=List[ExtractedFigure],
+        ),
+        Stage(
+            "tables",
+            tables,
+            timeout=stage_timeout,
+            output_type=List[ExtractedTable],
+        ),
+        Stage(
+            "bibliography",
+            bibliography,
+            timeout=stage_timeout,
+            output_type=Tuple[Dict[str, BibliographyItem], int],
+        ),
+        Stage(
+            "citations",
+            citations,
+            STAGE_DEPENDENCIES["citations"],
+            timeout=stage_timeout,
+            output_type=List[List[str]],
+        ),
+    ]
+    for stage in stages:
+        clients[stage.name] = CancellableClient(gemini_client, stage)
+    return stages
+
+
+def assemble_extraction(
+    pdf_path: str,
+    report: PipelineReport,
+    doc_hash: Optional[str] = None,
+    fingerprints: Optional[Dict[str, str]] = None,
+) -> ArticleExtraction:
+    extraction_result = ArticleExtraction(source_filename=pdf_path)
+    extraction_result.document_hash = doc_hash
+    extraction_result.stage_fingerprints = {
+        name: fingerprint
+        for name, fingerprint in (fingerprints or {}).items()
+        if name in report.stages and report.stages[name].status == StageStatus.OK
+    }
+    llm_payload = report.output("orchestrator") or {}
+    if llm_payload.get("pico"):
+        extraction_result.pico_elements = PICO(**llm_payload["pico"])
+    if llm_payload.get("quality"):
+        extraction_result.quality_scores.append(QualityScore(**llm_payload["quality"]))
+
+    claims = report.output("claims", [])
+    annotations = report.output("uncertainty") or [None] * len(claims)
+    linked_citations = report.output("citations") or [[] for _ in claims]
+    for claim, annotation, keys in zip(claims, annotations, linked_citations):
+        claim.uncertainty_annotation = annotation
+        claim.linked_citations = keys
+    extraction_result.claims = claims
+    extraction_result.summary = report.output("summary")
+    extraction_result.figures = report.output("figures", [])
+    extraction_result.tables = report.output("tables", [])
+    bibliography = report.output("bibliography")
+    extraction_result.bibliography = bibliography[0] if bibliography else {}
+    return extraction_result
+
+
+def run_pipeline(
+    pdf_path: str,
+    gemini_client: GeminiClient,
+    reference_store_path: Optional[str] = None,
+    stage_timeout: Optional[float] = None,
+    checkpoint_root: Optional[str] = None,
+    resume: bool = False,
+    previous: Optional[ArticleExtraction] = None,
+) -> Optional[Tuple[ArticleExtraction, PipelineReport]]:
+    logger.info(f"Received request to process PDF: {pdf_path}")
+    with FITZ_LOCK:
+        document = ingest_pdf(pdf_path)
+    if not document:
+        return None
+    doc_hash = document_hash(pdf_path)
+    fingerprints = extraction_fingerprints(doc_hash, gemini_client)
+    checkpoints = None
+    if checkpoint_root:
+        checkpoints = CheckpointStore(
+            str(Path(checkpoint_root) / doc_hash[:DOCUMENT_HASH_LENGTH]), pdf_path
+        )
+    precomputed: Dict[str, Any] = {}
+    if previous is not None and previous.document_hash == doc_hash:
+        precomputed = {
+            name: output
+            for name, output in reusable_outputs(previous).items()
+            if previous.stage_fingerprints.get(name) == fingerprints[name]
+        }
+        logger.info(
+            f"Reusing {len(precomputed)} unchanged stage(s) from the previous "
+            f"extraction of '{pdf_path}'."
+        )
+    try:
+        with FITZ_LOCK:
+            pages_text = extract_text_from_doc(document)
+        text_with_newlines, cleaned_text = clean_and_consolidate_text(pages_text)
+        if not cleaned_text:
+            logger.error(f"No text could be extracted from '{pdf_path}'.")
+            return None
+        if not gemini_client.is_configured():
+            logger.warning(
+                "Skipping LLM extraction stages as Gemini client is not configured."
+            )
+        stages = build_extraction_stages(
+            pdf_path,
+            document,
+            pages_text,
+            text_with_newlines,
+            cleaned_text,
+            gemini_client,
+            FITZ_LOCK,
+            stage_timeout=stage_timeout,
+        )
+        # Without a client these stages return empty placeholders, which must
+        # not be resumed once a key is configured.
+        skip_checkpoint = (
+            set() if gemini_client.is_configured() else set(client_dependent_stages())
+        )
+        for stage in stages:
+            stage.fingerprint = fingerprints.get(stage.name)
+            stage.checkpoint = stage.name not in skip_checkpoint
+        report = run_stages(
+            stages, checkpoints=checkpoints, resume=resume, precomputed=precomputed
+        )
+    finally:
+        with FITZ_LOCK:
+            document.close()
+
+    extraction_result = assemble_extraction(pdf_path, report, doc_hash, fingerprints)
+    if reference_store_path and extraction_result.bibliography:
+        with ReferenceStore(reference_store_path) as store:
+            store.add_article(pdf_path, extraction_result.bibliography)
+    return extraction_result, report
+
+
+def run_extraction(
+    pdf_path: str,
+    gemini_client: GeminiClient,
+    reference_store_path: Optional[str] = None,
+    stage_timeout: Optional[float] = None,
+    checkpoint_root: Optional[str] = None,
+    resume: bool = False,
+) -> Optional[ArticleExtraction]:
+    outcome = run_pipeline(
+        pdf_path,
+        gemini_client,
+        reference_store_path,
+        stage_timeout=stage_timeout,
+        checkpoint_root=checkpoint_root,
+        resume=resume,
+    )
+    return outcome[0] if outcome else None
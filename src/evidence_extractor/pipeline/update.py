@@ -0,0 +1,147 @@
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from evidence_extractor.integration.gemini_client import GeminiClient
+from evidence_extractor.models.schemas import ArticleExtraction
+from evidence_extractor.output.json_builder import save_to_json_atomic
+from evidence_extractor.output.serialization import load_extraction
+
+from .batch import RUN_SUMMARY_FILENAME, completed_cleanly
+from .checkpoints import document_hash
+from .dag import StageStatus
+from .fingerprints import stale_stages
+from .runner import (
+    REUSABLE_STAGES,
+    client_dependent_stages,
+    extraction_fingerprints,
+    run_pipeline,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def collect_extraction_paths(corpus_dir: str, recursive: bool = False) -> List[Path]:
+    pattern = "**/*.json" if recursive else "*.json"
+    return sorted(
+        path
+        for path in Path(corpus_dir).glob(pattern)
+        if path.is_file()
+        and path.name != RUN_SUMMARY_FILENAME
+        and not any(part.startswith(".") for part in path.parts)
+    )
+
+
+def plan_update(
+    extraction: ArticleExtraction, pdf_path: str, gemini_client: GeminiClient
+) -> List[str]:
+    doc_hash = document_hash(pdf_path)
+    current = extraction_fingerprints(doc_hash, gemini_client)
+    if extraction.document_hash != doc_hash:
+        return list(current)
+    return stale_stages(current, extraction.stage_fingerprints)
+
+
+# Without a configured client the LLM stages would rerun as no-ops and replace the
+# saved outputs with empty ones, so stale LLM stages are left alone instead.
+def unrunnable_stages(stale: List[str], gemini_client: GeminiClient) -> List[str]:
+    if gemini_client.is_configured():
+        return []
+    dependent = client_dependent_stages()
+    return [name for name in stale if name in dependent]
+
+
+def update_extraction(
+    json_path: Path,
+    gemini_client: GeminiClient,
+    dry_run: bool = False,
+    pipeline_options: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    record: Dict[str, Any] = {
+        "output_path": str(json_path),
+        "status": "failed",
+        "stale_stages": [],
+        "error": None,
+    }
+    extraction = load_extraction(str(json_path))
+    if extraction is None:
+        record["status"] = "skipped"
+        return record
+    pdf_path = extraction.source_filename
+    record["pdf_path"] = pdf_path
+    if not Path(pdf_path).is_file():
+        record["error"] = f"Source PDF '{pdf_path}' not found."
+        logger.error(record["error"])
+        return record
+
+    stale = plan_update(extraction, pdf_path, gemini_client)
+    record["stale_stages"] = stale
+    if not stale:
+        record["status"] = "up-to-date"
+        return record
+    blocked = unrunnable_stages(stale, gemini_client)
+    if blocked:
+        record["error"] = (
+            f"Gemini client is not configured; cannot recompute {', '.join(blocked)}."
+        )
+        logger.error(f"Not updating '{json_path}': {record['error']}")
+        return record
+    if dry_run:
+        record["status"] = "stale"
+        return record
+
+    start = time.perf_counter()
+    outcome = run_pipeline(
+        pdf_path, gemini_client, previous=extraction, **(pipeline_options or {})
+    )
+    record["seconds"] = round(time.perf_counter() - start, 3)
+    if outcome is None:
+        record["error"] = "Document could not be ingested or contained no text."
+        return record
+    updated, report = outcome
+    if not completed_cleanly(report):
+        failed = [
+            name
+            for name, result in report.stages.items()
+            if result.status != StageStatus.OK
+        ]
+        record["error"] = (
+            f"Stage(s) {', '.join(failed)} did not complete; kept the previous output."
+        )
+        logger.error(f"Not updating '{json_path}': {record['error']}")
+        return record
+    save_to_json_atomic(updated, str(json_path))
+    record["status"] = "updated"
+    record["recomputed_stages"] = [
+        name
+        for name, result in report.stages.items()
+        if not result.reused and not result.from_checkpoint
+    ]
+    record["reused_stages"] = [
+        name for name in REUSABLE_STAGES if report.stages[name].reused
+    ]
+    return record
+
+
+def run_update(
+    corpus_dir: str,
+    gemini_client: GeminiClient,
+    dry_run: bool = False,
+    recursive: bool = False,
+    pipeline_options: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    json_paths = collect_extraction_paths(corpus_dir, recursive)
+    logger.info(f"Checking {len(json_paths)} extraction(s) in '{corpus_dir}'.")
+    records = []
+    for json_path in json_paths:
+        try:
+            records.append(
+                update_extraction(json_path, gemini_client, dry_run, pipeline_options)
+            )
+        except Exception as e:
+            logger.error(f"Update failed for '{json_path}': {e}")
+            records.append(
+                {"output_path": str(json_path), "status": "failed", "error": str(e)}
+            )
+    return records
@@ -0,0 +1,210 @@
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from . import batch
+from .batch import output_path_for
+from .checkpoints import document_hash
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = ".watch_manifest.jsonl"
+DEFAULT_SETTLE_SECONDS = 5.0
+DEFAULT_POLL_SECONDS = 2.0
+
+
+class ProcessedManifest:
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.processed: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.warning(f"Ignoring truncated line in '{self.path}'.")
+                    continue
+                if entry.get("status") == "ok":
+                    self.processed[entry["document_hash"]] = entry
+        logger.info(
+            f"Loaded {len(self.processed)} processed document(s) from '{self.path}'."
+        )
+
+    def __contains__(self, doc_hash: str) -> bool:
+        return doc_hash in self.processed
+
+    def record(self, entry: Dict[str, Any]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        if entry.get("status") == "ok":
+            self.processed[entry["document_hash"]] = entry
+
+
+class FolderWatcher:
+    def __init__(
+        self,
+        watch_dir: str,
+        output_dir: str,
+        workers: int = 1,
+        llm_concurrency: Optional[int] = None,
+        pipeline_options: Optional[Dict[str, Any]] = None,
+        settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+        recursive: bool = False,
+        manifest_path: Optional[str] = None,
+    ):
+        self.watch_dir = Path(watch_dir)
+        self.output_dir = Path(output_dir)
+        self.workers = workers
+        self.llm_concurrency = llm_concurrency
+        self.pipeline_options = pipeline_options
+        self.settle_seconds = settle_seconds
+        self.poll_seconds = poll_seconds
+        self.recursive = recursive
+        self.manifest = ProcessedManifest(
+            manifest_path or str(self.output_dir / MANIFEST_FILENAME)
+        )
+        self._observed: Dict[Path, Tuple[Tuple[int, float], float]] = {}
+        self._seen: Dict[Path, Tuple[int, float]] = {}
+        self._in_flight: Set[str] = set()
+        self._failed: Set[str] = set()
+
+    def _snapshot(self) -> Dict[Path, Tuple[int, float]]:
+        snapshot = {}
+        for pdf_path in batch.collect_pdf_paths(str(self.watch_dir), self.recursive):
+            try:
+                stat = pdf_path.stat()
+            except FileNotFoundError:
+                continue
+            snapshot[pdf_path] = (stat.st_size, stat.st_mtime)
+        return snapshot
+
+    def settled_files(self) -> List[Path]:
+        now = time.monotonic()
+        snapshot = self._snapshot()
+        ready = []
+        for pdf_path, signature in snapshot.items():
+            if self._seen.get(pdf_path) == signature:
+                continue
+            previous = self._observed.get(pdf_path)
+            if previous is None or previous[0] != signature:
+                self._observed[pdf_path] = (signature, now)
+                continue
+            if signature[0] > 0 and now - previous[1] >= self.settle_seconds:
+                ready.append(pdf_path)
+        for tracked in (self._observed, self._seen):
+            for pdf_path in list(tracked):
+                if pdf_path not in snapshot:
+                    del tracked[pdf_path]
+        return ready
+
+    def pending_documents(self) -> List[Tuple[Path, str]]:
+        documents = []
+        for pdf_path in self.settled_files():
+            signature = self._observed.pop(pdf_path)[0]
+            self._seen[pdf_path] = signature
+            try:
+                doc_hash = document_hash(str(pdf_path))
+            except OSError as e:
+                logger.warning(f"Could not read '{pdf_path}': {e}")
+                continue
+            if (
+                doc_hash in self.manifest
+                or doc_hash in self._in_flight
+                or doc_hash in self._failed
+            ):
+                logger.debug(f"Skipping already processed '{pdf_path}'.")
+                continue
+            documents.append((pdf_path, doc_hash))
+        return documents
+
+    def _finish(self, pdf_path: Path, doc_hash: str, record: Dict[str, Any]):
+        self._in_flight.discard(doc_hash)
+        if record["status"] != "ok":
+            self._failed.add(doc_hash)
+        self.manifest.record(
+            {
+                "document_hash": doc_hash,
+                "pdf_path": str(pdf_path),
+                "output_path": record.get("output_path"),
+                "status": record["status"],
+                "error": record.get("error"),
+                "processed_at": datetime.utcnow().isoformat(),
+            }
+        )
+        logger.info(f"[{record['status']}] {pdf_path}")
+
+    def run(
+        self,
+        stop_event: Optional[threading.Event] = None,
+        max_cycles: Optional[int] = None,
+    ):
+        stop_event = stop_event or threading.Event()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        semaphore = batch.make_request_semaphore(self.llm_concurrency)
+        pool = None
+        if self.workers > 1:
+            pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=batch._init_worker,
+                initargs=(semaphore,),
+            )
+        else:
+            batch._init_worker(semaphore)
+        futures: Dict[Future, Tuple[Path, str]] = {}
+        logger.info(f"Watching '{self.watch_dir}' for new PDFs.")
+        cycles = 0
+        try:
+            while not stop_event.is_set():
+                for pdf_path, doc_hash in self.pending_documents():
+                    output_path = str(
+                        output_path_for(pdf_path, self.watch_dir, self.output_dir)
+                    )
+                    self._in_flight.add(doc_hash)
+                    if pool is None:
+                        record = batch.process_document(
+                            str(pdf_path), output_path, self.pipeline_options
+                        )
+                        self._finish(pdf_path, doc_hash, record)
+                        continue
+                    future = pool.submit(
+                        batch.process_document,
+                        str(pdf_path),
+                        output_path,
+                        self.pipeline_options,
+                    )
+                    futures[future] = (pdf_path, doc_hash)
+                for future in [f for f in futures if f.done()]:
+                    pdf_path, doc_hash = futures.pop(future)
+                    try:
+                        record = future.result()
+                    except Exception as e:
+                        logger.error(f"Worker crashed while processing document: {e}")
+                        record = {"status": "failed", "error": str(e)}
+                    self._finish(pdf_path, doc_hash, record)
+                cycles += 1
+                if max_cycles is not None and cycles >= max_cycles:
+                    break
+                stop_event.wait(self.poll_seconds)
+        finally:
+            if pool is not None:
+                for future, (pdf_path, doc_hash) in futures.items():
+                    try:
+                        self._finish(pdf_path, doc_hash, future.result())
+                    except Exception as e:
+                        logger.error(f"Worker crashed while processing document: {e}")
+                pool.shutdown()
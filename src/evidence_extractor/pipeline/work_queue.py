@@ -0,0 +1,368 @@
+import hashlib
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from . import batch
+from .batch import RUN_SUMMARY_FILENAME, output_path_for
+from .checkpoints import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_SECONDS = 300.0
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_POLL_SECONDS = 2.0
+
+
+def default_node_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+
+class WorkQueue:
+    def __init__(
+        self,
+        queue_dir: str,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        node_id: Optional[str] = None,
+    ):
+        self.queue_dir = Path(queue_dir)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.node_id = node_id or default_node_id()
+        self.tasks_dir = self.queue_dir / "tasks"
+        self.leases_dir = self.queue_dir / "leases"
+        self.done_dir = self.queue_dir / "done"
+        for directory in (self.tasks_dir, self.leases_dir, self.done_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+    def _task_path(self, task_id: str) -> Path:
+        return self.tasks_dir / f"{task_id}.json"
+
+    def _lease_path(self, task_id: str) -> Path:
+        return self.leases_dir / f"{task_id}.lease"
+
+    def _done_path(self, task_id: str) -> Path:
+        return self.done_dir / f"{task_id}.json"
+
+    @staticmethod
+    def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def enqueue(self, pdf_paths: List[Path], root: Optional[Path] = None) -> int:
+        added = 0
+        for pdf_path in pdf_paths:
+            output_name = output_path_for(pdf_path, root, Path()).name
+            task_id = hashlib.sha1(output_name.encode("utf-8")).hexdigest()[:16]
+            task = {
+                "task_id": task_id,
+                "pdf_path": str(pdf_path),
+                "output_name": output_name,
+            }
+            try:
+                fd = os.open(
+                    self._task_path(task_id), os.O_CREAT | os.O_EXCL | os.O_WRONLY
+                )
+            except FileExistsError:
+                continue
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(task, f)
+            added += 1
+        logger.info(f"Enqueued {added} new task(s) in '{self.queue_dir}'.")
+        return added
+
+    def task_ids(self) -> List[str]:
+        return sorted(path.stem for path in self.tasks_dir.glob("*.json"))
+
+    def done_ids(self) -> List[str]:
+        return sorted(path.stem for path in self.done_dir.glob("*.json"))
+
+    def _lease_record(self, task_id: str, attempt: int) -> Dict[str, Any]:
+        now = time.time()
+        return {
+            "task_id": task_id,
+            "node_id": self.node_id,
+            "attempt": attempt,
+            "heartbeat_at": now,
+            "expires_at": now + self.lease_seconds,
+        }
+
+    def _expired_lease(self, lease_path: Path) -> Optional[Dict[str, Any]]:
+        lease = self._read_json(lease_path)
+        if lease is not None:
+            return lease if lease.get("expires_at", 0) < time.time() else None
+        try:
+            age = time.time() - lease_path.stat().st_mtime
+        except FileNotFoundError:
+            return {}
+        return {} if age > self.lease_seconds else None
+
+    @staticmethod
+    def _restore_lease(stale_path: Path, lease_path: Path):
+        try:
+            os.link(stale_path, lease_path)
+        except FileExistsError:
+            logger.warning(f"Lease '{lease_path}' was re-created while restoring it.")
+        except OSError:
+            os.rename(stale_path, lease_path)
+            return
+        os.remove(stale_path)
+
+    def _try_acquire(self, task_id: str) -> Optional[int]:
+        lease_path = self._lease_path(task_id)
+        attempt = 1
+        for _ in range(2):
+            try:
+                fd = os.open(lease_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                expired = self._expired_lease(lease_path)
+                if expired is None:
+                    return None
+                attempt = int(expired.get("attempt", 1)) + 1
+                stale_path = lease_path.with_name(f"{lease_path.name}.{self.node_id}")
+                try:
+                    os.rename(lease_path, stale_path)
+                except FileNotFoundError:
+                    continue
+                # Another node may have re-claimed the task between our check and
+                # the rename; if so we just moved its fresh lease, so put it back.
+                if self._expired_lease(stale_path) != expired:
+                    self._restore_lease(stale_path, lease_path)
+                    return None
+                os.remove(stale_path)
+                logger.warning(
+                    f"Re-claiming task {task_id} from expired lease held by "
+                    f"'{expired.get('node_id', 'unknown')}'."
+                )
+                continue
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._lease_record(task_id, attempt), f)
+            return attempt
+        return None
+
+    def claim(self) -> Optional[Dict[str, Any]]:
+        done = set(self.done_ids())
+        for task_id in self.task_ids():
+            if task_id in done:
+                continue
+            attempt = self._try_acquire(task_id)
+            if attempt is None:
+                continue
+            if self._done_path(task_id).exists():
+                self.release(task_id)
+                continue
+            task = self._read_json(self._task_path(task_id))
+            if task is None:
+                self.release(task_id)
+                continue
+            if attempt > self.max_attempts:
+                self.complete(
+                    task_id,
+                    {
+                        "pdf_path": task["pdf_path"],
+                        "output_path": None,
+                        "status": "failed",
+                        "error": f"Abandoned after {attempt - 1} interrupted attempts.",
+                        "seconds": None,
+                    },
+                )
+                continue
+            task["attempt"] = attempt
+            logger.info(f"Node '{self.node_id}' claimed task {task_id}.")
+            return task
+        return None
+
+    def owns(self, task_id: str) -> bool:
+        lease = self._read_json(self._lease_path(task_id))
+        return lease is not None and lease.get("node_id") == self.node_id
+
+    def heartbeat(self, task_id: str, attempt: int) -> bool:
+        if not self.owns(task_id):
+            logger.warning(f"Node '{self.node_id}' lost its lease on task {task_id}.")
+            return False
+        write_json_atomic(
+            self._lease_path(task_id), self._lease_record(task_id, attempt)
+        )
+        return True
+
+    def release(self, task_id: str):
+        if self.owns(task_id):
+            try:
+                os.remove(self._lease_path(task_id))
+            except FileNotFoundError:
+                pass
+
+    def complete(self, task_id: str, record: Dict[str, Any]):
+        record = dict(record, task_id=task_id, node_id=self.node_id)
+        record["completed_at"] = datetime.utcnow().isoformat()
+        write_json_atomic(self._done_path(task_id), record)
+        self.release(task_id)
+
+    def live_leases(self) -> int:
+        return sum(
+            1
+            for path in self.leases_dir.glob("*.lease")
+            if self._expired_lease(path) is None
+        )
+
+    def is_drained(self) -> bool:
+        return set(self.task_ids()) <= set(self.done_ids())
+
+    def records(self) -> List[Dict[str, Any]]:
+        records = []
+        for task_id in self.task_ids():
+            record = self._read_json(self._done_path(task_id))
+            if record is not None:
+                records.append(record)
+        return records
+
+
+class LeaseHeartbeat(threading.Thread):
+    def __init__(self, work_queue: WorkQueue, task_id: str, attempt: int):
+        super().__init__(name=f"lease-{task_id}", daemon=True)
+        self.work_queue = work_queue
+        self.task_id = task_id
+        self.attempt = attempt
+        self.lost = False
+        self._stopped = threading.Event()
+
+    def run(self):
+        interval = max(0.05, self.work_queue.lease_seconds / 3)
+        while not self._stopped.wait(interval):
+            try:
+                if not self.work_queue.heartbeat(self.task_id, self.attempt):
+                    self.lost = True
+                    return
+            except OSError as e:
+                logger.error(f"Heartbeat for task {self.task_id} failed: {e}")
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+
+def drain_queue(
+    queue_dir: str,
+    output_dir: str,
+    pipeline_options: Optional[Dict[str, Any]] = None,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    poll_seconds: float = DEFAULT_POLL_SECONDS,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> int:
+    work_queue = WorkQueue(queue_dir, lease_seconds, max_attempts)
+    processed = 0
+    while True:
+        task = work_queue.claim()
+        if task is None:
+            if work_queue.is_drained():
+                return processed
+            logger.debug(
+                f"Waiting on {work_queue.live_leases()} task(s) leased by other nodes."
+            )
+            time.sleep(poll_seconds)
+            continue
+        heartbeat = LeaseHeartbeat(work_queue, task["task_id"], task["attempt"])
+        heartbeat.start()
+        try:
+            record = batch.process_document(
+                task["pdf_path"],
+                str(Path(output_dir) / task["output_name"]),
+                pipeline_options,
+            )
+        finally:
+            heartbeat.stop()
+        if heartbeat.lost:
+            logger.warning(
+                f"Discarding bookkeeping for task {task['task_id']}; "
+                "another node now owns it."
+            )
+            continue
+        work_queue.complete(task["task_id"], record)
+        processed += 1
+
+
+def merge_results(
+    queue_dir: str, output_dir: str, run_info: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    work_queue = WorkQueue(queue_dir)
+    records = work_queue.records()
+    succeeded = sum(1 for record in records if record["status"] == "ok")
+    summary = {
+        **(run_info or {}),
+        "finished_at": datetime.utcnow().isoformat(),
+        "queue_dir": str(queue_dir),
+        "nodes": sorted({record["node_id"] for record in records}),
+        "documents_total": len(work_queue.task_ids()),
+        "documents_succeeded": succeeded,
+        "documents_failed": len(records) - succeeded,
+        "documents_pending": len(work_queue.task_ids()) - len(records),
+        "documents": records,
+    }
+    write_json_atomic(Path(output_dir) / RUN_SUMMARY_FILENAME, summary)
+    return summary
+
+
+def run_distributed_batch(
+    pdf_paths: List[Path],
+    output_dir: str,
+    queue_dir: str,
+    workers: int = 1,
+    llm_concurrency: Optional[int] = None,
+    root: Optional[Path] = None,
+    pipeline_options: Optional[Dict[str, Any]] = None,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    poll_seconds: float = DEFAULT_POLL_SECONDS,
+) -> Dict[str, Any]:
+    started_at = datetime.utcnow()
+    start = time.perf_counter()
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    WorkQueue(queue_dir, lease_seconds).enqueue(pdf_paths, root)
+    drain_args = (
+        queue_dir,
+        output_dir,
+        pipeline_options,
+        lease_seconds,
+        poll_seconds,
+    )
+    semaphore = batch.make_request_semaphore(llm_concurrency)
+    if workers <= 1:
+        batch._init_worker(semaphore)
+        drain_queue(*drain_args)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=batch._init_worker, initargs=(semaphore,)
+        ) as pool:
+            futures = [pool.submit(drain_queue, *drain_args) for _ in range(workers)]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Queue worker crashed: {e}")
+    summary = merge_results(
+        queue_dir,
+        output_dir,
+        {
+            "started_at": started_at.isoformat(),
+            "total_seconds": round(time.perf_counter() - start, 3),
+            "workers": workers,
+            "llm_concurrency": llm_concurrency,
+        },
+    )
+    logger.info(
+        f"Queue drained: {summary['documents_succeeded']}/"
+        f"{summary['documents_total']} succeeded across {len(summary['nodes'])} "
+        "worker(s)."
+    )
+    return summary
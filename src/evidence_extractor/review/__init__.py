@@ -0,0 +1,20 @@
+from .journal import ReviewJournal, compact_journal, journal_path_for, review_items
+from .queue import (
+    QueueFilter,
+    QueueItem,
+    bulk_decide,
+    iter_directory_queue,
+    iter_store_queue,
+)
+
+__all__ = [
+    "QueueFilter",
+    "QueueItem",
+    "ReviewJournal",
+    "bulk_decide",
+    "compact_journal",
+    "iter_directory_queue",
+    "iter_store_queue",
+    "journal_path_for",
+    "review_items",
+]
@@ -0,0 +1,218 @@
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from evidence_extractor.models.schemas import (
+    ArticleExtraction,
+    Claim,
+    CorrectionMetadata,
+    QualityScore,
+    ValidationStatus,
+)
+from evidence_extractor.output.json_builder import save_to_json_atomic
+from evidence_extractor.output.jsonl_corpus import record_key
+from evidence_extractor.output.serialization import load_extraction
+from evidence_extractor.storage.corpus_store import CorpusStore
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = ".review.jsonl"
+SKIPPED = "skipped"
+
+
+def journal_path_for(target_path: str) -> str:
+    return f"{target_path}{JOURNAL_SUFFIX}"
+
+
+def review_items(extraction: ArticleExtraction) -> List[Tuple[str, Any]]:
+    items: List[Tuple[str, Any]] = []
+    if extraction.pico_elements:
+        items.append(("pico", extraction.pico_elements))
+    items.extend((f"quality:{i}", s) for i, s in enumerate(extraction.quality_scores))
+    items.extend((f"claim:{i}", c) for i, c in enumerate(extraction.claims))
+    return items
+
+
+def text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+# Items are addressed by position, which an update may reassign to different
+# content; the hash lets a decision be recognised as belonging to another item.
+def item_hash(item: Any) -> Optional[str]:
+    if isinstance(item, Claim):
+        return text_digest(item.claim_text)
+    if isinstance(item, QualityScore):
+        return text_digest(f"{item.score_name}: {item.score_value}")
+    return None
+
+
+def is_current(entry: Dict[str, Any], content_hash: Optional[str]) -> bool:
+    return entry.get("hash") is None or entry["hash"] == content_hash
+
+
+def apply_decisions(
+    extraction: ArticleExtraction, decisions: Dict[str, Dict[str, Any]]
+) -> int:
+    applied = 0
+    outdated = 0
+    for item_id, item in review_items(extraction):
+        entry = decisions.get(item_id)
+        if entry is None or entry["status"] == SKIPPED:
+            continue
+        if not is_current(entry, item_hash(item)):
+            outdated += 1
+            continue
+        item.correction_metadata = CorrectionMetadata(
+            status=ValidationStatus(entry["status"]),
+            reviewer_comment=entry.get("comment"),
+            last_reviewed=datetime.fromisoformat(entry["timestamp"]),
+        )
+        applied += 1
+    if outdated:
+        logger.warning(
+            f"Ignored {outdated} review decision(s) for '{extraction.source_filename}' "
+            "made on items whose content has since changed."
+        )
+    return applied
+
+
+class ReviewJournal:
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._load()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        complete_end = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                complete_end += len(line)
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.warning(f"Ignoring unreadable line in '{self.path}'.")
+                    continue
+                self.entries.setdefault(entry["document"], {})[entry["item"]] = entry
+        if complete_end < self.path.stat().st_size:
+            # Drop the line torn by a crash, or the next decision would be appended
+            # onto it and lost on the following load.
+            logger.warning(f"Dropping truncated last line of '{self.path}'.")
+            with open(self.path, "r+b") as f:
+                f.truncate(complete_end)
+                f.flush()
+                os.fsync(f.fileno())
+        if self.entries:
+            logger.info(
+                f"Loaded review decisions for {len(self.entries)} document(s) from "
+                f"'{self.path}'."
+            )
+
+    def __enter__(self) -> "ReviewJournal":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    def record(
+        self,
+        document: str,
+        item_id: str,
+        status: str,
+        comment: Optional[str] = None,
+        location: Optional[str] = None,
+        sync: bool = True,
+        content_hash: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        entry = {
+            "document": document,
+            "item": item_id,
+            "status": status,
+            "comment": comment,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+        if content_hash:
+            entry["hash"] = content_hash
+        if location:
+            entry["location"] = location
+        self._file.write(json.dumps(entry) + "\n")
+        if sync:
+            self.sync()
+        self.entries.setdefault(document, {})[item_id] = entry
+        return entry
+
+    def sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def decisions(self, document: str) -> Dict[str, Dict[str, Any]]:
+        return self.entries.get(document, {})
+
+    def documents(self) -> List[str]:
+        return list(self.entries)
+
+    def location(self, document: str) -> Optional[str]:
+        for entry in self.entries.get(document, {}).values():
+            if entry.get("location"):
+                return entry["location"]
+        return None
+
+    def pending_count(self) -> int:
+        return sum(
+            1
+            for decisions in self.entries.values()
+            for entry in decisions.values()
+            if entry["status"] != SKIPPED
+        )
+
+    def clear(self):
+        self._file.truncate(0)
+        self.sync()
+        self.entries = {}
+
+
+def compact_journal(
+    journal: ReviewJournal,
+    json_path: Optional[str] = None,
+    store: Optional[CorpusStore] = None,
+) -> int:
+    applied = 0
+    unmatched = []
+    for document in journal.documents():
+        path = json_path or journal.location(document)
+        if store is not None:
+            extraction = store.get(document)
+        else:
+            extraction = load_extraction(path) if path else None
+        if extraction is None or record_key(extraction) != document:
+            unmatched.append(document)
+            continue
+        count = apply_decisions(extraction, journal.decisions(document))
+        if count:
+            if store is not None:
+                store.upsert(extraction)
+            else:
+                save_to_json_atomic(extraction, path)
+        applied += count
+    if unmatched:
+        logger.error(
+            f"Journal '{journal.path}' has decisions for unknown document(s) "
+            f"{', '.join(unmatched)}; keeping it."
+        )
+    else:
+        journal.clear()
+    logger.info(f"Compacted {applied} review decision(s) from '{journal.path}'.")
+    return applied
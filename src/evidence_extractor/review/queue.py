@@ -0,0 +1,174 @@
+import logging
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from pydantic import BaseModel, Field
+
+from evidence_extractor.models.schemas import ArticleExtraction, ValidationStatus
+from evidence_extractor.output.jsonl_corpus import record_key
+from evidence_extractor.output.serialization import load_extraction
+from evidence_extractor.storage.corpus_store import CorpusStore
+
+from .journal import ReviewJournal, is_current, text_digest
+
+logger = logging.getLogger(__name__)
+
+LEVELS = ("high", "medium", "low")
+UNKNOWN_LEVEL = "unknown"
+QUEUE_JOURNAL_FILENAME = ".review.jsonl"
+DEFAULT_PAGE_SIZE = 500
+
+
+class QueueFilter(BaseModel):
+    statuses: List[str] = Field(
+        default_factory=lambda: [ValidationStatus.UNVERIFIED.value]
+    )
+    uncertainty: List[str] = Field(default_factory=list)
+    quality: List[str] = Field(default_factory=list)
+    missing_provenance: bool = False
+
+
+class QueueItem(BaseModel):
+    document: str
+    source_filename: str
+    item_id: str
+    claim_text: str
+    uncertainty_annotation: Optional[str] = None
+    page_number: Optional[int] = None
+    status: str
+    quality: str = UNKNOWN_LEVEL
+    location: Optional[str] = None
+
+
+def level_of(text: Optional[str]) -> str:
+    words = (text or "").strip().lower().split()
+    if words and words[0].strip(":,.-") in LEVELS:
+        return words[0].strip(":,.-")
+    return UNKNOWN_LEVEL
+
+
+def has_provenance(page_number: Optional[int]) -> bool:
+    return page_number is not None and page_number >= 1
+
+
+def matches(item: QueueItem, queue_filter: QueueFilter) -> bool:
+    if queue_filter.statuses and item.status not in queue_filter.statuses:
+        return False
+    if (
+        queue_filter.uncertainty
+        and level_of(item.uncertainty_annotation) not in queue_filter.uncertainty
+    ):
+        return False
+    if queue_filter.quality and item.quality not in queue_filter.quality:
+        return False
+    if queue_filter.missing_provenance and has_provenance(item.page_number):
+        return False
+    return True
+
+
+def _is_decided(journal: Optional[ReviewJournal], item: QueueItem) -> bool:
+    if journal is None:
+        return False
+    entry = journal.decisions(item.document).get(item.item_id)
+    return entry is not None and is_current(entry, text_digest(item.claim_text))
+
+
+def extraction_items(
+    extraction: ArticleExtraction, location: Optional[str] = None
+) -> Iterator[QueueItem]:
+    document = record_key(extraction)
+    scores = extraction.quality_scores
+    quality = level_of(scores[0].score_value) if scores else UNKNOWN_LEVEL
+    for i, claim in enumerate(extraction.claims):
+        yield QueueItem(
+            document=document,
+            source_filename=extraction.source_filename,
+            item_id=f"claim:{i}",
+            claim_text=claim.claim_text,
+            uncertainty_annotation=claim.uncertainty_annotation,
+            page_number=claim.provenance.page_number,
+            status=claim.correction_metadata.status.value,
+            quality=quality,
+            location=location,
+        )
+
+
+def iter_directory_queue(
+    json_paths: Iterable[Path],
+    queue_filter: QueueFilter,
+    journal: Optional[ReviewJournal] = None,
+) -> Iterator[QueueItem]:
+    for json_path in json_paths:
+        extraction = load_extraction(str(json_path))
+        if extraction is None:
+            continue
+        for item in extraction_items(extraction, str(json_path)):
+            if matches(item, queue_filter) and not _is_decided(journal, item):
+                yield item
+
+
+def iter_store_queue(
+    store: CorpusStore,
+    queue_filter: QueueFilter,
+    journal: Optional[ReviewJournal] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[QueueItem]:
+    query = (
+        "SELECT c.article_id, c.position, a.document_key, a.source_filename, "
+        "c.claim_text, c.uncertainty_annotation, c.page_number, c.status, "
+        "(SELECT q.score_value FROM quality_scores q WHERE q.article_id = a.id "
+        "ORDER BY q.position LIMIT 1) AS quality "
+        "FROM claims c JOIN articles a ON a.id = c.article_id "
+        "WHERE (c.article_id, c.position) > (?, ?)"
+    )
+    params: List = []
+    if queue_filter.statuses:
+        query += f" AND c.status IN ({', '.join('?' for _ in queue_filter.statuses)})"
+        params.extend(queue_filter.statuses)
+    if queue_filter.missing_provenance:
+        query += " AND (c.page_number IS NULL OR c.page_number < 1)"
+    query += " ORDER BY c.article_id, c.position LIMIT ?"
+    cursor_key = (0, -1)
+    while True:
+        rows = store.connection.execute(
+            query, [*cursor_key, *params, page_size]
+        ).fetchall()
+        for row in rows:
+            item = QueueItem(
+                document=row["document_key"],
+                source_filename=row["source_filename"],
+                item_id=f"claim:{row['position']}",
+                claim_text=row["claim_text"],
+                uncertainty_annotation=row["uncertainty_annotation"],
+                page_number=row["page_number"],
+                status=row["status"],
+                quality=level_of(row["quality"]),
+            )
+            if matches(item, queue_filter) and not _is_decided(journal, item):
+                yield item
+        if len(rows) < page_size:
+            return
+        cursor_key = (rows[-1]["article_id"], rows[-1]["position"])
+
+
+def bulk_decide(
+    items: Iterable[QueueItem],
+    journal: ReviewJournal,
+    status: str,
+    comment: Optional[str] = None,
+) -> int:
+    decided = 0
+    for item in items:
+        journal.record(
+            item.document,
+            item.item_id,
+            status,
+            comment,
+            item.location,
+            sync=False,
+            content_hash=text_digest(item.claim_text),
+        )
+        decided += 1
+    journal.sync()
+    logger.info(f"Bulk-marked {decided} item(s) as '{status}'.")
+    return decided
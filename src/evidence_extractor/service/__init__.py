@@ -0,0 +1,10 @@
+from .jobs import Job, JobQueue, JobStatus
+from .server import ExtractionServer, serve
+
+__all__ = [
+    "Job",
+    "JobQueue",
+    "JobStatus",
+    "ExtractionServer",
+    "serve",
+]
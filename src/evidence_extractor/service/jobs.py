@@ -0,0 +1,188 @@
+import itertools
+import logging
+import queue
+import threading
+import uuid
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from evidence_extractor.integration.gemini_client import GeminiClient
+from evidence_extractor.models.schemas import ArticleExtraction
+from evidence_extractor.output.json_builder import save_to_json_atomic
+from evidence_extractor.pipeline.runner import run_pipeline
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_FINISHED_JOBS = 1000
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+FINISHED_STATUSES = (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class Job(BaseModel):
+    job_id: str
+    pdf_path: str
+    priority: int = Field(0)
+    status: JobStatus = Field(JobStatus.QUEUED)
+    output_path: Optional[str] = Field(None)
+    submitted_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = Field(None)
+    finished_at: Optional[datetime] = Field(None)
+    error: Optional[str] = Field(None)
+    stages: Dict[str, float] = Field(default_factory=dict)
+
+
+class JobQueue:
+    def __init__(
+        self,
+        gemini_client: GeminiClient,
+        workers: int = 2,
+        pipeline_options: Optional[Dict[str, Any]] = None,
+        max_finished_jobs: int = DEFAULT_MAX_FINISHED_JOBS,
+        output_dir: Optional[str] = None,
+    ):
+        self.gemini_client = gemini_client
+        self.output_dir = Path(output_dir) if output_dir else None
+        self.workers = workers
+        self.pipeline_options = pipeline_options or {}
+        self.max_finished_jobs = max_finished_jobs
+        self._queue: "queue.PriorityQueue" = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._jobs: Dict[str, Job] = {}
+        self._results: Dict[str, ArticleExtraction] = {}
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+
+    def start(self):
+        for i in range(self.workers):
+            thread = threading.Thread(
+                target=self._work, name=f"job-worker-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Job queue started with {self.workers} worker(s).")
+
+    def stop(self, timeout: Optional[float] = None):
+        for _ in self._threads:
+            self._queue.put((float("inf"), next(self._sequence), None))
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def submit(self, pdf_path: str, priority: int = 0) -> Job:
+        job_id = uuid.uuid4().hex
+        # Results are only ever written under the configured output directory.
+        output_path = (
+            str(self.output_dir / f"{job_id}.json") if self.output_dir else None
+        )
+        job = Job(
+            job_id=job_id,
+            pdf_path=pdf_path,
+            priority=priority,
+            output_path=output_path,
+        )
+        with self._lock:
+            self._jobs[job.job_id] = job
+        self._queue.put((-priority, next(self._sequence), job.job_id))
+        logger.info(f"Queued job {job.job_id} for '{pdf_path}' (priority {priority}).")
+        return job.model_copy()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.model_copy() if job else None
+
+    def list_jobs(self, status: Optional[JobStatus] = None) -> List[Job]:
+        with self._lock:
+            return [
+                job.model_copy()
+                for job in self._jobs.values()
+                if status is None or job.status == status
+            ]
+
+    def result(self, job_id: str) -> Optional[ArticleExtraction]:
+        with self._lock:
+            return self._results.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status != JobStatus.QUEUED:
+                return False
+            job.status = JobStatus.CANCELLED
+            job.finished_at = datetime.utcnow()
+        logger.info(f"Cancelled job {job_id}.")
+        return True
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return sum(
+                1 for job in self._jobs.values() if job.status == JobStatus.QUEUED
+            )
+
+    def _work(self):
+        while True:
+            _, _, job_id = self._queue.get()
+            if job_id is None:
+                return
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is None or job.status != JobStatus.QUEUED:
+                    continue
+                job.status = JobStatus.RUNNING
+                job.started_at = datetime.utcnow()
+            self._run(job)
+
+    def _run(self, job: Job):
+        extraction = None
+        error = None
+        stages: Dict[str, float] = {}
+        try:
+            outcome = run_pipeline(
+                job.pdf_path, self.gemini_client, **self.pipeline_options
+            )
+            if outcome is None:
+                error = "Document could not be ingested or contained no text."
+            else:
+                extraction, report = outcome
+                stages = report.stage_seconds()
+                if job.output_path:
+                    self.output_dir.mkdir(parents=True, exist_ok=True)
+                    save_to_json_atomic(extraction, job.output_path)
+        except Exception as e:
+            logger.error(f"Job {job.job_id} failed: {e}")
+            error = str(e)
+
+        with self._lock:
+            job.finished_at = datetime.utcnow()
+            job.stages = stages
+            job.error = error
+            job.status = JobStatus.FAILED if error else JobStatus.SUCCEEDED
+            if extraction is not None:
+                self._results[job.job_id] = extraction
+            self._prune_finished()
+        logger.info(f"Job {job.job_id} finished with status '{job.status.value}'.")
+
+    def _prune_finished(self):
+        finished = [
+            job for job in self._jobs.values() if job.status in FINISHED_STATUSES
+        ]
+        excess = len(finished) - self.max_finished_jobs
+        if excess <= 0:
+            return
+        finished.sort(key=lambda job: job.finished_at or job.submitted_at)
+        for job in finished[:excess]:
+            del self._jobs[job.job_id]
+            self._results.pop(job.job_id, None)
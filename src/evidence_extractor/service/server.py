@@ -0,0 +1,196 @@
+import hashlib
+import json
+import logging
+import re
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from .jobs import JobQueue, JobStatus
+
+logger = logging.getLogger(__name__)
+
+MAX_UPLOAD_BYTES = 200 * 1024 * 1024
+JOB_PATH_PATTERN = re.compile(r"^/jobs/([0-9a-f]{32})(/result)?$")
+
+
+class ExtractionServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        job_queue: JobQueue,
+        upload_dir: Optional[str] = None,
+        input_root: Optional[str] = None,
+    ):
+        super().__init__(address, ExtractionRequestHandler)
+        self.job_queue = job_queue
+        self.upload_dir = Path(upload_dir) if upload_dir else None
+        self.input_root = Path(input_root).resolve() if input_root else None
+
+    def resolve_input(self, pdf_path: str) -> Optional[Path]:
+        if self.input_root is None:
+            return None
+        # Resolving follows '..' and symlinks, so anything that escapes the root
+        # (including absolute paths elsewhere) is refused.
+        candidate = (self.input_root / pdf_path).resolve()
+        try:
+            candidate.relative_to(self.input_root)
+        except ValueError:
+            return None
+        return candidate if candidate.is_file() else None
+
+
+class ExtractionRequestHandler(BaseHTTPRequestHandler):
+    server: ExtractionServer
+
+    def log_message(self, format: str, *args: Any):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+    def _send_json(self, status: HTTPStatus, payload: Any):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: HTTPStatus, message: str):
+        self._send_json(status, {"error": message})
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/health":
+            self._send_json(
+                HTTPStatus.OK,
+                {"status": "ok", "queued": self.server.job_queue.pending_count()},
+            )
+            return
+        if url.path == "/jobs":
+            status = parse_qs(url.query).get("status", [None])[0]
+            try:
+                status_filter = JobStatus(status) if status else None
+            except ValueError:
+                self._send_error(HTTPStatus.BAD_REQUEST, f"Unknown status '{status}'.")
+                return
+            jobs = self.server.job_queue.list_jobs(status_filter)
+            self._send_json(
+                HTTPStatus.OK, {"jobs": [job.model_dump(mode="json") for job in jobs]}
+            )
+            return
+        match = JOB_PATH_PATTERN.match(url.path)
+        if not match:
+            self._send_error(HTTPStatus.NOT_FOUND, "Not found.")
+            return
+        job = self.server.job_queue.get(match.group(1))
+        if job is None:
+            self._send_error(HTTPStatus.NOT_FOUND, "Unknown job.")
+            return
+        if not match.group(2):
+            self._send_json(HTTPStatus.OK, job.model_dump(mode="json"))
+            return
+        if job.status != JobStatus.SUCCEEDED:
+            self._send_error(
+                HTTPStatus.CONFLICT, f"Job is {job.status.value}; no result available."
+            )
+            return
+        extraction = self.server.job_queue.result(job.job_id)
+        if extraction is None:
+            # Pruned between the status check and here.
+            self._send_error(HTTPStatus.GONE, "Job result is no longer available.")
+            return
+        self._send_json(HTTPStatus.OK, extraction.model_dump(mode="json"))
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != "/jobs":
+            self._send_error(HTTPStatus.NOT_FOUND, "Not found.")
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_UPLOAD_BYTES:
+            self._send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Upload too large.")
+            return
+        body = self.rfile.read(length)
+        query = parse_qs(url.query)
+        content_type = (self.headers.get("Content-Type") or "").split(";")[0].strip()
+
+        if content_type == "application/pdf":
+            if self.server.upload_dir is None:
+                self._send_error(HTTPStatus.BAD_REQUEST, "Uploads are not enabled.")
+                return
+            pdf_path = self._store_upload(body)
+            request = {"priority": query.get("priority", ["0"])[0]}
+        else:
+            if self.server.input_root is None:
+                self._send_error(
+                    HTTPStatus.BAD_REQUEST,
+                    "Path submissions are not enabled; upload the PDF instead.",
+                )
+                return
+            try:
+                request = json.loads(body or b"{}")
+            except json.JSONDecodeError as e:
+                self._send_error(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {e}")
+                return
+            if not isinstance(request, dict):
+                self._send_error(HTTPStatus.BAD_REQUEST, "Expected a JSON object.")
+                return
+            pdf_path = self.server.resolve_input(str(request.get("pdf_path") or ""))
+            if pdf_path is None:
+                self._send_error(
+                    HTTPStatus.BAD_REQUEST,
+                    "'pdf_path' must name an existing file inside the input root.",
+                )
+                return
+        try:
+            priority = int(request.get("priority") or 0)
+        except (TypeError, ValueError):
+            self._send_error(HTTPStatus.BAD_REQUEST, "'priority' must be an integer.")
+            return
+        job = self.server.job_queue.submit(str(pdf_path), priority=priority)
+        self._send_json(HTTPStatus.ACCEPTED, job.model_dump(mode="json"))
+
+    def do_DELETE(self):
+        match = JOB_PATH_PATTERN.match(urlparse(self.path).path)
+        if not match or match.group(2):
+            self._send_error(HTTPStatus.NOT_FOUND, "Not found.")
+            return
+        job_id = match.group(1)
+        if self.server.job_queue.get(job_id) is None:
+            self._send_error(HTTPStatus.NOT_FOUND, "Unknown job.")
+            return
+        if not self.server.job_queue.cancel(job_id):
+            self._send_error(HTTPStatus.CONFLICT, "Only queued jobs can be cancelled.")
+            return
+        self._send_json(
+            HTTPStatus.OK, self.server.job_queue.get(job_id).model_dump(mode="json")
+        )
+
+    def _store_upload(self, body: bytes) -> Path:
+        self.server.upload_dir.mkdir(parents=True, exist_ok=True)
+        path = self.server.upload_dir / f"{hashlib.sha256(body).hexdigest()[:16]}.pdf"
+        if not path.exists():
+            path.write_bytes(body)
+        return path
+
+
+def serve(
+    job_queue: JobQueue,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    upload_dir: Optional[str] = None,
+    input_root: Optional[str] = None,
+):
+    server = ExtractionServer((host, port), job_queue, upload_dir, input_root)
+    job_queue.start()
+    logger.info(f"Extraction service listening on http://{host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Shutting down extraction service.")
+    finally:
+        server.server_close()
+        job_queue.stop(timeout=5)
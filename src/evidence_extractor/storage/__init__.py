@@ -0,0 +1,8 @@
+from .corpus_store import CorpusStore
+from .reference_store import ReferenceStore, reference_fingerprint
+
+__all__ = [
+    "CorpusStore",
+    "ReferenceStore",
+    "reference_fingerprint",
+]
@@ -0,0 +1,497 @@
+import hashlib
+import json
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from evidence_extractor.models.schemas import (
+    PICO,
+    ArticleExtraction,
+    BibliographyItem,
+    Claim,
+    CorrectionMetadata,
+    ExtractedFigure,
+    ExtractedTable,
+    Provenance,
+    QualityScore,
+)
+from evidence_extractor.output.jsonl_corpus import CorpusReader, record_key
+from evidence_extractor.output.serialization import load_extraction
+
+from .search_index import ensure_search_index, search
+
+logger = logging.getLogger(__name__)
+
+REVIEW_COLUMNS = "status TEXT NOT NULL, reviewer_comment TEXT, last_reviewed TEXT"
+PROVENANCE_COLUMNS = "page_number INTEGER, line_number INTEGER, bounding_box TEXT"
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    document_key TEXT NOT NULL UNIQUE,
+    document_hash TEXT,
+    source_filename TEXT NOT NULL,
+    title TEXT,
+    authors TEXT,
+    summary TEXT,
+    records_excluded_count INTEGER NOT NULL DEFAULT 0,
+    stage_fingerprints TEXT,
+    content_hash TEXT NOT NULL,
+    ingested_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source_filename);
+CREATE TABLE IF NOT EXISTS claims (
+    id INTEGER PRIMARY KEY,
+    article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    claim_text TEXT NOT NULL,
+    linked_citations TEXT,
+    uncertainty_annotation TEXT,
+    source_filename TEXT,
+    {PROVENANCE_COLUMNS},
+    {REVIEW_COLUMNS}
+);
+CREATE INDEX IF NOT EXISTS idx_claims_article_position ON claims(article_id, position);
+CREATE INDEX IF NOT EXISTS idx_claims_status ON claims(status);
+CREATE TABLE IF NOT EXISTS pico (
+    article_id INTEGER PRIMARY KEY REFERENCES articles(id) ON DELETE CASCADE,
+    population TEXT,
+    intervention TEXT,
+    comparison TEXT,
+    outcome TEXT,
+    provenance TEXT,
+    {REVIEW_COLUMNS}
+);
+CREATE INDEX IF NOT EXISTS idx_pico_status ON pico(status);
+CREATE TABLE IF NOT EXISTS quality_scores (
+    id INTEGER PRIMARY KEY,
+    article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    score_name TEXT NOT NULL,
+    score_value TEXT NOT NULL,
+    justification TEXT,
+    provenance TEXT,
+    {REVIEW_COLUMNS}
+);
+CREATE INDEX IF NOT EXISTS idx_quality_article ON quality_scores(article_id);
+CREATE INDEX IF NOT EXISTS idx_quality_status ON quality_scores(status);
+CREATE TABLE IF NOT EXISTS extracted_tables (
+    id INTEGER PRIMARY KEY,
+    article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    summary TEXT,
+    table_data TEXT NOT NULL,
+    source_filename TEXT,
+    {PROVENANCE_COLUMNS},
+    {REVIEW_COLUMNS}
+);
+CREATE INDEX IF NOT EXISTS idx_tables_article ON extracted_tables(article_id);
+CREATE TABLE IF NOT EXISTS figures (
+    id INTEGER PRIMARY KEY,
+    article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    caption TEXT NOT NULL,
+    figure_type TEXT NOT NULL,
+    source_filename TEXT,
+    {PROVENANCE_COLUMNS},
+    {REVIEW_COLUMNS}
+);
+CREATE INDEX IF NOT EXISTS idx_figures_article ON figures(article_id);
+CREATE TABLE IF NOT EXISTS article_bibliography (
+    id INTEGER PRIMARY KEY,
+    article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    entry_key TEXT NOT NULL,
+    citation_key TEXT NOT NULL,
+    full_citation TEXT NOT NULL,
+    reference_number INTEGER,
+    authors TEXT,
+    year INTEGER,
+    title TEXT,
+    venue TEXT,
+    doi TEXT,
+    pmid TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_bibliography_article ON article_bibliography(article_id);
+CREATE INDEX IF NOT EXISTS idx_bibliography_doi ON article_bibliography(doi);
+"""
+
+
+def _review_values(metadata: CorrectionMetadata) -> Tuple[str, Optional[str], Any]:
+    last_reviewed = metadata.last_reviewed
+    return (
+        metadata.status.value,
+        metadata.reviewer_comment,
+        last_reviewed.isoformat() if last_reviewed else None,
+    )
+
+
+def _review_from_row(row: sqlite3.Row) -> CorrectionMetadata:
+    return CorrectionMetadata(
+        status=row["status"],
+        reviewer_comment=row["reviewer_comment"],
+        last_reviewed=row["last_reviewed"],
+    )
+
+
+def _provenance_values(provenance: Provenance) -> Tuple[Any, ...]:
+    return (
+        provenance.source_filename,
+        provenance.page_number,
+        provenance.line_number,
+        json.dumps(provenance.bounding_box) if provenance.bounding_box else None,
+    )
+
+
+def _provenance_from_row(row: sqlite3.Row) -> Provenance:
+    return Provenance(
+        source_filename=row["source_filename"],
+        page_number=row["page_number"],
+        line_number=row["line_number"],
+        bounding_box=json.loads(row["bounding_box"]) if row["bounding_box"] else None,
+    )
+
+
+def _dump_json(value: Any) -> Optional[str]:
+    return json.dumps(value) if value is not None else None
+
+
+class CorpusStore:
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path, timeout=30)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(SCHEMA)
+        ensure_search_index(self.connection)
+
+    def __enter__(self) -> "CorpusStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def upsert(self, extraction: ArticleExtraction) -> bool:
+        key = record_key(extraction)
+        content_hash = hashlib.sha256(
+            extraction.model_dump_json().encode("utf-8")
+        ).hexdigest()
+        row = self.connection.execute(
+            "SELECT content_hash FROM articles WHERE document_key = ?", (key,)
+        ).fetchone()
+        if row is not None and row["content_hash"] == content_hash:
+            logger.debug(f"Article '{key}' is unchanged; skipping upsert.")
+            return False
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM articles WHERE document_key = ?", (key,)
+            )
+            cursor = self.connection.execute(
+                "INSERT INTO articles (document_key, document_hash, source_filename, "
+                "title, authors, summary, records_excluded_count, stage_fingerprints, "
+                "content_hash, ingested_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    extraction.document_hash,
+                    extraction.source_filename,
+                    extraction.title,
+                    json.dumps(extraction.authors),
+                    extraction.summary,
+                    extraction.records_excluded_count,
+                    json.dumps(extraction.stage_fingerprints),
+                    content_hash,
+                    datetime.utcnow().isoformat(),
+                ),
+            )
+            self._insert_children(cursor.lastrowid, extraction)
+        logger.info(f"Stored article '{key}' in corpus store.")
+        return True
+
+    def _insert_children(self, article_id: int, extraction: ArticleExtraction):
+        execute_many = self.connection.executemany
+        execute_many(
+            "INSERT INTO claims (article_id, position, claim_text, linked_citations, "
+            "uncertainty_annotation, source_filename, page_number, line_number, "
+            "bounding_box, status, reviewer_comment, last_reviewed) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    article_id,
+                    i,
+                    claim.claim_text,
+                    json.dumps(claim.linked_citations),
+                    claim.uncertainty_annotation,
+                    *_provenance_values(claim.provenance),
+                    *_review_values(claim.correction_metadata),
+                )
+                for i, claim in enumerate(extraction.claims)
+            ],
+        )
+        pico = extraction.pico_elements
+        if pico is not None:
+            self.connection.execute(
+                "INSERT INTO pico (article_id, population, intervention, comparison, "
+                "outcome, provenance, status, reviewer_comment, last_reviewed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    article_id,
+                    pico.population,
+                    pico.intervention,
+                    pico.comparison,
+                    pico.outcome,
+                    json.dumps([p.model_dump(mode="json") for p in pico.provenance]),
+                    *_review_values(pico.correction_metadata),
+                ),
+            )
+        execute_many(
+            "INSERT INTO quality_scores (article_id, position, score_name, "
+            "score_value, justification, provenance, status, reviewer_comment, "
+            "last_reviewed) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    article_id,
+                    i,
+                    score.score_name,
+                    score.score_value,
+                    score.justification,
+                    _dump_json(
+                        score.provenance.model_dump(mode="json")
+                        if score.provenance
+                        else None
+                    ),
+                    *_review_values(score.correction_metadata),
+                )
+                for i, score in enumerate(extraction.quality_scores)
+            ],
+        )
+        execute_many(
+            "INSERT INTO extracted_tables (article_id, position, summary, table_data, "
+            "source_filename, page_number, line_number, bounding_box, status, "
+            "reviewer_comment, last_reviewed) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    article_id,
+                    i,
+                    table.summary,
+                    json.dumps(table.table_data),
+                    *_provenance_values(table.provenance),
+                    *_review_values(table.correction_metadata),
+                )
+                for i, table in enumerate(extraction.tables)
+            ],
+        )
+        execute_many(
+            "INSERT INTO figures (article_id, position, caption, figure_type, "
+            "source_filename, page_number, line_number, bounding_box, status, "
+            "reviewer_comment, last_reviewed) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    article_id,
+                    i,
+                    figure.caption,
+                    figure.figure_type,
+                    *_provenance_values(figure.provenance),
+                    *_review_values(figure.correction_metadata),
+                )
+                for i, figure in enumerate(extraction.figures)
+            ],
+        )
+        execute_many(
+            "INSERT INTO article_bibliography (article_id, position, entry_key, "
+            "citation_key, full_citation, reference_number, authors, year, title, "
+            "venue, doi, pmid) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    article_id,
+                    i,
+                    entry_key,
+                    item.citation_key,
+                    item.full_citation,
+                    item.reference_number,
+                    json.dumps(item.authors),
+                    item.year,
+                    item.title,
+                    item.venue,
+                    item.doi,
+                    item.pmid,
+                )
+                for i, (entry_key, item) in enumerate(extraction.bibliography.items())
+            ],
+        )
+
+    def ingest_files(self, json_paths: Iterable[Path]) -> Dict[str, int]:
+        counts = {"stored": 0, "unchanged": 0, "skipped": 0}
+        for json_path in json_paths:
+            extraction = load_extraction(str(json_path))
+            if extraction is None:
+                counts["skipped"] += 1
+                continue
+            counts["stored" if self.upsert(extraction) else "unchanged"] += 1
+        logger.info(
+            f"Ingested extractions: {counts['stored']} stored, "
+            f"{counts['unchanged']} unchanged, {counts['skipped']} skipped."
+        )
+        return counts
+
+    def ingest_corpus(self, corpus_path: str) -> Dict[str, int]:
+        counts = {"stored": 0, "unchanged": 0, "skipped": 0}
+        for extraction in CorpusReader(corpus_path):
+            counts["stored" if self.upsert(extraction) else "unchanged"] += 1
+        logger.info(
+            f"Ingested '{corpus_path}': {counts['stored']} stored, "
+            f"{counts['unchanged']} unchanged."
+        )
+        return counts
+
+    def _article_id(self, key: str) -> Optional[int]:
+        row = self.connection.execute(
+            "SELECT id FROM articles WHERE document_key = ? OR document_hash = ? "
+            "OR source_filename = ? ORDER BY document_key = ? DESC LIMIT 1",
+            (key, key, key, key),
+        ).fetchone()
+        return row["id"] if row else None
+
+    def document_keys(self) -> List[str]:
+        cursor = self.connection.execute(
+            "SELECT document_key FROM articles ORDER BY source_filename"
+        )
+        return [row["document_key"] for row in cursor]
+
+    def get(self, key: str) -> Optional[ArticleExtraction]:
+        article_id = self._article_id(key)
+        if article_id is None:
+            return None
+        return self._load_article(article_id)
+
+    def iter_articles(self) -> Iterator[ArticleExtraction]:
+        cursor = self.connection.execute(
+            "SELECT id FROM articles ORDER BY source_filename"
+        )
+        for article_id in [row["id"] for row in cursor]:
+            yield self._load_article(article_id)
+
+    def _rows(self, table: str, article_id: int) -> List[sqlite3.Row]:
+        return self.connection.execute(
+            f"SELECT * FROM {table} WHERE article_id = ? ORDER BY position",
+            (article_id,),
+        ).fetchall()
+
+    def _load_article(self, article_id: int) -> ArticleExtraction:
+        article = self.connection.execute(
+            "SELECT * FROM articles WHERE id = ?", (article_id,)
+        ).fetchone()
+        extraction = ArticleExtraction(
+            source_filename=article["source_filename"],
+            title=article["title"],
+            authors=json.loads(article["authors"] or "[]"),
+            summary=article["summary"],
+            records_excluded_count=article["records_excluded_count"],
+            document_hash=article["document_hash"],
+            stage_fingerprints=json.loads(article["stage_fingerprints"] or "{}"),
+        )
+        extraction.claims = [
+            Claim(
+                claim_text=row["claim_text"],
+                linked_citations=json.loads(row["linked_citations"] or "[]"),
+                uncertainty_annotation=row["uncertainty_annotation"],
+                provenance=_provenance_from_row(row),
+                correction_metadata=_review_from_row(row),
+            )
+            for row in self._rows("claims", article_id)
+        ]
+        pico_row = self.connection.execute(
+            "SELECT * FROM pico WHERE article_id = ?", (article_id,)
+        ).fetchone()
+        if pico_row is not None:
+            extraction.pico_elements = PICO(
+                population=pico_row["population"],
+                intervention=pico_row["intervention"],
+                comparison=pico_row["comparison"],
+                outcome=pico_row["outcome"],
+                provenance=json.loads(pico_row["provenance"] or "[]"),
+                correction_metadata=_review_from_row(pico_row),
+            )
+        extraction.quality_scores = [
+            QualityScore(
+                score_name=row["score_name"],
+                score_value=row["score_value"],
+                justification=row["justification"],
+                provenance=json.loads(row["provenance"]) if row["provenance"] else None,
+                correction_metadata=_review_from_row(row),
+            )
+            for row in self._rows("quality_scores", article_id)
+        ]
+        extraction.tables = [
+            ExtractedTable(
+                summary=row["summary"],
+                table_data=json.loads(row["table_data"]),
+                provenance=_provenance_from_row(row),
+                correction_metadata=_review_from_row(row),
+            )
+            for row in self._rows("extracted_tables", article_id)
+        ]
+        extraction.figures = [
+            ExtractedFigure(
+                caption=row["caption"],
+                figure_type=row["figure_type"],
+                provenance=_provenance_from_row(row),
+                correction_metadata=_review_from_row(row),
+            )
+            for row in self._rows("figures", article_id)
+        ]
+        extraction.bibliography = {
+            row["entry_key"]: BibliographyItem(
+                citation_key=row["citation_key"],
+                full_citation=row["full_citation"],
+                reference_number=row["reference_number"],
+                authors=json.loads(row["authors"] or "[]"),
+                year=row["year"],
+                title=row["title"],
+                venue=row["venue"],
+                doi=row["doi"],
+                pmid=row["pmid"],
+            )
+            for row in self._rows("article_bibliography", article_id)
+        }
+        return extraction
+
+    def find_claims(
+        self,
+        status: Optional[str] = None,
+        uncertainty_contains: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        query = (
+            "SELECT a.document_key, a.source_filename, c.position, c.claim_text, "
+            "c.uncertainty_annotation, c.page_number, c.status "
+            "FROM claims c JOIN articles a ON a.id = c.article_id WHERE 1 = 1"
+        )
+        params: List[Any] = []
+        if status:
+            query += " AND c.status = ?"
+            params.append(status)
+        if uncertainty_contains:
+            query += " AND c.uncertainty_annotation LIKE ?"
+            params.append(f"%{uncertainty_contains}%")
+        query += " ORDER BY a.source_filename, c.position"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [dict(row) for row in self.connection.execute(query, params)]
+
+    def search(
+        self,
+        query: str,
+        status: Optional[str] = None,
+        kinds: Optional[List[str]] = None,
+        population: Optional[str] = None,
+        limit: int = 20,
+        raw: bool = False,
+    ) -> List[Dict[str, Any]]:
+        return search(self.connection, query, status, kinds, population, limit, raw)
@@ -0,0 +1,213 @@
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+from typing import Dict, List, Optional
+
+from evidence_extractor.extraction.references import normalize_doi, normalize_pmid
+from evidence_extractor.models.schemas import BibliographyItem
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS bib_references (
+    id INTEGER PRIMARY KEY,
+    ref_key TEXT NOT NULL UNIQUE,
+    doi TEXT,
+    pmid TEXT,
+    authors TEXT,
+    year INTEGER,
+    title TEXT,
+    venue TEXT,
+    full_citation TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_bib_references_doi ON bib_references(doi);
+CREATE INDEX IF NOT EXISTS idx_bib_references_pmid ON bib_references(pmid);
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    article_key TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS article_references (
+    article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+    reference_id INTEGER NOT NULL REFERENCES bib_references(id),
+    citation_key TEXT NOT NULL,
+    PRIMARY KEY (article_id, reference_id)
+);
+CREATE INDEX IF NOT EXISTS idx_article_references_reference
+    ON article_references(reference_id);
+"""
+
+
+def _normalize_words(text: str) -> str:
+    return " ".join(re.findall(r"[a-z0-9]+", text.lower()))
+
+
+def reference_fingerprint(item: BibliographyItem) -> str:
+    doi = normalize_doi(item.doi)
+    if doi:
+        return f"doi:{doi}"
+    pmid = normalize_pmid(item.pmid)
+    if pmid:
+        return f"pmid:{pmid}"
+    if item.title:
+        surname = item.authors[0].split(",")[0].split()[0] if item.authors else ""
+        basis = f"{_normalize_words(surname)}|{item.year or ''}|"
+        basis += _normalize_words(item.title)
+    else:
+        citation = re.sub(r"^\s*(?:\[\d+\]|\d+[.)])\s*", "", item.full_citation)
+        basis = _normalize_words(citation)
+    return "fp:" + hashlib.sha1(basis.encode("utf-8")).hexdigest()[:20]
+
+
+class ReferenceStore:
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self) -> "ReferenceStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def _find_existing(
+        self, ref_key: str, doi: Optional[str], pmid: Optional[str]
+    ) -> Optional[int]:
+        # The same paper may be cited with a DOI in one article and only a PMID in
+        # another, so either identifier is enough to match a stored row.
+        for column, value in (("doi", doi), ("pmid", pmid), ("ref_key", ref_key)):
+            if not value:
+                continue
+            row = self.connection.execute(
+                f"SELECT id FROM bib_references WHERE {column} = ? ORDER BY id",
+                (value,),
+            ).fetchone()
+            if row:
+                return row[0]
+        return None
+
+    def intern_references(self, items: List[BibliographyItem]) -> List[int]:
+        ids = []
+        for item in items:
+            ref_key = reference_fingerprint(item)
+            doi = normalize_doi(item.doi)
+            pmid = normalize_pmid(item.pmid)
+            reference_id = self._find_existing(ref_key, doi, pmid)
+            if reference_id is not None:
+                self.connection.execute(
+                    "UPDATE bib_references SET doi = COALESCE(doi, ?), "
+                    "pmid = COALESCE(pmid, ?) WHERE id = ?",
+                    (doi, pmid, reference_id),
+                )
+            else:
+                cursor = self.connection.execute(
+                    "INSERT INTO bib_references (ref_key, doi, pmid, authors, "
+                    "year, title, venue, full_citation) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        ref_key,
+                        doi,
+                        pmid,
+                        json.dumps(item.authors),
+                        item.year,
+                        item.title,
+                        item.venue,
+                        item.full_citation,
+                    ),
+                )
+                reference_id = cursor.lastrowid
+            ids.append(reference_id)
+        return ids
+
+    def add_article(
+        self, article_key: str, bibliography: Dict[str, BibliographyItem]
+    ) -> List[int]:
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO articles (article_key) VALUES (?)",
+                (article_key,),
+            )
+            article_id = self.connection.execute(
+                "SELECT id FROM articles WHERE article_key = ?", (article_key,)
+            ).fetchone()[0]
+            self.connection.execute(
+                "DELETE FROM article_references WHERE article_id = ?", (article_id,)
+            )
+            reference_ids = self.intern_references(list(bibliography.values()))
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO article_references "
+                "(article_id, reference_id, citation_key) VALUES (?, ?, ?)",
+                [
+                    (article_id, reference_id, citation_key)
+                    for citation_key, reference_id in zip(bibliography, reference_ids)
+                ],
+            )
+        logger.info(
+            f"Stored {len(reference_ids)} references for article '{article_key}'."
+        )
+        return reference_ids
+
+    def article_reference_ids(self, article_key: str) -> List[int]:
+        cursor = self.connection.execute(
+            "SELECT ar.reference_id FROM article_references ar "
+            "JOIN articles a ON a.id = ar.article_id WHERE a.article_key = ? "
+            "ORDER BY ar.reference_id",
+            (article_key,),
+        )
+        return [row[0] for row in cursor]
+
+    def get_reference(self, reference_id: int) -> Optional[BibliographyItem]:
+        row = self.connection.execute(
+            "SELECT ref_key, doi, pmid, authors, year, title, venue, full_citation "
+            "FROM bib_references WHERE id = ?",
+            (reference_id,),
+        ).fetchone()
+        if not row:
+            return None
+        return BibliographyItem(
+            citation_key=row[0],
+            doi=row[1],
+            pmid=row[2],
+            authors=json.loads(row[3] or "[]"),
+            year=row[4],
+            title=row[5],
+            venue=row[6],
+            full_citation=row[7],
+        )
+
+    def find_reference_ids(self, identifier: str) -> List[int]:
+        identifier = identifier.strip()
+        lowered = identifier.lower()
+        doi = normalize_doi(identifier)
+        if doi:
+            query, params = "SELECT id FROM bib_references WHERE doi = ?", (doi,)
+        elif lowered.startswith("pmid:") or identifier.isdigit():
+            query = "SELECT id FROM bib_references WHERE pmid = ?"
+            params = (normalize_pmid(identifier),)
+        elif lowered.startswith(("doi:", "fp:")):
+            query = "SELECT id FROM bib_references WHERE ref_key = ?"
+            params = (lowered,)
+        else:
+            query = "SELECT id FROM bib_references WHERE lower(title) = ?"
+            params = (lowered,)
+        return [row[0] for row in self.connection.execute(query, params)]
+
+    def articles_citing(self, identifier: str) -> List[str]:
+        reference_ids = self.find_reference_ids(identifier)
+        if not reference_ids:
+            return []
+        placeholders = ",".join("?" for _ in reference_ids)
+        cursor = self.connection.execute(
+            "SELECT DISTINCT a.article_key FROM article_references ar "
+            "JOIN articles a ON a.id = ar.article_id "
+            f"WHERE ar.reference_id IN ({placeholders}) ORDER BY a.article_key",
+            reference_ids,
+        )
+        return [row[0] for row in cursor]
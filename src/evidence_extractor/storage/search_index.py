@@ -0,0 +1,146 @@
+import logging
+import sqlite3
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+SEARCH_COLUMNS = ("body", "population", "intervention", "comparison", "outcome")
+
+SEARCH_KINDS = {"claim": 0, "pico": 1, "table": 2, "figure": 3}
+
+# kind -> (source table, row id column, position expression, indexed columns)
+SEARCH_SOURCES = {
+    "claim": ("claims", "id", "position", {"body": "claim_text"}),
+    "pico": (
+        "pico",
+        "article_id",
+        "0",
+        {
+            "population": "population",
+            "intervention": "intervention",
+            "comparison": "comparison",
+            "outcome": "outcome",
+        },
+    ),
+    "table": ("extracted_tables", "id", "position", {"body": "summary"}),
+    "figure": ("figures", "id", "position", {"body": "caption"}),
+}
+
+
+def _rowid(kind: str, prefix: str) -> str:
+    id_column = SEARCH_SOURCES[kind][1]
+    return f"{prefix}{id_column} * {len(SEARCH_KINDS)} + {SEARCH_KINDS[kind]}"
+
+
+def _values(kind: str, prefix: str) -> str:
+    _, id_column, position, columns = SEARCH_SOURCES[kind]
+    indexed = [
+        f"{prefix}{columns[name]}" if name in columns else "NULL"
+        for name in SEARCH_COLUMNS
+    ]
+    position = position if position == "0" else f"{prefix}{position}"
+    return (
+        f"{_rowid(kind, prefix)}, {', '.join(indexed)}, '{kind}', "
+        f"{prefix}article_id, {position}, {prefix}status"
+    )
+
+
+INSERT_COLUMNS = (
+    f"rowid, {', '.join(SEARCH_COLUMNS)}, kind, article_id, position, status"
+)
+
+
+def _triggers(kind: str) -> str:
+    table = SEARCH_SOURCES[kind][0]
+    delete = f"DELETE FROM search_index WHERE rowid = {_rowid(kind, 'old.')}"
+    return f"""
+CREATE TRIGGER IF NOT EXISTS {table}_search_insert AFTER INSERT ON {table} BEGIN
+    INSERT INTO search_index ({INSERT_COLUMNS}) VALUES ({_values(kind, "new.")});
+END;
+CREATE TRIGGER IF NOT EXISTS {table}_search_delete AFTER DELETE ON {table} BEGIN
+    {delete};
+END;
+CREATE TRIGGER IF NOT EXISTS {table}_search_update AFTER UPDATE ON {table} BEGIN
+    {delete};
+    INSERT INTO search_index ({INSERT_COLUMNS}) VALUES ({_values(kind, "new.")});
+END;
+"""
+
+
+SEARCH_SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+    {", ".join(SEARCH_COLUMNS)},
+    kind UNINDEXED,
+    article_id UNINDEXED,
+    position UNINDEXED,
+    status UNINDEXED,
+    tokenize = 'porter unicode61'
+);
+{"".join(_triggers(kind) for kind in SEARCH_SOURCES)}
+"""
+
+
+def rebuild_search_index(connection: sqlite3.Connection):
+    with connection:
+        connection.execute("DELETE FROM search_index")
+        for kind, (table, _, _, _) in SEARCH_SOURCES.items():
+            connection.execute(
+                f"INSERT INTO search_index ({INSERT_COLUMNS}) "
+                f"SELECT {_values(kind, '')} FROM {table}"
+            )
+    logger.info("Rebuilt the corpus search index.")
+
+
+def ensure_search_index(connection: sqlite3.Connection):
+    connection.executescript(SEARCH_SCHEMA)
+    indexed = connection.execute("SELECT 1 FROM search_index LIMIT 1").fetchone()
+    stored = connection.execute("SELECT 1 FROM articles LIMIT 1").fetchone()
+    if stored is not None and indexed is None:
+        rebuild_search_index(connection)
+
+
+def fts_query(text: str) -> str:
+    terms = [term.replace('"', '""') for term in text.split()]
+    return " ".join(f'"{term}"' for term in terms)
+
+
+def search(
+    connection: sqlite3.Connection,
+    query: str,
+    status: Optional[str] = None,
+    kinds: Optional[Sequence[str]] = None,
+    population: Optional[str] = None,
+    limit: int = 20,
+    raw: bool = False,
+) -> List[Dict[str, Any]]:
+    match = query if raw else fts_query(query)
+    if not match:
+        return []
+    sql = (
+        "SELECT a.document_key, a.source_filename, a.title, search_index.kind, "
+        "search_index.position, search_index.status, "
+        "snippet(search_index, -1, '[', ']', '...', 12) AS snippet, "
+        "bm25(search_index) AS rank FROM search_index "
+        "JOIN articles a ON a.id = search_index.article_id "
+        "WHERE search_index MATCH ?"
+    )
+    params: List[Any] = [match]
+    if status:
+        sql += " AND search_index.status = ?"
+        params.append(status)
+    if kinds:
+        sql += f" AND search_index.kind IN ({', '.join('?' for _ in kinds)})"
+        params.extend(kinds)
+    if population:
+        sql += (
+            " AND search_index.article_id IN (SELECT article_id FROM search_index "
+            "WHERE search_index MATCH ?)"
+        )
+        params.append(f"population : ({fts_query(population)})")
+    sql += " ORDER BY rank LIMIT ?"
+    params.append(limit)
+    try:
+        return [dict(row) for row in connection.execute(sql, params)]
+    except sqlite3.OperationalError as e:
+        logger.error(f"Search query '{query}' failed: {e}")
+        return []
@@ -1,5 +1,7 @@
+import json
 from pathlib import Path
 from typing import Generator
+from unittest.mock import MagicMock
 
 import fitz
 import pytest
@@ -24,3 +26,46 @@ def mock_pdf_path(tmp_path_factory) -> Generator[Path, None, None]:
     doc.close()
 
     yield file_path
+
+
+ORCHESTRATOR_RESPONSE = json.dumps(
+    {
+        "pico": {"population": "Adults", "intervention": "Aspirin"},
+        "quality": {"score_name": "Methodological Quality", "score_value": "High"},
+        "claims": [{"claim_text": "Aspirin reduced pain by 30%"}],
+    }
+)
+
+
+@pytest.fixture
+def article_pdf(tmp_path: Path) -> str:
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((50, 72), "Results", fontsize=14, fontname="hebo")
+    page.insert_text((50, 100), "Aspirin reduced pain by 30% [1].")
+    page.insert_text((50, 130), "References", fontsize=14, fontname="hebo")
+    page.insert_text((50, 160), "[1] Smith, J. (2020). Aspirin trial. Lancet, 1, 3.")
+    path = tmp_path / "article.pdf"
+    doc.save(path)
+    doc.close()
+    return str(path)
+
+
+@pytest.fixture
+def mock_gemini_client(mocker):
+    mocker.patch("camelot.read_pdf", return_value=[])
+
+    def query(prompt):
+        if "top-level keys" in prompt:
+            return ORCHESTRATOR_RESPONSE
+        if "linguistic certainty" in prompt:
+            return '[{"claim_index": 1, "annotation": "Confidence: High."}]'
+        return "Aspirin works."
+
+    client = MagicMock()
+    client.text_model_name = "text-model"
+    client.vision_model_name = "vision-model"
+    client.is_configured.return_value = True
+    client.query.side_effect = query
+    client.query_with_image.return_value = "No caption found."
+    return client
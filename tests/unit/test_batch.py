@@ -0,0 +1,187 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from evidence_extractor.models.schemas import (
+    ArticleExtraction,
+    Claim,
+    Provenance,
+)
+from evidence_extractor.pipeline import batch
+from evidence_extractor.pipeline.batch import (
+    RUN_SUMMARY_FILENAME,
+    collect_pdf_paths,
+    output_path_for,
+    run_batch,
+)
+from evidence_extractor.pipeline.checkpoints import document_hash
+from evidence_extractor.pipeline.dag import PipelineReport, StageResult, StageStatus
+from evidence_extractor.storage.corpus_store import CorpusStore
+
+
+@pytest.fixture
+def pdf_tree(tmp_path: Path) -> Path:
+    (tmp_path / "nested").mkdir()
+    for name in ["a.pdf", "b.PDF", "notes.txt", "nested/a.pdf"]:
+        (tmp_path / name).write_bytes(b"%PDF-1.4")
+    return tmp_path
+
+
+def test_collect_pdf_paths_from_directory(pdf_tree: Path):
+    assert [p.name for p in collect_pdf_paths(str(pdf_tree))] == ["a.pdf", "b.PDF"]
+    assert len(collect_pdf_paths(str(pdf_tree), recursive=True)) == 3
+
+
+def test_collect_pdf_paths_from_manifest(pdf_tree: Path):
+    manifest = pdf_tree / "manifest.txt"
+    manifest.write_text("# corpus\na.pdf\n\nnested/a.pdf\n")
+    paths = collect_pdf_paths(str(manifest))
+    assert paths == [pdf_tree / "a.pdf", pdf_tree / "nested" / "a.pdf"]
+
+
+def test_output_path_for_avoids_name_collisions(pdf_tree: Path, tmp_path: Path):
+    top = output_path_for(pdf_tree / "a.pdf", pdf_tree, tmp_path)
+    nested = output_path_for(pdf_tree / "nested" / "a.pdf", pdf_tree, tmp_path)
+    assert top.name == "a.json"
+    assert nested.name == "nested__a.json"
+    first = output_path_for(pdf_tree / "a.pdf", None, tmp_path)
+    second = output_path_for(pdf_tree / "nested" / "a.pdf", None, tmp_path)
+    outside = output_path_for(pdf_tree / "a.pdf", pdf_tree / "nested", tmp_path)
+    assert first.name.startswith("a-") and second.name.startswith("a-")
+    assert first != second
+    assert outside == first
+
+
+def test_run_batch_writes_outputs_and_summary(pdf_tree: Path, tmp_path, mocker):
+    mocker.patch.object(batch, "GeminiClient")
+
+    def fake_run_pipeline(pdf_path, client, reference_store_path=None, **kwargs):
+        if pdf_path.endswith("b.PDF"):
+            return None
+        return ArticleExtraction(source_filename=pdf_path), PipelineReport()
+
+    mocker.patch.object(batch, "run_pipeline", side_effect=fake_run_pipeline)
+    output_dir = tmp_path / "out"
+    summary = run_batch(
+        collect_pdf_paths(str(pdf_tree)), str(output_dir), workers=1, root=pdf_tree
+    )
+
+    assert summary["documents_total"] == 2
+    assert summary["documents_succeeded"] == 1
+    ok, failed = summary["documents"]
+    assert ok["status"] == "ok"
+    assert ok["seconds"] >= 0
+    assert Path(ok["output_path"]).exists()
+    assert failed["status"] == "failed"
+    assert failed["error"]
+    with open(output_dir / RUN_SUMMARY_FILENAME) as f:
+        assert json.load(f)["documents_failed"] == 1
+
+
+def test_run_batch_appends_to_jsonl_corpus(pdf_tree: Path, tmp_path, mocker):
+    mocker.patch.object(batch, "GeminiClient")
+    mocker.patch.object(
+        batch,
+        "run_pipeline",
+        side_effect=lambda pdf_path, client, **kwargs: (
+            ArticleExtraction(source_filename=pdf_path),
+            PipelineReport(),
+        ),
+    )
+    corpus_path = tmp_path / "corpus.jsonl"
+    summary = run_batch(
+        collect_pdf_paths(str(pdf_tree)),
+        str(tmp_path / "out"),
+        corpus_path=str(corpus_path),
+    )
+
+    assert summary["documents_succeeded"] == 2
+    assert all(r["output_path"] == str(corpus_path) for r in summary["documents"])
+    assert not list((tmp_path / "out").glob("a*.json"))
+    assert len(corpus_path.read_text().splitlines()) == 2
+
+
+def test_run_batch_upserts_into_corpus_store(pdf_tree: Path, tmp_path, mocker):
+    mocker.patch.object(batch, "GeminiClient")
+    mocker.patch.object(
+        batch,
+        "run_pipeline",
+        side_effect=lambda pdf_path, client, **kwargs: (
+            ArticleExtraction(
+                source_filename=pdf_path,
+                claims=[
+                    Claim(
+                        claim_text="Statins reduce mortality.",
+                        provenance=Provenance(source_filename=pdf_path, page_number=1),
+                    )
+                ],
+            ),
+            PipelineReport(),
+        ),
+    )
+    store_path = tmp_path / "corpus.sqlite"
+    run_batch(
+        collect_pdf_paths(str(pdf_tree)),
+        str(tmp_path / "out"),
+        root=pdf_tree,
+        store_path=str(store_path),
+    )
+
+    with CorpusStore(str(store_path)) as store:
+        assert len(store.document_keys()) == 2
+        assert len(store.search("statin")) == 2
+
+
+def test_run_batch_discards_checkpoints_of_clean_runs(pdf_tree: Path, tmp_path, mocker):
+    mocker.patch.object(batch, "GeminiClient")
+    (pdf_tree / "b.PDF").write_bytes(b"%PDF-1.4 other")
+    checkpoint_root = tmp_path / "checkpoints"
+
+    def fake_run_pipeline(pdf_path, client, checkpoint_root=None, **kwargs):
+        doc_hash = document_hash(pdf_path)
+        (Path(checkpoint_root) / doc_hash[:16]).mkdir(parents=True)
+        report = PipelineReport()
+        if pdf_path.endswith("b.PDF"):
+            report.stages["summary"] = StageResult(
+                name="summary", status=StageStatus.FAILED
+            )
+        extraction = ArticleExtraction(source_filename=pdf_path)
+        extraction.document_hash = doc_hash
+        return extraction, report
+
+    mocker.patch.object(batch, "run_pipeline", side_effect=fake_run_pipeline)
+    run_batch(
+        collect_pdf_paths(str(pdf_tree)),
+        str(tmp_path / "out"),
+        root=pdf_tree,
+        pipeline_options={"checkpoint_root": str(checkpoint_root)},
+    )
+    remaining = [path.name for path in checkpoint_root.iterdir()]
+    assert remaining == [document_hash(str(pdf_tree / "b.PDF"))[:16]]
+
+
+def test_run_batch_keeps_checkpoints_when_output_write_fails(
+    pdf_tree: Path, tmp_path, mocker
+):
+    mocker.patch.object(batch, "GeminiClient")
+    mocker.patch.object(batch, "save_to_json_atomic", side_effect=OSError("disk full"))
+    checkpoint_root = tmp_path / "checkpoints"
+
+    def fake_run_pipeline(pdf_path, client, checkpoint_root=None, **kwargs):
+        extraction = ArticleExtraction(source_filename=pdf_path)
+        extraction.document_hash = document_hash(pdf_path)
+        (Path(checkpoint_root) / extraction.document_hash[:16]).mkdir(parents=True)
+        return extraction, PipelineReport()
+
+    mocker.patch.object(batch, "run_pipeline", side_effect=fake_run_pipeline)
+    summary = run_batch(
+        [pdf_tree / "a.pdf"],
+        str(tmp_path / "out"),
+        root=pdf_tree,
+        pipeline_options={"checkpoint_root": str(checkpoint_root)},
+    )
+    (record,) = summary["documents"]
+    assert record["status"] == "failed"
+    assert record["error"] == "disk full"
+    assert len(list(checkpoint_root.iterdir())) == 1
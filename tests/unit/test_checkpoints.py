@@ -0,0 +1,78 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from evidence_extractor.models.schemas import Claim, Provenance
+from evidence_extractor.pipeline.checkpoints import (
+    CheckpointStore,
+    checkpoint_dir_for,
+    document_hash,
+)
+from evidence_extractor.pipeline.dag import Stage, StageStatus, run_stages
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> CheckpointStore:
+    return CheckpointStore(str(tmp_path / "checkpoints"), "paper.pdf")
+
+
+def test_checkpoint_round_trips_typed_outputs(store: CheckpointStore):
+    stage = Stage("claims", lambda inputs: None, output_type=List[Claim])
+    claims = [
+        Claim(
+            claim_text="A claim.",
+            provenance=Provenance(source_filename="paper.pdf", page_number=2),
+        )
+    ]
+    store.save(stage, claims)
+    found, loaded = store.load(stage)
+    assert found
+    assert loaded == claims
+    assert isinstance(loaded[0], Claim)
+    assert store.completed_stages() == ["claims"]
+
+
+def test_checkpoint_load_ignores_missing_and_corrupt(store: CheckpointStore):
+    stage = Stage("summary", lambda inputs: None)
+    assert store.load(stage) == (False, None)
+    store.path_for("summary").parent.mkdir(parents=True)
+    store.path_for("summary").write_text("{not json")
+    assert store.load(stage) == (False, None)
+
+
+def test_checkpoint_dir_is_keyed_by_content(tmp_path: Path):
+    first = tmp_path / "a.pdf"
+    second = tmp_path / "b.pdf"
+    first.write_bytes(b"same")
+    second.write_bytes(b"same")
+    assert checkpoint_dir_for("root", str(first)) == checkpoint_dir_for(
+        "root", str(second)
+    )
+    assert len(document_hash(str(first))) == 64
+
+
+def test_run_stages_resumes_from_checkpoints(store: CheckpointStore):
+    calls = []
+
+    def make(name, value):
+        def run(inputs):
+            calls.append(name)
+            return value + sum(inputs.values())
+
+        return run
+
+    def fail(inputs):
+        raise RuntimeError("killed")
+
+    stages = [Stage("a", make("a", 1)), Stage("b", fail, ["a"])]
+    first = run_stages(stages, checkpoints=store)
+    assert first.stages["b"].status == StageStatus.FAILED
+    assert store.completed_stages() == ["a"]
+
+    calls.clear()
+    stages = [Stage("a", make("a", 1)), Stage("b", make("b", 10), ["a"])]
+    second = run_stages(stages, checkpoints=store, resume=True)
+    assert calls == ["b"]
+    assert second.stages["a"].from_checkpoint
+    assert second.output("b") == 11
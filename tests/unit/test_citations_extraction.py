@@ -1,11 +1,13 @@
 import pytest
 
 from evidence_extractor.extraction.citations import (
+    build_citation_index,
     find_references_section,
+    link_claims_to_citations,
     link_in_text_citations,
     parse_bibliography,
 )
-from evidence_extractor.models.schemas import BibliographyItem
+from evidence_extractor.models.schemas import BibliographyItem, Claim, Provenance
 
 
 @pytest.fixture
@@ -71,3 +73,59 @@ def test_link_in_text_citations():
     assert "Jones2021" in links
     assert "Miller2020" not in links
     assert "Smith (2022)" in links["Smith2022"]
+
+
+@pytest.fixture
+def numeric_bibliography():
+    return {
+        f"ref_{n}": BibliographyItem(
+            citation_key=f"ref_{n}", full_citation=f"[{n}] Author{n}, X. ({2000 + n})."
+        )
+        for n in range(1, 9)
+    }
+
+
+def test_build_citation_index_numeric_ranges(numeric_bibliography):
+    body = (
+        "Earlier work established the baseline [1]. "
+        "Several trials confirmed the effect [3–5, 8]. "
+        "No citation appears here."
+    )
+    index = build_citation_index(body, numeric_bibliography)
+    assert len(index) == 3
+    assert index.keys_for_span(*index.sentence_span(0)) == ["ref_1"]
+    assert index.keys_for_span(*index.sentence_span(1)) == [
+        "ref_3",
+        "ref_4",
+        "ref_5",
+        "ref_8",
+    ]
+    assert index.keys_for_span(*index.sentence_span(2)) == []
+
+
+def test_build_citation_index_author_year():
+    bibliography = {
+        "Smith2022": BibliographyItem(
+            citation_key="Smith2022", full_citation="Smith, J. (2022)."
+        ),
+        "Jones2021": BibliographyItem(
+            citation_key="Jones2021", full_citation="Jones, A. (2021)."
+        ),
+    }
+    body = "Mortality fell by 20% (Smith et al., 2022; Jones 2021). Jones 2020 differs."
+    index = build_citation_index(body, bibliography)
+    assert index.keys_for_text("Mortality fell by 20%") == ["Smith2022", "Jones2021"]
+    assert index.keys_for_text("Jones 2020 differs.") == []
+
+
+def test_link_claims_to_citations(numeric_bibliography):
+    body = "Background text [2].\nTreatment reduced\nrisk by 35% [6-7]. Other text."
+    index = build_citation_index(body, numeric_bibliography)
+    p = Provenance(source_filename="test.pdf", page_number=1)
+    claims = [
+        Claim(claim_text="Treatment reduced risk by 35%", provenance=p),
+        Claim(claim_text="Not present in the document", provenance=p),
+    ]
+    assert link_claims_to_citations(claims, index) == 1
+    assert claims[0].linked_citations == ["ref_6", "ref_7"]
+    assert claims[1].linked_citations == []
@@ -0,0 +1,116 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from evidence_extractor.models.schemas import (
+    PICO,
+    ArticleExtraction,
+    BibliographyItem,
+    Claim,
+    CorrectionMetadata,
+    ExtractedFigure,
+    ExtractedTable,
+    Provenance,
+    QualityScore,
+    ValidationStatus,
+)
+from evidence_extractor.output.json_builder import save_to_json
+from evidence_extractor.storage.corpus_store import CorpusStore
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    with CorpusStore(str(tmp_path / "corpus.sqlite")) as corpus_store:
+        yield corpus_store
+
+
+def _extraction(name: str = "paper.pdf", doc_hash: str = "abc123") -> ArticleExtraction:
+    provenance = Provenance(
+        source_filename=name, page_number=2, bounding_box=[1.0, 2.0, 3.0, 4.0]
+    )
+    return ArticleExtraction(
+        source_filename=name,
+        title="A Trial",
+        authors=["Smith J"],
+        summary="Summary.",
+        records_excluded_count=3,
+        document_hash=doc_hash,
+        stage_fingerprints={"claims": "f1"},
+        claims=[
+            Claim(
+                claim_text="Drug X lowered blood pressure.",
+                linked_citations=["Smith2020"],
+                uncertainty_annotation="may",
+                provenance=provenance,
+                correction_metadata=CorrectionMetadata(
+                    status=ValidationStatus.VERIFIED,
+                    reviewer_comment="ok",
+                    last_reviewed=datetime(2024, 5, 1, 12, 30),
+                ),
+            ),
+            Claim(claim_text="Adverse events were rare.", provenance=provenance),
+        ],
+        pico_elements=PICO(
+            population="Adults", intervention="Drug X", provenance=[provenance]
+        ),
+        quality_scores=[
+            QualityScore(score_name="Jadad", score_value="4", provenance=provenance)
+        ],
+        tables=[
+            ExtractedTable(
+                summary="Baseline", table_data=[{"a": "1"}], provenance=provenance
+            )
+        ],
+        figures=[
+            ExtractedFigure(
+                caption="Flow", figure_type="flowchart", provenance=provenance
+            )
+        ],
+        bibliography={
+            "ref_1": BibliographyItem(
+                citation_key="Smith2020",
+                full_citation="Smith J. A Trial. 2020.",
+                year=2020,
+                doi="10.1000/x",
+            )
+        },
+    )
+
+
+def test_upsert_round_trips_extraction(store: CorpusStore):
+    extraction = _extraction()
+    assert store.upsert(extraction) is True
+    assert store.get("abc123") == extraction
+    assert store.get("paper.pdf") == extraction
+    assert store.get("missing") is None
+
+
+def test_upsert_skips_unchanged_and_replaces_changed(store: CorpusStore):
+    extraction = _extraction()
+    store.upsert(extraction)
+    assert store.upsert(extraction) is False
+    extraction.claims = extraction.claims[:1]
+    assert store.upsert(extraction) is True
+    assert store.connection.execute("SELECT COUNT(*) FROM claims").fetchone()[0] == 1
+    assert store.document_keys() == ["abc123"]
+
+
+def test_find_claims_filters_by_status(store: CorpusStore):
+    store.upsert(_extraction())
+    store.upsert(_extraction("other.pdf", "def456"))
+    verified = store.find_claims(status="verified")
+    assert [row["source_filename"] for row in verified] == ["other.pdf", "paper.pdf"]
+    hedged = store.find_claims(uncertainty_contains="may", limit=1)
+    assert len(hedged) == 1
+
+
+def test_ingest_files_counts_outcomes(store: CorpusStore, tmp_path: Path):
+    good = tmp_path / "paper.json"
+    save_to_json(_extraction(), str(good))
+    bad = tmp_path / "broken.json"
+    bad.write_text("{not json")
+    counts = store.ingest_files([good, bad])
+    assert counts == {"stored": 1, "unchanged": 0, "skipped": 1}
+    assert store.ingest_files([good])["unchanged"] == 1
+    assert [a.source_filename for a in store.iter_articles()] == ["paper.pdf"]
@@ -0,0 +1,96 @@
+import threading
+import time
+
+import pytest
+
+from evidence_extractor.pipeline.dag import Stage, StageStatus, run_stages
+
+
+def test_run_stages_passes_dependency_outputs():
+    stages = [
+        Stage("a", lambda inputs: 2),
+        Stage("b", lambda inputs: inputs["a"] * 3, ["a"]),
+        Stage("c", lambda inputs: inputs["a"] + inputs["b"], ["a", "b"]),
+    ]
+    report = run_stages(stages)
+    assert report.output("c") == 8
+    assert all(r.status == StageStatus.OK for r in report.stages.values())
+
+
+def test_run_stages_runs_independent_stages_concurrently():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def meet(_):
+        barrier.wait()
+        return True
+
+    report = run_stages([Stage(name, meet) for name in ["x", "y", "z"]])
+    assert [report.output(name) for name in ["x", "y", "z"]] == [True] * 3
+
+
+def test_run_stages_skips_dependents_of_failed_stage():
+    def boom(_):
+        raise RuntimeError("boom")
+
+    stages = [
+        Stage("bad", boom),
+        Stage("after_bad", lambda inputs: 1, ["bad"]),
+        Stage("independent", lambda inputs: 2),
+    ]
+    report = run_stages(stages)
+    assert report.stages["bad"].status == StageStatus.FAILED
+    assert report.stages["bad"].error == "boom"
+    assert report.stages["after_bad"].status == StageStatus.SKIPPED
+    assert report.output("independent") == 2
+
+
+def test_run_stages_enforces_timeouts():
+    slow = Stage("slow", lambda inputs: slow.cancel_event.wait(5), timeout=0.05)
+    stages = [slow, Stage("after_slow", lambda inputs: 1, ["slow"])]
+    start = time.perf_counter()
+    report = run_stages(stages)
+    assert time.perf_counter() - start < 2
+    assert report.stages["slow"].status == StageStatus.TIMEOUT
+    assert report.stages["after_slow"].status == StageStatus.SKIPPED
+
+
+def test_run_stages_waits_for_cancelled_stages():
+    calls = []
+
+    def llm_loop(_):
+        for _ in range(100):
+            slow.check_cancelled()
+            calls.append(1)
+            time.sleep(0.02)
+
+    slow = Stage("slow", llm_loop, timeout=0.05)
+    report = run_stages([slow])
+    made = len(calls)
+    time.sleep(0.1)
+    assert report.stages["slow"].status == StageStatus.TIMEOUT
+    assert made < 10
+    assert len(calls) == made
+
+
+def test_run_stages_reports_critical_path():
+    def sleeper(seconds):
+        return lambda inputs: time.sleep(seconds)
+
+    stages = [
+        Stage("fast", sleeper(0.01)),
+        Stage("slow", sleeper(0.15)),
+        Stage("after_fast", sleeper(0.01), ["fast"]),
+        Stage("after_slow", sleeper(0.01), ["slow"]),
+    ]
+    report = run_stages(stages)
+    assert report.critical_path == ["slow", "after_slow"]
+    assert report.wall_seconds < 0.15 + 0.01 + 0.01 + 0.01 + 0.1
+
+
+def test_run_stages_rejects_invalid_graphs():
+    with pytest.raises(ValueError, match="unknown stage"):
+        run_stages([Stage("a", lambda inputs: 1, ["missing"])])
+    with pytest.raises(ValueError, match="cycle"):
+        run_stages(
+            [Stage("a", lambda inputs: 1, ["b"]), Stage("b", lambda inputs: 1, ["a"])]
+        )
@@ -0,0 +1,145 @@
+import json
+from pathlib import Path
+from typing import Dict
+
+from evidence_extractor.evaluation import harness
+from evidence_extractor.evaluation.harness import (
+    collect_gold_pairs,
+    llm_cost,
+    run_evaluation,
+)
+from evidence_extractor.models.schemas import ArticleExtraction, Claim, Provenance
+from evidence_extractor.pipeline.dag import PipelineReport, StageResult, StageStatus
+
+
+class FakeClient:
+    def __init__(self, request_semaphore=None):
+        self.usage: Dict[str, int] = {
+            "requests": 0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+        }
+
+    def is_configured(self) -> bool:
+        return True
+
+    def usage_snapshot(self) -> Dict[str, int]:
+        return dict(self.usage)
+
+
+def _fake_run_pipeline(pdf_path, client, previous=None, **kwargs):
+    client.usage["requests"] += 2
+    client.usage["input_tokens"] += 1_000
+    client.usage["output_tokens"] += 200
+    extraction = ArticleExtraction(
+        source_filename=pdf_path,
+        claims=[
+            Claim(
+                claim_text="Drug X lowered blood pressure.",
+                provenance=Provenance(source_filename=pdf_path, page_number=1),
+            )
+        ],
+    )
+    report = PipelineReport(
+        stages={
+            "orchestrator": StageResult(
+                name="orchestrator",
+                status=StageStatus.OK,
+                started_at=0.0,
+                finished_at=1.5,
+            ),
+            "figures": StageResult(name="figures", status=StageStatus.OK, reused=True),
+        }
+    )
+    return extraction, report
+
+
+def _corpus(tmp_path: Path) -> Path:
+    gold = {
+        "claims": [
+            {"claim_text": "Drug X lowered blood pressure."},
+            {"claim_text": "Stroke was rare."},
+        ]
+    }
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.pdf").write_bytes(b"%PDF-1.4")
+    (tmp_path / "a.gold.json").write_text(json.dumps(gold))
+    (tmp_path / "b.json").write_text(json.dumps(gold))
+    (tmp_path / "orphan.pdf").write_bytes(b"%PDF-1.4")
+    return tmp_path
+
+
+def test_collect_gold_pairs(tmp_path: Path):
+    pairs = collect_gold_pairs(str(_corpus(tmp_path)))
+    assert [(pdf.name, gold.name) for pdf, gold in pairs] == [
+        ("a.pdf", "a.gold.json"),
+        ("b.pdf", "b.json"),
+    ]
+
+
+def test_llm_cost():
+    assert (
+        llm_cost({"input_tokens": 2_000_000, "output_tokens": 100_000}, 0.5, 2.0) == 1.2
+    )
+
+
+def test_run_evaluation_scores_and_reuses_cache(tmp_path: Path, mocker):
+    (tmp_path / "corpus").mkdir()
+    source = _corpus(tmp_path / "corpus")
+    cache_dir = tmp_path / "cache"
+    mocker.patch.object(harness, "GeminiClient", FakeClient)
+    pipeline = mocker.patch.object(
+        harness, "run_pipeline", side_effect=_fake_run_pipeline
+    )
+    mocker.patch.object(harness, "plan_update", return_value=[])
+    pairs = collect_gold_pairs(str(source))
+
+    first = run_evaluation(pairs, cache_dir=str(cache_dir), root=source)
+    assert pipeline.call_count == 2
+    assert first["documents_succeeded"] == 2
+    assert first["documents_cached"] == 0
+    claims = first["components"]["claims"]
+    assert (claims["true_positives"], claims["false_negatives"]) == (2, 2)
+    assert first["stage_latency"] == {
+        "orchestrator": {"runs": 2, "mean": 1.5, "p50": 1.5, "p95": 1.5}
+    }
+    assert first["llm_usage"] == {
+        "requests": 4,
+        "input_tokens": 2_000,
+        "output_tokens": 400,
+    }
+    assert first["llm_cost"] == round(llm_cost(first["llm_usage"]), 6)
+    assert first["documents"][0]["reused_stages"] == ["figures"]
+    assert sorted(path.name for path in cache_dir.iterdir()) == ["a.json", "b.json"]
+
+    second = run_evaluation(pairs, cache_dir=str(cache_dir), root=source)
+    assert pipeline.call_count == 2
+    assert second["documents_cached"] == 2
+    assert second["components"] == first["components"]
+    assert second["llm_cost"] == 0.0
+
+
+def test_run_evaluation_keeps_cache_when_it_cannot_recompute(tmp_path: Path, mocker):
+    (tmp_path / "corpus").mkdir()
+    source = _corpus(tmp_path / "corpus")
+    cache_dir = tmp_path / "cache"
+    mocker.patch.object(harness, "GeminiClient", FakeClient)
+    mocker.patch.object(harness, "run_pipeline", side_effect=_fake_run_pipeline)
+    pairs = collect_gold_pairs(str(source))
+    run_evaluation(pairs, cache_dir=str(cache_dir), root=source)
+    cached = {path.name: path.read_bytes() for path in cache_dir.iterdir()}
+
+    def failing_run_pipeline(pdf_path, client, previous=None, **kwargs):
+        extraction, report = _fake_run_pipeline(pdf_path, client, previous)
+        report.stages["orchestrator"].status = StageStatus.TIMEOUT
+        return extraction, report
+
+    mocker.patch.object(harness, "run_pipeline", side_effect=failing_run_pipeline)
+    mocker.patch.object(harness, "plan_update", return_value=["orchestrator"])
+    run_evaluation(pairs, cache_dir=str(cache_dir), root=source)
+    assert {path.name: path.read_bytes() for path in cache_dir.iterdir()} == cached
+
+    mocker.patch.object(FakeClient, "is_configured", return_value=False)
+    unconfigured = run_evaluation(pairs, cache_dir=str(cache_dir), root=source)
+    assert unconfigured["documents_cached"] == 2
+    assert {path.name: path.read_bytes() for path in cache_dir.iterdir()} == cached
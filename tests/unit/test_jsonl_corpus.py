@@ -0,0 +1,78 @@
+import pytest
+
+from evidence_extractor.models.schemas import ArticleExtraction
+from evidence_extractor.output.jsonl_corpus import (
+    CorpusReader,
+    CorpusWriter,
+    index_path_for,
+)
+
+
+def _article(name: str, summary: str = "") -> ArticleExtraction:
+    return ArticleExtraction(source_filename=name, summary=summary or None)
+
+
+def test_records_are_readable_by_random_access(tmp_path):
+    path = str(tmp_path / "corpus.jsonl")
+    with CorpusWriter(path) as writer:
+        for name in ("a.pdf", "b.pdf", "c.pdf"):
+            writer.append(_article(name))
+        writer.append(_article("a.pdf", summary="Re-extracted."))
+
+    reader = CorpusReader(path)
+    assert len(reader) == 3
+    assert reader.get("b.pdf").source_filename == "b.pdf"
+    assert reader.get("a.pdf").summary == "Re-extracted."
+    assert reader.get("missing.pdf") is None
+    assert [a.source_filename for a in reader] == ["b.pdf", "c.pdf", "a.pdf"]
+    lines = (tmp_path / "corpus.jsonl").read_text().splitlines()
+    assert len(lines) == 4 and "\n" not in lines[0]
+
+
+def test_writer_recovers_from_interrupted_append(tmp_path):
+    path = str(tmp_path / "corpus.jsonl")
+    with CorpusWriter(path) as writer:
+        writer.append(_article("a.pdf"))
+    with open(path, "ab") as f:
+        f.write(b'{"source_filename": "half-writ')
+    with open(index_path_for(path), "a") as f:
+        f.write('{"key": "b.pdf", "off')
+
+    with CorpusWriter(path) as writer:
+        writer.append(_article("c.pdf"))
+
+    reader = CorpusReader(path)
+    assert reader.keys() == ["a.pdf", "c.pdf"]
+    assert reader.get("c.pdf").source_filename == "c.pdf"
+
+
+def test_compressed_corpus_round_trip(tmp_path):
+    pytest.importorskip("zstandard")
+    path = str(tmp_path / "corpus.jsonl.zst")
+    with CorpusWriter(path) as writer:
+        writer.append(_article("a.pdf"))
+        writer.append(_article("b.pdf"))
+    assert CorpusReader(path).get("b.pdf").source_filename == "b.pdf"
+
+
+@pytest.mark.parametrize("name", ["corpus.jsonl", "corpus.jsonl.zst"])
+def test_writer_rebuilds_missing_or_stale_index(tmp_path, name):
+    if name.endswith(".zst"):
+        pytest.importorskip("zstandard")
+    path = str(tmp_path / name)
+    with CorpusWriter(path) as writer:
+        writer.append(_article("a.pdf"))
+        writer.append(_article("b.pdf"))
+    index_path_for(path).unlink()
+    with CorpusWriter(path) as writer:
+        writer.append(_article("c.pdf"))
+    assert CorpusReader(path).keys() == ["a.pdf", "b.pdf", "c.pdf"]
+
+    index_path_for(path).write_text('{"key": "a.pdf", "offset": 0, "length": 5}\n')
+    with open(path, "ab") as f:
+        f.write(b"\x28\xb5\x2f\xfd" if name.endswith(".zst") else b'{"partial')
+    with CorpusWriter(path):
+        pass
+    reader = CorpusReader(path)
+    assert reader.keys() == ["a.pdf", "b.pdf", "c.pdf"]
+    assert reader.get("c.pdf").source_filename == "c.pdf"
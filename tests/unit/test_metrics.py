@@ -0,0 +1,116 @@
+import numpy as np
+
+from evidence_extractor.evaluation.metrics import (
+    calculate_claim_metrics,
+    match_claims,
+    optimal_assignment,
+    score_extraction,
+)
+from evidence_extractor.models.schemas import (
+    PICO,
+    ArticleExtraction,
+    BibliographyItem,
+    Claim,
+    ExtractedTable,
+    Provenance,
+    QualityScore,
+)
+
+
+def test_optimal_assignment_beats_greedy_choice():
+    weights = np.array([[10.0, 9.0], [8.0, 0.0]])
+    assert optimal_assignment(weights) == [(0, 1), (1, 0)]
+    assert optimal_assignment(weights.T) == [(0, 1), (1, 0)]
+    assert optimal_assignment(np.zeros((0, 3))) == []
+
+
+def test_claim_metrics_use_one_to_one_matching():
+    extracted = ["Blood pressure fell", "Blood pressure fell by 10 mmHg", "Unrelated"]
+    gold = ["blood pressure fell", "In adults blood pressure fell sharply"]
+    metrics = calculate_claim_metrics(extracted, gold)
+    assert metrics["true_positives"] == 2
+    assert metrics["false_positives"] == 1
+    assert metrics["false_negatives"] == 0
+    assert [
+        (pair["extracted_index"], pair["gold_index"])
+        for pair in metrics["matched_pairs"]
+    ] == [(0, 1), (1, 0)]
+
+
+def test_match_threshold_is_configurable():
+    extracted = ["Mortality was reduced in the treatment arm"]
+    gold = ["Mortality was lowered in the treatment arm"]
+    assert match_claims(extracted, gold) == []
+    [match] = match_claims(extracted, gold, threshold=80)
+    assert 80 < match.score < 95
+
+
+def test_claim_metrics_without_gold_claims():
+    metrics = calculate_claim_metrics(["A claim"], [])
+    assert metrics["false_positives"] == 1
+    assert metrics["matched_pairs"] == []
+
+
+def _extraction() -> ArticleExtraction:
+    provenance = Provenance(source_filename="paper.pdf", page_number=3)
+    return ArticleExtraction(
+        source_filename="paper.pdf",
+        claims=[
+            Claim(
+                claim_text="Drug X lowered blood pressure.",
+                linked_citations=["Smith2020", "Lee2019"],
+                provenance=provenance,
+            )
+        ],
+        pico_elements=PICO(population="Adults with hypertension", outcome="Stroke"),
+        quality_scores=[
+            QualityScore(score_name="Risk of bias", score_value="Low: randomised")
+        ],
+        tables=[ExtractedTable(table_data=[], provenance=provenance)],
+        bibliography={
+            "Smith2020": BibliographyItem(
+                citation_key="Smith2020",
+                full_citation="Smith J. Drug X in adults. Lancet. 2020.",
+            )
+        },
+    )
+
+
+def test_score_extraction_covers_every_gold_component():
+    gold = {
+        "claims": [
+            {
+                "claim_text": "Drug X lowered blood pressure.",
+                "linked_citations": ["smith2020"],
+            }
+        ],
+        "pico_elements": {
+            "population": "adults with hypertension",
+            "intervention": "Drug X",
+            "outcome": "Myocardial infarction",
+        },
+        "quality_scores": [{"score_name": "Risk of Bias", "score_value": "low"}],
+        "tables": [{"page_number": 3}, {"provenance": {"page_number": 4}}],
+        "bibliography": ["Smith J. Drug X in adults. Lancet. 2020."],
+    }
+    scores = score_extraction(_extraction(), gold)
+    assert scores["claims"]["true_positives"] == 1
+    citation_links = scores["citation_links"]
+    assert (
+        citation_links["true_positives"],
+        citation_links["false_positives"],
+        citation_links["false_negatives"],
+    ) == (1, 1, 0)
+    pico = scores["pico"]
+    assert (
+        pico["true_positives"],
+        pico["false_positives"],
+        pico["false_negatives"],
+    ) == (1, 1, 2)
+    assert scores["quality_scores"]["f1_score"] == 1.0
+    assert scores["tables"]["recall"] == 0.5
+    assert scores["references"]["precision"] == 1.0
+
+
+def test_score_extraction_skips_components_missing_from_gold():
+    assert set(score_extraction(_extraction(), {"claims": []})) == {"claims"}
@@ -0,0 +1,44 @@
+from PIL import Image
+
+from evidence_extractor.extraction.figures import FIGURE_CAPTION_PROMPT
+from evidence_extractor.extraction.llm_orchestrator import orchestrate_llm_extraction
+from evidence_extractor.extraction.summarization import generate_summary
+from evidence_extractor.extraction.tables import TABLE_PARSING_PROMPT
+from evidence_extractor.extraction.uncertainty import annotate_claims_in_batch
+from evidence_extractor.integration.offline_client import OfflineClient
+from evidence_extractor.models.schemas import Claim, Provenance
+
+TEXT = (
+    "Short line. Intervention A reduced mortality by 12% compared with placebo. "
+    "Intervention B lowered blood pressure by 8 mmHg in older adults. "
+    "Intervention C had no effect on hospital admissions at one year."
+)
+
+
+def test_offline_client_answers_every_pipeline_prompt():
+    client = OfflineClient(max_claims=2)
+    payload = orchestrate_llm_extraction(client, TEXT)
+    assert payload["pico"]["comparison"] == "Placebo"
+    assert [c["claim_text"] for c in payload["claims"]] == [
+        "Intervention A reduced mortality by 12% compared with placebo.",
+        "Intervention B lowered blood pressure by 8 mmHg in older adults.",
+    ]
+
+    claims = [
+        Claim(
+            claim_text=item["claim_text"],
+            provenance=Provenance(source_filename="x.pdf", page_number=1),
+        )
+        for item in payload["claims"]
+    ]
+    annotate_claims_in_batch(client, claims)
+    assert all(c.uncertainty_annotation.startswith("Medium") for c in claims)
+    assert "Intervention A" in generate_summary(client, claims)
+
+    image = Image.new("RGB", (20, 10))
+    assert client.query_with_image(FIGURE_CAPTION_PROMPT, image).startswith("Figure")
+    assert '"structured_data"' in client.query_with_image(TABLE_PARSING_PROMPT, image)
+
+    usage = client.usage_snapshot()
+    assert usage["requests"] == 5
+    assert usage["input_tokens"] > usage["output_tokens"] > 0
@@ -0,0 +1,98 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from evidence_extractor.models.schemas import (
+    PICO,
+    ArticleExtraction,
+    BibliographyItem,
+    Claim,
+    CorrectionMetadata,
+    ExtractedTable,
+    Provenance,
+    QualityScore,
+    ValidationStatus,
+)
+from evidence_extractor.output.parquet_export import (
+    export_to_parquet,
+    flatten_extraction,
+)
+
+
+def _extraction(name: str) -> ArticleExtraction:
+    provenance = Provenance(source_filename=name, page_number=2)
+    return ArticleExtraction(
+        source_filename=name,
+        document_hash=f"hash-{name}",
+        claims=[
+            Claim(
+                claim_text="Drug X works.",
+                linked_citations=["ref_1"],
+                provenance=provenance,
+                correction_metadata=CorrectionMetadata(
+                    status=ValidationStatus.VERIFIED,
+                    last_reviewed=datetime(2024, 5, 1),
+                ),
+            )
+        ],
+        pico_elements=PICO(population="Adults", provenance=[provenance]),
+        quality_scores=[QualityScore(score_name="Jadad", score_value="3")],
+        tables=[
+            ExtractedTable(
+                table_data=[{"Arm": "A", "N": 10}, {"Arm": "B", "N": None}],
+                provenance=provenance,
+            ),
+            ExtractedTable(summary="Empty", table_data=[], provenance=provenance),
+        ],
+        bibliography={
+            "ref_1": BibliographyItem(
+                citation_key="Smith2020", full_citation="Smith 2020.", year=2020
+            )
+        },
+    )
+
+
+def test_flatten_extraction_produces_one_row_per_item():
+    rows = flatten_extraction(_extraction("a.pdf"))
+    assert {name: len(r) for name, r in rows.items()} == {
+        "articles": 1,
+        "claims": 1,
+        "pico": 1,
+        "quality_scores": 1,
+        "tables": 5,
+        "bibliography": 1,
+    }
+    assert rows["claims"][0]["status"] == "verified"
+    assert rows["tables"][1]["value"] == "10"
+    assert rows["tables"][4]["row_index"] is None
+
+
+def test_export_to_parquet_streams_typed_files(tmp_path: Path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    extractions = (_extraction(f"paper_{i}.pdf") for i in range(5))
+
+    counts = export_to_parquet(extractions, str(tmp_path), batch_rows=3)
+
+    assert counts["articles"] == 5
+    assert counts["tables"] == 25
+    claims = pq.read_table(tmp_path / "claims.parquet")
+    assert claims.num_rows == 5
+    assert str(claims.schema.field("page_number").type) == "int32"
+    assert str(claims.schema.field("last_reviewed").type) == "timestamp[us]"
+    assert claims.column("linked_citations").to_pylist()[0] == ["ref_1"]
+    bibliography = pq.read_table(tmp_path / "bibliography.parquet")
+    assert bibliography.column("year").to_pylist() == [2020] * 5
+
+
+def test_export_to_parquet_leaves_no_files_when_the_stream_fails(tmp_path: Path):
+    pytest.importorskip("pyarrow.parquet")
+
+    def extractions():
+        for i in range(3):
+            yield _extraction(f"paper_{i}.pdf")
+        raise OSError("corpus file vanished")
+
+    with pytest.raises(OSError, match="vanished"):
+        export_to_parquet(extractions(), str(tmp_path), batch_rows=2)
+    assert list(tmp_path.iterdir()) == []
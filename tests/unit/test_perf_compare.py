@@ -0,0 +1,75 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[2] / "benchmarks" / "perf_compare.py"
+spec = importlib.util.spec_from_file_location("perf_compare", SCRIPT)
+perf_compare = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(perf_compare)
+
+ENVIRONMENT = {"implementation": "CPython", "python": "3.11.4", "cpu_count": 8}
+
+
+def _results(median: float, stdev: float = 0.0, memory: int = 10_000_000) -> dict:
+    return {
+        "environment": ENVIRONMENT,
+        "benchmarks": {
+            "extract": {
+                "seconds": {"median": median, "stdev": stdev},
+                "peak_memory_bytes": memory,
+            }
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "new, verdict",
+    [(1.2, "regression"), (0.8, "improvement"), (1.05, "unchanged")],
+)
+def test_compare_metric_applies_relative_threshold(new: float, verdict: str):
+    result = perf_compare.compare_metric(1.0, new, threshold=0.10, floor=0.001)
+    assert result["verdict"] == verdict
+    assert result["change"] == pytest.approx(new - 1.0)
+
+
+def test_compare_metric_ignores_changes_within_noise_and_floor():
+    noisy = perf_compare.compare_metric(
+        1.0, 1.3, threshold=0.10, floor=0.001, noise=0.5
+    )
+    assert noisy["verdict"] == "unchanged"
+    assert noisy["allowed"] == 0.5
+    tiny = perf_compare.compare_metric(0.001, 0.0018, threshold=0.10, floor=0.001)
+    assert tiny["verdict"] == "unchanged"
+
+
+def test_compare_results_flags_time_and_memory():
+    comparison = perf_compare.compare_results(
+        _results(1.0), _results(1.5, memory=20_000_000)
+    )
+    assert comparison["extract"]["time"]["verdict"] == "regression"
+    assert comparison["extract"]["memory"]["verdict"] == "regression"
+    assert perf_compare.regressions(comparison) == [
+        "extract (time)",
+        "extract (memory)",
+    ]
+
+    faster = perf_compare.compare_results(_results(1.0), _results(0.5))
+    assert faster["extract"]["time"]["verdict"] == "improvement"
+    assert faster["extract"]["memory"]["verdict"] == "unchanged"
+
+    noisy = perf_compare.compare_results(_results(1.0, 0.2), _results(1.5, 0.1))
+    assert noisy["extract"]["time"]["verdict"] == "unchanged"
+
+
+def test_find_baseline_skips_dirty_runs_unless_named(tmp_path: Path):
+    fingerprint = perf_compare.machine_fingerprint(ENVIRONMENT)
+    for created_at, commit in [("1", "aaa111"), ("2", "bbb222-dirty"), ("3", "ccc")]:
+        perf_compare.record(
+            {**_results(1.0), "created_at": created_at}, tmp_path, commit
+        )
+
+    default = perf_compare.find_baseline(tmp_path, fingerprint, None, "ccc")
+    assert default["commit"] == "aaa111"
+    named = perf_compare.find_baseline(tmp_path, fingerprint, "bbb", "ccc")
+    assert named["commit"] == "bbb222-dirty"
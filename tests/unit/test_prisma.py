@@ -0,0 +1,80 @@
+import json
+from pathlib import Path
+
+from evidence_extractor.models.schemas import (
+    PICO,
+    ArticleExtraction,
+    Claim,
+    CorrectionMetadata,
+    Provenance,
+    ValidationStatus,
+)
+from evidence_extractor.output.prisma import (
+    REASON_EXTRACTION_FAILED,
+    REASON_MARKED_EXCLUDED,
+    REASON_NO_EVIDENCE,
+    REASON_PICO_REJECTED,
+    count_failed_documents,
+    generate_corpus_prisma_report,
+    tally_prisma,
+)
+from evidence_extractor.output.prisma_diagram import build_prisma_digraph
+
+
+def _article(name: str, **fields) -> ArticleExtraction:
+    claim = Claim(
+        claim_text="Works.", provenance=Provenance(source_filename=name, page_number=1)
+    )
+    return ArticleExtraction(
+        source_filename=name, document_hash=name, claims=[claim], **fields
+    )
+
+
+def _corpus():
+    rejected = PICO(
+        population="Mice",
+        correction_metadata=CorrectionMetadata(
+            status=ValidationStatus.REJECTED, reviewer_comment="animal study"
+        ),
+    )
+    yield _article("a.pdf")
+    yield _article("a.pdf")
+    yield _article("b.pdf", records_excluded_count=1)
+    yield _article("c.pdf", pico_elements=rejected)
+    yield _article("d.pdf", pico_elements=PICO(population="Adults"))
+    yield ArticleExtraction(source_filename="e.pdf")
+
+
+def test_tally_prisma_counts_flow_and_reasons():
+    counts = tally_prisma(_corpus(), failed_documents=2)
+    assert counts.identified == 8
+    assert counts.duplicates == 1
+    assert counts.screened == 7
+    assert counts.included == 2
+    assert counts.excluded == 5
+    assert counts.exclusion_reasons == {
+        REASON_EXTRACTION_FAILED: 2,
+        REASON_MARKED_EXCLUDED: 1,
+        REASON_PICO_REJECTED: 1,
+        REASON_NO_EVIDENCE: 1,
+    }
+
+
+def test_corpus_report_and_diagram_use_same_counts():
+    counts = tally_prisma(_corpus())
+    report = generate_corpus_prisma_report(counts, "data/processed")
+    assert "Records identified: 6" in report
+    assert "Studies included in synthesis: 2" in report
+    assert f"  - {REASON_NO_EVIDENCE}: 1" in report
+    source = build_prisma_digraph(counts).source
+    assert "Records excluded (n = 3)" in source
+    assert "Duplicate records removed (n = 1)" in source
+
+
+def test_count_failed_documents(tmp_path: Path):
+    summary_path = tmp_path / "run_summary.json"
+    summary_path.write_text(
+        json.dumps({"documents": [{"status": "ok"}, {"status": "failed"}]})
+    )
+    assert count_failed_documents(str(summary_path)) == 1
+    assert count_failed_documents(str(tmp_path / "missing.json")) == 0
@@ -0,0 +1,50 @@
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from evidence_extractor.output.prisma import PrismaCounts
+from evidence_extractor.output.prisma_diagram import render_prisma_diagram
+from evidence_extractor.output.prisma_svg import render_prisma_svg
+
+SVG_NS = "{http://www.w3.org/2000/svg}"
+
+
+def _counts() -> PrismaCounts:
+    return PrismaCounts(
+        identified=10,
+        duplicates=2,
+        screened=8,
+        excluded=3,
+        included=5,
+        exclusion_reasons={"Wrong population <animals> & in vitro": 2, "Other": 1},
+    )
+
+
+def _texts(svg: str):
+    root = ET.fromstring(svg)
+    return ["".join(text.itertext()) for text in root.iter(f"{SVG_NS}text")]
+
+
+def test_render_prisma_svg_draws_fixed_layout():
+    svg = render_prisma_svg(_counts())
+    texts = _texts(svg)
+    assert texts[0] == "Records identified (n = 10)"
+    assert "Duplicate records removed (n = 2)" in texts
+    assert "Studies included in synthesis (n = 5)" in texts
+    excluded = next(t for t in texts if t.startswith("Records excluded"))
+    assert "- Wrong population <animals> & in vitro (n = 2)" in excluded
+    assert svg.count("<line ") == 4
+
+
+def test_render_prisma_svg_omits_empty_side_boxes():
+    texts = _texts(render_prisma_svg(PrismaCounts(identified=1, screened=1)))
+    assert len(texts) == 3
+
+
+def test_render_prisma_diagram_writes_svg_and_png(tmp_path: Path):
+    png_path = render_prisma_diagram(_counts(), str(tmp_path / "flow"))
+    assert png_path == str(tmp_path / "flow.png")
+    assert Path(png_path).read_bytes()[:8] == b"\x89PNG\r\n\x1a\n"
+    svg_path = render_prisma_diagram(
+        _counts(), str(tmp_path / "flow"), image_format="svg"
+    )
+    assert Path(svg_path).read_text().startswith("<svg")
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import pytest
+
+from evidence_extractor.models.schemas import BibliographyItem
+from evidence_extractor.storage.reference_store import (
+    ReferenceStore,
+    reference_fingerprint,
+)
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    with ReferenceStore(str(tmp_path / "references.sqlite")) as reference_store:
+        yield reference_store
+
+
+def _item(key: str, **fields) -> BibliographyItem:
+    return BibliographyItem(citation_key=key, full_citation=f"{key} citation", **fields)
+
+
+def test_reference_fingerprint_prefers_identifiers():
+    with_doi = _item("A", doi="https://doi.org/10.1000/ABC", pmid="42")
+    assert reference_fingerprint(with_doi) == "doi:10.1000/abc"
+    assert reference_fingerprint(_item("B", pmid="0042")) == "pmid:42"
+    first = _item("C", authors=["Smith, J."], year=2020, title="A Trial!")
+    second = _item("D", authors=["Smith J"], year=2020, title="a trial")
+    assert reference_fingerprint(first) == reference_fingerprint(second)
+    assert reference_fingerprint(first).startswith("fp:")
+
+
+def test_add_article_interns_shared_references(store: ReferenceStore):
+    shared = _item("Smith2020", doi="10.1000/shared")
+    first_ids = store.add_article(
+        "paper_a.pdf", {"Smith2020": shared, "Jones2021": _item("Jones2021")}
+    )
+    second_ids = store.add_article(
+        "paper_b.pdf", {"ref_1": _item("ref_1", doi="10.1000/SHARED")}
+    )
+    assert second_ids[0] == first_ids[0]
+    assert store.connection.execute(
+        "SELECT COUNT(*) FROM bib_references"
+    ).fetchone() == (2,)
+    assert store.article_reference_ids("paper_b.pdf") == [first_ids[0]]
+    assert store.get_reference(first_ids[0]).doi == "10.1000/shared"
+
+
+def test_articles_citing(store: ReferenceStore):
+    store.add_article("paper_a.pdf", {"x": _item("x", doi="10.1000/x", pmid="7")})
+    store.add_article("paper_b.pdf", {"x": _item("x", doi="10.1000/x")})
+    store.add_article("paper_c.pdf", {"y": _item("y", pmid="8")})
+    assert store.articles_citing("doi:10.1000/X") == ["paper_a.pdf", "paper_b.pdf"]
+    assert store.articles_citing("pmid:8") == ["paper_c.pdf"]
+    assert store.articles_citing("10.9999/missing") == []
+
+
+def test_add_article_replaces_previous_links(store: ReferenceStore):
+    store.add_article("paper_a.pdf", {"x": _item("x", doi="10.1000/x")})
+    store.add_article("paper_a.pdf", {"y": _item("y", doi="10.1000/y")})
+    assert store.articles_citing("10.1000/x") == []
+    assert store.articles_citing("10.1000/y") == ["paper_a.pdf"]
+
+
+def test_references_match_on_either_identifier(store: ReferenceStore):
+    store.add_article("a.pdf", {"x": _item("x", doi="10.1000/x", pmid="7")})
+    store.add_article("b.pdf", {"x": _item("x", pmid="0007")})
+    store.add_article("c.pdf", {"x": _item("x", pmid="9")})
+    store.add_article("d.pdf", {"x": _item("x", doi="10.1000/z", pmid="9")})
+    assert store.connection.execute(
+        "SELECT COUNT(*) FROM bib_references"
+    ).fetchone() == (2,)
+    assert store.articles_citing("pmid:0007") == ["a.pdf", "b.pdf"]
+    assert store.articles_citing("7") == ["a.pdf", "b.pdf"]
+    assert store.articles_citing("10.1000/z") == ["c.pdf", "d.pdf"]
@@ -0,0 +1,85 @@
+import pytest
+
+from evidence_extractor.extraction.references import (
+    normalize_doi,
+    normalize_pmid,
+    parse_reference,
+    parse_references,
+    split_reference_entries,
+)
+
+
+@pytest.fixture
+def vancouver_references() -> str:
+    return """
+1. Smith J, Baker C, Lee D. Randomised trial of
+aspirin in adults. Lancet. 2022;397(10270):100-10.
+doi:10.1016/S0140-6736(21)00001-2. PMID: 01234567.
+2. Smith J. A second trial. BMJ. 2022;376:e068. https://doi.org/10.1136/BMJ-2021.
+3. Smith J. A third trial. BMJ. 2022;376:e069.
+    """
+
+
+def test_split_reference_entries_joins_continuation_lines(vancouver_references):
+    entries = split_reference_entries(vancouver_references)
+    assert len(entries) == 3
+    assert entries[0].startswith("1. Smith J")
+    assert "aspirin in adults" in entries[0]
+    assert "PMID: 01234567" in entries[0]
+
+
+def test_split_reference_entries_unnumbered():
+    text = (
+        "Miller, K. (2020). Older Research.\n"
+        "Legacy Publishing.\n"
+        "Jones, A. (2021). Newer Research. Science Press."
+    )
+    entries = split_reference_entries(text)
+    assert entries == [
+        "Miller, K. (2020). Older Research. Legacy Publishing.",
+        "Jones, A. (2021). Newer Research. Science Press.",
+    ]
+
+
+def test_parse_reference_apa():
+    item, base_key = parse_reference(
+        "[2] Jones, A., & Baker, C. (2021). Another Study. Research Today, 2(3), "
+        "20-30. https://doi.org/10.1000/XYZ.123."
+    )
+    assert base_key == "Jones2021"
+    assert item.reference_number == 2
+    assert item.authors == ["Jones, A.", "Baker, C."]
+    assert item.year == 2021
+    assert item.title == "Another Study"
+    assert item.venue == "Research Today"
+    assert item.doi == "10.1000/xyz.123"
+
+
+def test_parse_references_vancouver_and_collisions(vancouver_references):
+    items = parse_references(split_reference_entries(vancouver_references))
+    assert [item.citation_key for item in items] == [
+        "Smith2022",
+        "Smith2022b",
+        "Smith2022c",
+    ]
+    first = items[0]
+    assert first.authors == ["Smith J", "Baker C", "Lee D"]
+    assert first.title == "Randomised trial of aspirin in adults"
+    assert first.venue == "Lancet"
+    assert first.doi == "10.1016/s0140-6736(21)00001-2"
+    assert first.pmid == "1234567"
+    assert items[1].doi == "10.1136/bmj-2021"
+
+
+def test_parse_references_falls_back_to_numbered_keys():
+    items = parse_references(["[7] An anonymous technical report without a date."])
+    assert items[0].citation_key == "ref_7"
+    assert items[0].year is None
+
+
+def test_normalize_identifiers():
+    assert normalize_doi("https://dx.doi.org/10.1000/ABC.") == "10.1000/abc"
+    assert normalize_doi("doi: 10.1000/abc") == "10.1000/abc"
+    assert normalize_doi("not a doi") is None
+    assert normalize_pmid("PMID 000123") == "123"
+    assert normalize_pmid(None) is None
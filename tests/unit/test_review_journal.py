@@ -0,0 +1,146 @@
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from evidence_extractor.cli.main import cli
+from evidence_extractor.models.schemas import (
+    PICO,
+    ArticleExtraction,
+    Claim,
+    Provenance,
+    ValidationStatus,
+)
+from evidence_extractor.output.json_builder import save_to_json
+from evidence_extractor.output.serialization import load_extraction
+from evidence_extractor.review.journal import (
+    SKIPPED,
+    ReviewJournal,
+    compact_journal,
+    item_hash,
+    journal_path_for,
+    review_items,
+)
+from evidence_extractor.storage.corpus_store import CorpusStore
+
+
+def _extraction() -> ArticleExtraction:
+    provenance = Provenance(source_filename="paper.pdf", page_number=1)
+    return ArticleExtraction(
+        source_filename="paper.pdf",
+        document_hash="abc",
+        pico_elements=PICO(population="Adults"),
+        claims=[
+            Claim(claim_text=f"Claim {i}.", provenance=provenance) for i in range(3)
+        ],
+    )
+
+
+def test_journal_survives_reopen_and_truncated_line(tmp_path: Path):
+    path = tmp_path / "paper.json.review.jsonl"
+    with ReviewJournal(str(path)) as journal:
+        journal.record("abc", "claim:0", "verified")
+        journal.record("abc", "claim:1", "rejected", "off-topic")
+        journal.record("abc", "claim:0", "rejected")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"document": "abc", "item": "cla')
+    with ReviewJournal(str(path)) as journal:
+        decisions = journal.decisions("abc")
+        assert decisions["claim:0"]["status"] == "rejected"
+        assert decisions["claim:1"]["comment"] == "off-topic"
+        assert journal.pending_count() == 2
+        journal.record("abc", "claim:2", "verified")
+    with ReviewJournal(str(path)) as journal:
+        assert journal.decisions("abc")["claim:2"]["status"] == "verified"
+    assert path.read_text().endswith("}\n")
+
+
+def test_compact_journal_ignores_decisions_on_changed_claims(tmp_path: Path):
+    json_path = tmp_path / "paper.json"
+    extraction = _extraction()
+    with ReviewJournal(journal_path_for(str(json_path))) as journal:
+        for i in (0, 1):
+            claim = extraction.claims[i]
+            journal.record(
+                "abc", f"claim:{i}", "rejected", content_hash=item_hash(claim)
+            )
+        journal.record("abc", "claim:2", "verified")
+        extraction.claims[0].claim_text = "A re-extracted claim."
+        save_to_json(extraction, str(json_path))
+        assert compact_journal(journal, json_path=str(json_path)) == 2
+    claims = load_extraction(str(json_path)).claims
+    statuses = [claim.correction_metadata.status.value for claim in claims]
+    assert statuses == ["unverified", "rejected", "verified"]
+
+
+def test_compact_journal_keeps_journal_when_write_fails(tmp_path: Path, mocker):
+    json_path = tmp_path / "paper.json"
+    save_to_json(_extraction(), str(json_path))
+    original = json_path.read_bytes()
+    mocker.patch(
+        "evidence_extractor.output.json_builder.os.replace",
+        side_effect=OSError("disk full"),
+    )
+    with ReviewJournal(journal_path_for(str(json_path))) as journal:
+        journal.record("abc", "claim:1", "verified")
+        with pytest.raises(OSError, match="disk full"):
+            compact_journal(journal, json_path=str(json_path))
+        assert journal.documents() == ["abc"]
+    assert json_path.read_bytes() == original
+    assert [p.name for p in tmp_path.iterdir() if p.name.startswith(".")] == []
+
+
+def test_compact_journal_into_json(tmp_path: Path):
+    json_path = tmp_path / "paper.json"
+    save_to_json(_extraction(), str(json_path))
+    with ReviewJournal(journal_path_for(str(json_path))) as journal:
+        journal.record("abc", "pico", "verified")
+        journal.record("abc", "claim:2", "rejected", "duplicate")
+        journal.record("abc", "claim:0", SKIPPED)
+        assert compact_journal(journal, json_path=str(json_path)) == 2
+        assert journal.documents() == []
+    assert Path(journal_path_for(str(json_path))).stat().st_size == 0
+    extraction = load_extraction(str(json_path))
+    assert extraction.pico_elements.correction_metadata.status == "verified"
+    claim = extraction.claims[2].correction_metadata
+    assert claim.status == ValidationStatus.REJECTED
+    assert claim.reviewer_comment == "duplicate"
+    assert claim.last_reviewed is not None
+    assert extraction.claims[0].correction_metadata.status == "unverified"
+
+
+def test_compact_journal_into_store_keeps_unknown_documents(tmp_path: Path):
+    store_path = str(tmp_path / "corpus.sqlite")
+    with (
+        CorpusStore(store_path) as store,
+        ReviewJournal(journal_path_for(store_path)) as journal,
+    ):
+        store.upsert(_extraction())
+        journal.record("abc", "claim:1", "verified")
+        journal.record("missing", "claim:0", "verified")
+        assert compact_journal(journal, store=store) == 1
+        assert journal.documents() == ["abc", "missing"]
+        assert store.get("abc").claims[1].correction_metadata.status == "verified"
+
+
+def test_review_command_resumes_interrupted_session(tmp_path: Path):
+    json_path = tmp_path / "paper.json"
+    save_to_json(_extraction(), str(json_path))
+    runner = CliRunner()
+
+    first = runner.invoke(cli, ["review", str(json_path)], input="v\nr\nwrong\nq\nn\n")
+    assert first.exit_code == 0
+    assert "review --compact" in first.output
+    assert load_extraction(str(json_path)).claims[0].correction_metadata.status == (
+        "unverified"
+    )
+
+    second = runner.invoke(cli, ["review", str(json_path)], input="s\nv\ny\n")
+    assert second.exit_code == 0
+    assert "Resuming: 2 of 4 items already reviewed." in second.output
+    assert "Reviewing Claim 1" not in second.output
+    statuses = [
+        item.correction_metadata.status.value
+        for _, item in review_items(load_extraction(str(json_path)))
+    ]
+    assert statuses == ["verified", "rejected", "unverified", "verified"]
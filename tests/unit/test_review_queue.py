@@ -0,0 +1,180 @@
+from pathlib import Path
+from typing import List, Optional
+
+from click.testing import CliRunner
+
+from evidence_extractor.cli.main import cli
+from evidence_extractor.models.schemas import (
+    ArticleExtraction,
+    Claim,
+    Provenance,
+    QualityScore,
+)
+from evidence_extractor.output.json_builder import save_to_json
+from evidence_extractor.output.serialization import load_extraction
+from evidence_extractor.review.journal import ReviewJournal, compact_journal
+from evidence_extractor.review.queue import (
+    QUEUE_JOURNAL_FILENAME,
+    QueueFilter,
+    bulk_decide,
+    iter_directory_queue,
+    iter_store_queue,
+    level_of,
+)
+from evidence_extractor.storage.corpus_store import CorpusStore
+
+
+def _extraction(
+    name: str, annotations: List[Optional[str]], quality: str = "High"
+) -> ArticleExtraction:
+    return ArticleExtraction(
+        source_filename=name,
+        document_hash=f"hash-{name}",
+        claims=[
+            Claim(
+                claim_text=f"{name} claim {i}.",
+                uncertainty_annotation=annotation,
+                provenance=Provenance(source_filename=name, page_number=i or -1),
+            )
+            for i, annotation in enumerate(annotations)
+        ],
+        quality_scores=[
+            QualityScore(score_name="Risk of bias", score_value=f"{quality}: ok")
+        ],
+    )
+
+
+def _corpus() -> List[ArticleExtraction]:
+    return [
+        _extraction("a.pdf", ["Low certainty", "High", None]),
+        _extraction("b.pdf", ["low", "Medium"], quality="Low"),
+    ]
+
+
+def test_level_of():
+    assert level_of("High: well supported") == "high"
+    assert level_of("  low.") == "low"
+    assert level_of("Possibly") == "unknown"
+    assert level_of(None) == "unknown"
+
+
+def test_store_queue_filters_and_paginates(tmp_path: Path):
+    with CorpusStore(str(tmp_path / "corpus.sqlite")) as store:
+        for extraction in _corpus():
+            store.upsert(extraction)
+        everything = list(iter_store_queue(store, QueueFilter(), page_size=2))
+        assert [(item.document, item.item_id) for item in everything] == [
+            ("hash-a.pdf", "claim:0"),
+            ("hash-a.pdf", "claim:1"),
+            ("hash-a.pdf", "claim:2"),
+            ("hash-b.pdf", "claim:0"),
+            ("hash-b.pdf", "claim:1"),
+        ]
+        low = list(iter_store_queue(store, QueueFilter(uncertainty=["low"])))
+        assert [item.source_filename for item in low] == ["a.pdf", "b.pdf"]
+        poor = list(iter_store_queue(store, QueueFilter(quality=["low"])))
+        assert {item.document for item in poor} == {"hash-b.pdf"}
+        unlocated = QueueFilter(missing_provenance=True)
+        assert [item.item_id for item in iter_store_queue(store, unlocated)] == [
+            "claim:0",
+            "claim:0",
+        ]
+        assert list(iter_store_queue(store, QueueFilter(statuses=["verified"]))) == []
+
+
+def test_store_bulk_decisions_skip_journalled_and_compact(tmp_path: Path):
+    store_path = str(tmp_path / "corpus.sqlite")
+    with (
+        CorpusStore(store_path) as store,
+        ReviewJournal(str(tmp_path / "queue.jsonl")) as journal,
+    ):
+        for extraction in _corpus():
+            store.upsert(extraction)
+        journal.record("hash-a.pdf", "claim:0", "verified")
+        low = QueueFilter(uncertainty=["low"])
+        assert [item.document for item in iter_store_queue(store, low, journal)] == [
+            "hash-b.pdf"
+        ]
+        assert bulk_decide(iter_store_queue(store, low, journal), journal, "rejected")
+        assert compact_journal(journal, store=store) == 2
+        assert store.get("hash-a.pdf").claims[0].correction_metadata.status == (
+            "verified"
+        )
+        assert store.get("hash-b.pdf").claims[0].correction_metadata.status == (
+            "rejected"
+        )
+        assert len(list(iter_store_queue(store, QueueFilter()))) == 3
+
+
+def test_queue_requeues_claims_whose_text_changed(tmp_path: Path):
+    with (
+        CorpusStore(str(tmp_path / "corpus.sqlite")) as store,
+        ReviewJournal(str(tmp_path / "queue.jsonl")) as journal,
+    ):
+        extraction = _corpus()[0]
+        store.upsert(extraction)
+        bulk_decide(
+            iter_store_queue(store, QueueFilter(), journal), journal, "verified"
+        )
+        assert list(iter_store_queue(store, QueueFilter(), journal)) == []
+        extraction.claims[1].claim_text = "A re-extracted claim."
+        store.upsert(extraction)
+        requeued = iter_store_queue(store, QueueFilter(), journal)
+        assert [item.item_id for item in requeued] == ["claim:1"]
+
+
+def test_directory_queue_records_locations(tmp_path: Path):
+    paths = []
+    for extraction in _corpus():
+        path = tmp_path / f"{Path(extraction.source_filename).stem}.json"
+        save_to_json(extraction, str(path))
+        paths.append(path)
+    with ReviewJournal(str(tmp_path / QUEUE_JOURNAL_FILENAME)) as journal:
+        medium = QueueFilter(uncertainty=["medium"])
+        items = list(iter_directory_queue(paths, medium, journal))
+        assert [item.location for item in items] == [str(paths[1])]
+        bulk_decide(items, journal, "verified", "checked")
+        assert compact_journal(journal) == 1
+    claim = load_extraction(str(paths[1])).claims[1].correction_metadata
+    assert claim.status == "verified"
+    assert claim.reviewer_comment == "checked"
+
+
+def test_review_queue_command(tmp_path: Path):
+    for extraction in _corpus():
+        save_to_json(extraction, str(tmp_path / f"{extraction.source_filename}.json"))
+    runner = CliRunner()
+
+    counted = runner.invoke(
+        cli, ["review-queue", str(tmp_path), "--missing-provenance", "--count"]
+    )
+    assert counted.exit_code == 0
+    assert "2 claim(s) match." in counted.output
+
+    interactive = runner.invoke(
+        cli,
+        ["review-queue", str(tmp_path), "--quality", "low"],
+        input="v\nq\ny\n",
+    )
+    assert interactive.exit_code == 0
+    assert "b.pdf claim 0." in interactive.output
+    assert "Applied 1 review decision(s)." in interactive.output
+
+    declined = runner.invoke(
+        cli, ["review-queue", str(tmp_path), "--bulk", "reject"], input="n\n"
+    )
+    assert declined.exit_code == 1
+    assert "mark all 4 queued claim(s) as rejected?" in declined.output
+    assert not (tmp_path / QUEUE_JOURNAL_FILENAME).read_text()
+
+    bulk = runner.invoke(
+        cli, ["review-queue", str(tmp_path), "--bulk", "reject"], input="y\ny\n"
+    )
+    assert bulk.exit_code == 0
+    assert "Marked 4 claim(s) as rejected." in bulk.output
+    statuses = [
+        claim.correction_metadata.status.value
+        for name in ("a.pdf", "b.pdf")
+        for claim in load_extraction(str(tmp_path / f"{name}.json")).claims
+    ]
+    assert statuses == ["rejected"] * 3 + ["verified", "rejected"]
@@ -0,0 +1,117 @@
+import pytest
+
+from evidence_extractor.pipeline.dag import Stage, StageCancelled, StageStatus
+from evidence_extractor.pipeline.runner import (
+    FITZ_LOCK,
+    CancellableClient,
+    run_pipeline,
+)
+
+
+def test_run_pipeline_assembles_all_stages(article_pdf, mock_gemini_client):
+    extraction, report = run_pipeline(article_pdf, mock_gemini_client)
+    assert all(r.status == StageStatus.OK for r in report.stages.values())
+    assert extraction.pico_elements.population == "Adults"
+    assert extraction.quality_scores[0].score_value == "High"
+    assert extraction.summary == "Aspirin works."
+    claim = extraction.claims[0]
+    assert claim.provenance.page_number == 1
+    assert claim.uncertainty_annotation == "Confidence: High."
+    assert claim.linked_citations == ["Smith2020"]
+    assert list(extraction.bibliography) == ["Smith2020"]
+    assert report.critical_path[0] in report.stages
+
+
+def test_run_pipeline_survives_failed_stage(article_pdf, mock_gemini_client, mocker):
+    mocker.patch(
+        "evidence_extractor.pipeline.runner.generate_summary",
+        side_effect=RuntimeError("quota exceeded"),
+    )
+    extraction, report = run_pipeline(article_pdf, mock_gemini_client)
+    assert report.stages["summary"].status == StageStatus.FAILED
+    assert extraction.summary is None
+    assert extraction.claims[0].uncertainty_annotation == "Confidence: High."
+
+
+def test_run_pipeline_missing_pdf(mock_gemini_client, tmp_path):
+    assert run_pipeline(str(tmp_path / "missing.pdf"), mock_gemini_client) is None
+
+
+def test_run_pipeline_resume_skips_completed_llm_calls(
+    article_pdf, mock_gemini_client, mocker, tmp_path
+):
+    checkpoint_root = str(tmp_path / "checkpoints")
+    mocker.patch(
+        "evidence_extractor.pipeline.runner.generate_summary", return_value=None
+    )
+    _, first = run_pipeline(
+        article_pdf, mock_gemini_client, checkpoint_root=checkpoint_root
+    )
+    assert first.stages["summary"].status == StageStatus.FAILED
+
+    mocker.patch(
+        "evidence_extractor.pipeline.runner.generate_summary",
+        return_value="Recovered summary.",
+    )
+    mock_gemini_client.query.reset_mock()
+    extraction, second = run_pipeline(
+        article_pdf, mock_gemini_client, checkpoint_root=checkpoint_root, resume=True
+    )
+    mock_gemini_client.query.assert_not_called()
+    assert second.stages["orchestrator"].from_checkpoint
+    assert not second.stages["summary"].from_checkpoint
+    assert extraction.summary == "Recovered summary."
+    assert extraction.claims[0].linked_citations == ["Smith2020"]
+
+
+def test_cancellable_client_stops_llm_calls(mock_gemini_client):
+    stage = Stage("summary", lambda inputs: None)
+    client = CancellableClient(mock_gemini_client, stage)
+    assert client.query("Summarise") == "Aspirin works."
+    assert client.text_model_name == "text-model"
+    stage.cancel_event.set()
+    with pytest.raises(StageCancelled):
+        client.query("Summarise")
+    with pytest.raises(StageCancelled):
+        client.query_with_image("Caption", None)
+    assert mock_gemini_client.query.call_count == 1
+    mock_gemini_client.query_with_image.assert_not_called()
+
+
+def test_run_pipeline_does_not_checkpoint_unconfigured_llm_stages(
+    article_pdf, mock_gemini_client, tmp_path
+):
+    checkpoint_root = str(tmp_path / "checkpoints")
+    mock_gemini_client.is_configured.return_value = False
+    extraction, _ = run_pipeline(
+        article_pdf, mock_gemini_client, checkpoint_root=checkpoint_root
+    )
+    saved = [path.stem for path in (tmp_path / "checkpoints").glob("*/*.json")]
+    assert saved == ["bibliography"]
+
+    mock_gemini_client.is_configured.return_value = True
+    extraction, report = run_pipeline(
+        article_pdf, mock_gemini_client, checkpoint_root=checkpoint_root, resume=True
+    )
+    assert not report.stages["orchestrator"].from_checkpoint
+    assert report.stages["bibliography"].from_checkpoint
+    assert extraction.claims
+
+
+def test_run_pipeline_serialises_fitz_calls_process_wide(
+    article_pdf, mock_gemini_client, mocker
+):
+    locks = []
+
+    def record_lock(document, client, document_lock):
+        locks.append(document_lock)
+        return []
+
+    mocker.patch(
+        "evidence_extractor.pipeline.runner.extract_figures_and_captions",
+        side_effect=record_lock,
+    )
+    run_pipeline(article_pdf, mock_gemini_client)
+    run_pipeline(article_pdf, mock_gemini_client)
+    assert locks == [FITZ_LOCK, FITZ_LOCK]
+    assert not FITZ_LOCK.locked()
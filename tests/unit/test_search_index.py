@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+
+from evidence_extractor.models.schemas import ValidationStatus
+from evidence_extractor.storage.corpus_store import CorpusStore
+from evidence_extractor.storage.search_index import fts_query, rebuild_search_index
+
+from .test_corpus_store import _extraction
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    with CorpusStore(str(tmp_path / "corpus.sqlite")) as corpus_store:
+        corpus_store.upsert(_extraction())
+        other = _extraction("other.pdf", "def456")
+        other.pico_elements.population = "Children with asthma"
+        corpus_store.upsert(other)
+        yield corpus_store
+
+
+def _index_size(store: CorpusStore) -> int:
+    return store.connection.execute("SELECT COUNT(*) FROM search_index").fetchone()[0]
+
+
+def test_fts_query_quotes_terms():
+    assert fts_query('blood "pressure" OR') == '"blood" """pressure""" "OR"'
+    assert fts_query("   ") == ""
+
+
+def test_search_ranks_matches_across_kinds(store: CorpusStore):
+    results = store.search("lowering blood pressures")
+    assert sorted(r["source_filename"] for r in results) == ["other.pdf", "paper.pdf"]
+    assert all(r["kind"] == "claim" and "[blood]" in r["snippet"] for r in results)
+    assert [r["kind"] for r in store.search("flow")] == ["figure", "figure"]
+    assert [r["kind"] for r in store.search("baseline", kinds=["table"])] == [
+        "table",
+        "table",
+    ]
+
+
+def test_search_filters_by_status_and_population(store: CorpusStore):
+    assert store.search("adverse", status="verified") == []
+    assert len(store.search("adverse", status="unverified")) == 2
+    results = store.search("adverse", population="asthma")
+    assert [r["source_filename"] for r in results] == ["other.pdf"]
+
+
+def test_index_follows_upserts_and_review_changes(store: CorpusStore):
+    before = _index_size(store)
+    extraction = store.get("abc123")
+    extraction.claims[1].correction_metadata.status = ValidationStatus.REJECTED
+    extraction.figures = []
+    store.upsert(extraction)
+    assert _index_size(store) == before - 1
+    assert [
+        r["source_filename"] for r in store.search("adverse", status="rejected")
+    ] == ["paper.pdf"]
+    rebuild_search_index(store.connection)
+    assert _index_size(store) == before - 1
+
+
+def test_invalid_raw_query_returns_no_results(store: CorpusStore):
+    assert store.search('"unterminated', raw=True) == []
+    assert len(store.search("adverse OR flow", raw=True)) == 4
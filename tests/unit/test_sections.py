@@ -0,0 +1,66 @@
+import fitz
+import pytest
+
+from evidence_extractor.core.preprocess import (
+    clean_and_consolidate_text,
+    extract_text_from_doc,
+)
+from evidence_extractor.extraction.sections import (
+    clear_section_cache,
+    detect_sections,
+)
+
+
+@pytest.fixture
+def sectioned_document():
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((50, 72), "1. Introduction", fontsize=16, fontname="hebo")
+    page.insert_text((50, 100), "Prior methods and results were limited.")
+    page.insert_text((50, 130), "Methods.", fontname="hebo")
+    page.insert_text((100, 130), "We recruited 50 adults into a trial.")
+    page = doc.new_page()
+    page.insert_text((50, 72), "Results")
+    page.insert_text((50, 100), "Pain scores improved by 30%.")
+    yield doc
+    doc.close()
+
+
+@pytest.fixture
+def cleaned_text(sectioned_document) -> str:
+    _, cleaned = clean_and_consolidate_text(extract_text_from_doc(sectioned_document))
+    return cleaned
+
+
+def test_detect_sections_uses_layout_and_lexicon(sectioned_document, cleaned_text):
+    clear_section_cache()
+    sections = detect_sections(sectioned_document, cleaned_text)
+    assert [s.title for s in sections] == ["introduction", "methods", "results"]
+    intro, methods, results = sections
+    assert intro.text_content == "Prior methods and results were limited."
+    assert methods.heading == "Methods."
+    assert methods.text_content == "We recruited 50 adults into a trial."
+    assert results.page_number == 2
+    assert results.end_char == len(cleaned_text)
+
+
+def test_detect_sections_offsets_point_into_cleaned_text(
+    sectioned_document, cleaned_text
+):
+    clear_section_cache()
+    for section in detect_sections(sectioned_document, cleaned_text):
+        assert cleaned_text[section.start_char :].startswith(section.heading)
+        assert (
+            section.text_content in cleaned_text[section.start_char : section.end_char]
+        )
+
+
+def test_detect_sections_is_cached(sectioned_document, cleaned_text, mocker):
+    clear_section_cache()
+    first = detect_sections(sectioned_document, cleaned_text)
+    spy = mocker.patch(
+        "evidence_extractor.extraction.sections.segment_sections",
+        side_effect=AssertionError("cache miss"),
+    )
+    assert detect_sections(sectioned_document, cleaned_text) is first
+    spy.assert_not_called()
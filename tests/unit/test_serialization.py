@@ -0,0 +1,74 @@
+from datetime import datetime
+
+import pytest
+
+from evidence_extractor.models.schemas import (
+    PICO,
+    ArticleExtraction,
+    Claim,
+    CorrectionMetadata,
+    Provenance,
+    ValidationStatus,
+)
+from evidence_extractor.output.json_builder import save_to_json
+from evidence_extractor.output.serialization import (
+    dumps_extraction,
+    load_extraction,
+    loads_extraction,
+)
+
+
+@pytest.fixture
+def extraction() -> ArticleExtraction:
+    provenance = Provenance(source_filename="paper.pdf", page_number=2)
+    return ArticleExtraction(
+        source_filename="paper.pdf",
+        pico_elements=PICO(population="Adults", provenance=[provenance]),
+        claims=[
+            Claim(
+                claim_text="Aspirin reduced pain.",
+                provenance=provenance,
+                correction_metadata=CorrectionMetadata(
+                    status=ValidationStatus.VERIFIED,
+                    last_reviewed=datetime(2024, 5, 1, 12, 30),
+                ),
+            )
+        ],
+    )
+
+
+def test_trusted_load_builds_nested_models(extraction):
+    loaded = loads_extraction(dumps_extraction(extraction), trusted=True)
+
+    claim = loaded.claims[0]
+    assert isinstance(claim, Claim)
+    assert isinstance(claim.provenance, Provenance)
+    assert claim.correction_metadata.status is ValidationStatus.VERIFIED
+    assert claim.correction_metadata.last_reviewed == datetime(2024, 5, 1, 12, 30)
+    assert isinstance(loaded.pico_elements.provenance[0], Provenance)
+    assert loaded.model_dump() == extraction.model_dump()
+
+
+def test_validated_load_matches_original(extraction):
+    assert loads_extraction(dumps_extraction(extraction)) == extraction
+
+
+def test_save_to_json_compact_and_pretty(extraction, tmp_path):
+    pretty, compact = tmp_path / "pretty.json", tmp_path / "compact.json"
+    save_to_json(extraction, str(pretty))
+    save_to_json(extraction, str(compact), indent=None)
+    assert len(compact.read_bytes()) < len(pretty.read_bytes())
+    assert load_extraction(str(compact)) == load_extraction(str(pretty))
+
+
+def test_load_extraction_returns_none_on_invalid_file(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text('{"claims": []}')
+    assert load_extraction(str(path)) is None
+
+
+def test_msgpack_round_trip(extraction, tmp_path):
+    pytest.importorskip("msgpack")
+    path = tmp_path / "paper.msgpack"
+    save_to_json(extraction, str(path))
+    assert load_extraction(str(path)) == extraction
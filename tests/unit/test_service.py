@@ -0,0 +1,146 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from unittest.mock import MagicMock
+
+import pytest
+
+from evidence_extractor.models.schemas import ArticleExtraction
+from evidence_extractor.pipeline.dag import PipelineReport
+from evidence_extractor.service.jobs import JobQueue, JobStatus
+from evidence_extractor.service.server import ExtractionServer
+
+
+def _wait_for(job_queue: JobQueue, job_id: str, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = job_queue.get(job_id)
+        if job.status not in (JobStatus.QUEUED, JobStatus.RUNNING):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish in time.")
+
+
+@pytest.fixture
+def processed(mocker):
+    order = []
+
+    def fake_pipeline(pdf_path, client, **options):
+        order.append(pdf_path)
+        if pdf_path.endswith("bad.pdf"):
+            return None
+        return ArticleExtraction(source_filename=pdf_path), PipelineReport()
+
+    mocker.patch("evidence_extractor.service.jobs.run_pipeline", fake_pipeline)
+    return order
+
+
+@pytest.fixture
+def job_queue(processed):
+    queue = JobQueue(MagicMock(), workers=1)
+    yield queue
+    queue.stop(timeout=5)
+
+
+def test_jobs_run_in_priority_order(job_queue, processed):
+    low = job_queue.submit("low.pdf", priority=0)
+    high = job_queue.submit("high.pdf", priority=5)
+    cancelled = job_queue.submit("cancelled.pdf", priority=9)
+    assert job_queue.cancel(cancelled.job_id)
+    job_queue.start()
+
+    assert _wait_for(job_queue, low.job_id).status == JobStatus.SUCCEEDED
+    assert _wait_for(job_queue, high.job_id).status == JobStatus.SUCCEEDED
+    assert processed == ["high.pdf", "low.pdf"]
+    assert job_queue.get(cancelled.job_id).status == JobStatus.CANCELLED
+    assert job_queue.result(high.job_id).source_filename == "high.pdf"
+
+
+def test_failed_job_has_no_result(job_queue):
+    job_queue.start()
+    job = _wait_for(job_queue, job_queue.submit("bad.pdf").job_id)
+    assert job.status == JobStatus.FAILED
+    assert job.error
+    assert job_queue.result(job.job_id) is None
+
+
+def test_http_api_round_trip(job_queue, tmp_path, mocker):
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    pdf_path = corpus / "paper.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    (tmp_path / "secret.pdf").write_bytes(b"%PDF-1.4")
+    server = ExtractionServer(
+        ("127.0.0.1", 0), job_queue, str(tmp_path / "uploads"), str(corpus)
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    job_queue.start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    def call(method, path, payload=None, content_type="application/json"):
+        data = payload if isinstance(payload, bytes) else None
+        if payload is not None and data is None:
+            data = json.dumps(payload).encode("utf-8")
+        request = urllib.request.Request(
+            base + path,
+            data=data,
+            method=method,
+            headers={"Content-Type": content_type},
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    try:
+        status, job = call(
+            "POST", "/jobs", {"pdf_path": "paper.pdf", "output_path": "/tmp/x.json"}
+        )
+        assert status == 202
+        assert job["pdf_path"] == str(pdf_path)
+        assert job["output_path"] is None
+        _wait_for(job_queue, job["job_id"])
+        status, result = call("GET", f"/jobs/{job['job_id']}/result")
+        assert status == 200
+        assert result["source_filename"] == str(pdf_path)
+        mocker.patch.object(job_queue, "result", return_value=None)
+        assert call("GET", f"/jobs/{job['job_id']}/result")[0] == 410
+
+        status, job = call("POST", "/jobs?priority=3", b"%PDF-1.4", "application/pdf")
+        assert status == 202
+        assert job["priority"] == 3
+        assert job["pdf_path"].startswith(str(tmp_path / "uploads"))
+
+        assert call("POST", "/jobs", {"pdf_path": "missing.pdf"})[0] == 400
+        assert call("POST", "/jobs", {"pdf_path": "../secret.pdf"})[0] == 400
+        secret = str(tmp_path / "secret.pdf")
+        assert call("POST", "/jobs", {"pdf_path": secret})[0] == 400
+        assert call("GET", "/jobs/" + "0" * 32)[0] == 404
+        status, listing = call("GET", "/jobs")
+        assert status == 200 and len(listing["jobs"]) == 2
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_path_submissions_need_an_input_root(job_queue, tmp_path):
+    server = ExtractionServer(("127.0.0.1", 0), job_queue)
+    try:
+        assert server.resolve_input(str(tmp_path)) is None
+    finally:
+        server.server_close()
+
+
+def test_results_are_written_under_the_output_dir(processed, tmp_path):
+    job_queue = JobQueue(MagicMock(), workers=1, output_dir=str(tmp_path / "out"))
+    job_queue.start()
+    try:
+        job = _wait_for(job_queue, job_queue.submit("paper.pdf").job_id)
+    finally:
+        job_queue.stop(timeout=5)
+    assert job.output_path == str(tmp_path / "out" / f"{job.job_id}.json")
+    assert (tmp_path / "out" / f"{job.job_id}.json").exists()
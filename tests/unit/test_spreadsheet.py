@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import pytest
+from openpyxl import load_workbook
+
+from evidence_extractor.models.schemas import (
+    ArticleExtraction,
+    Claim,
+    ExtractedTable,
+    Provenance,
+)
+from evidence_extractor.output.spreadsheet import export_corpus_to_excel
+
+
+def _extraction(name: str) -> ArticleExtraction:
+    provenance = Provenance(source_filename=name, page_number=4)
+    return ArticleExtraction(
+        source_filename=name,
+        title=f"Title of {name}\x07",
+        claims=[
+            Claim(claim_text=f"{name} claim {i}", provenance=provenance)
+            for i in range(2)
+        ],
+        tables=[
+            ExtractedTable(
+                summary="Baseline",
+                table_data=[{"Arm": "A", "N": 10}, {"Arm": "B", "N": [1, 2]}],
+                provenance=provenance,
+            )
+        ],
+    )
+
+
+def test_export_corpus_streams_shared_sheets(tmp_path: Path):
+    output_path = tmp_path / "corpus.xlsx"
+    extractions = (_extraction(f"paper_{i}.pdf") for i in range(3))
+
+    assert export_corpus_to_excel(extractions, str(output_path)) == 3
+
+    wb = load_workbook(output_path, read_only=True)
+    assert wb.sheetnames == ["Summary", "Claims", "Tables"]
+    summary = list(wb["Summary"].values)
+    assert len(summary) == 4
+    assert summary[1][1] == "Title of paper_0.pdf"
+    assert len(list(wb["Claims"].values)) == 7
+    tables = list(wb["Tables"].values)
+    assert len(tables) == 13
+    assert tables[1] == ("paper_0.pdf", 1, 4, "Baseline", 1, "Arm", "A")
+    assert tables[4][-1] == "[1, 2]"
+
+
+def test_export_corpus_fails_loudly_on_a_bad_record(tmp_path: Path):
+    output_path = tmp_path / "corpus.xlsx"
+
+    def corpus():
+        yield _extraction("paper_0.pdf")
+        raise ValueError("corrupt record")
+
+    with pytest.raises(ValueError, match="corrupt record"):
+        export_corpus_to_excel(corpus(), str(output_path))
+    assert not output_path.exists()
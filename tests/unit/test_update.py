@@ -0,0 +1,116 @@
+from pathlib import Path
+
+from evidence_extractor.models.schemas import ArticleExtraction, ValidationStatus
+from evidence_extractor.output.json_builder import save_to_json
+from evidence_extractor.pipeline.fingerprints import compute_fingerprints
+from evidence_extractor.pipeline.runner import run_pipeline
+from evidence_extractor.pipeline.update import run_update
+
+
+def _extract_to(corpus: Path, article_pdf: str, client) -> Path:
+    extraction, _ = run_pipeline(article_pdf, client)
+    extraction.claims[0].correction_metadata.status = ValidationStatus.VERIFIED
+    corpus.mkdir()
+    json_path = corpus / "article.json"
+    save_to_json(extraction, str(json_path))
+    return json_path
+
+
+def test_fingerprints_propagate_downstream():
+    dependencies = {"a": (), "b": ("a",), "c": ()}
+    before = compute_fingerprints(dependencies, {"a": ["v1"]}, "hash")
+    after = compute_fingerprints(dependencies, {"a": ["v2"]}, "hash")
+    assert before["a"] != after["a"]
+    assert before["b"] != after["b"]
+    assert before["c"] == after["c"]
+
+
+def test_run_pipeline_stamps_fingerprints(article_pdf, mock_gemini_client):
+    extraction, report = run_pipeline(article_pdf, mock_gemini_client)
+    assert extraction.document_hash
+    assert set(extraction.stage_fingerprints) == set(report.stages)
+
+
+def test_update_skips_unchanged_outputs(article_pdf, mock_gemini_client, tmp_path):
+    _extract_to(tmp_path / "corpus", article_pdf, mock_gemini_client)
+    mock_gemini_client.query.reset_mock()
+    records = run_update(str(tmp_path / "corpus"), mock_gemini_client)
+    assert [r["status"] for r in records] == ["up-to-date"]
+    mock_gemini_client.query.assert_not_called()
+
+
+def test_update_recomputes_only_changed_prompt(
+    article_pdf, mock_gemini_client, mocker, tmp_path
+):
+    json_path = _extract_to(tmp_path / "corpus", article_pdf, mock_gemini_client)
+    mocker.patch(
+        "evidence_extractor.pipeline.runner.SUMMARY_PROMPT", "A revised prompt."
+    )
+    mocker.patch(
+        "evidence_extractor.pipeline.runner.generate_summary",
+        return_value="Revised summary.",
+    )
+    mock_gemini_client.query.reset_mock()
+    mock_gemini_client.query_with_image.reset_mock()
+
+    (record,) = run_update(str(tmp_path / "corpus"), mock_gemini_client)
+
+    assert record["status"] == "updated"
+    assert record["stale_stages"] == ["summary"]
+    mock_gemini_client.query.assert_not_called()
+    updated = ArticleExtraction.model_validate_json(json_path.read_text())
+    assert updated.summary == "Revised summary."
+    assert updated.claims[0].correction_metadata.status == ValidationStatus.VERIFIED
+    assert updated.claims[0].uncertainty_annotation == "Confidence: High."
+    assert updated.claims[0].linked_citations == ["Smith2020"]
+
+
+def test_update_treats_legacy_outputs_as_stale(
+    article_pdf, mock_gemini_client, tmp_path
+):
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    save_to_json(
+        ArticleExtraction(source_filename=article_pdf), str(corpus / "legacy.json")
+    )
+    (corpus / "notes.json").write_text("[1, 2]")
+
+    records = run_update(str(corpus), mock_gemini_client, dry_run=True)
+
+    statuses = {Path(r["output_path"]).name: r["status"] for r in records}
+    assert statuses == {"legacy.json": "stale", "notes.json": "skipped"}
+    mock_gemini_client.query.assert_not_called()
+
+
+def test_update_keeps_output_without_configured_client(
+    article_pdf, mock_gemini_client, tmp_path
+):
+    json_path = _extract_to(tmp_path / "corpus", article_pdf, mock_gemini_client)
+    original = json_path.read_bytes()
+    mock_gemini_client.is_configured.return_value = False
+
+    (record,) = run_update(str(tmp_path / "corpus"), mock_gemini_client)
+
+    assert record["status"] == "failed"
+    assert "not configured" in record["error"]
+    assert json_path.read_bytes() == original
+
+
+def test_update_keeps_output_when_a_stage_fails(
+    article_pdf, mock_gemini_client, mocker, tmp_path
+):
+    json_path = _extract_to(tmp_path / "corpus", article_pdf, mock_gemini_client)
+    original = json_path.read_bytes()
+    mocker.patch(
+        "evidence_extractor.pipeline.runner.SUMMARY_PROMPT", "A revised prompt."
+    )
+    mocker.patch(
+        "evidence_extractor.pipeline.runner.generate_summary",
+        side_effect=RuntimeError("quota exceeded"),
+    )
+
+    (record,) = run_update(str(tmp_path / "corpus"), mock_gemini_client)
+
+    assert record["status"] == "failed"
+    assert "summary" in record["error"]
+    assert json_path.read_bytes() == original
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from evidence_extractor.pipeline.watch import MANIFEST_FILENAME, FolderWatcher
+
+
+@pytest.fixture
+def processed(mocker):
+    mocker.patch("evidence_extractor.pipeline.batch._init_worker")
+
+    def fake_process(pdf_path, output_path, pipeline_options=None):
+        return {"pdf_path": pdf_path, "output_path": output_path, "status": "ok"}
+
+    return mocker.patch(
+        "evidence_extractor.pipeline.batch.process_document", side_effect=fake_process
+    )
+
+
+def _watcher(tmp_path, **kwargs) -> FolderWatcher:
+    return FolderWatcher(
+        str(tmp_path / "inbox"),
+        str(tmp_path / "out"),
+        settle_seconds=0,
+        poll_seconds=0,
+        **kwargs,
+    )
+
+
+def test_growing_file_is_debounced(tmp_path):
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    pdf_path = inbox / "paper.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 partial")
+    watcher = _watcher(tmp_path)
+
+    assert watcher.pending_documents() == []
+    pdf_path.write_bytes(b"%PDF-1.4 partial, now complete")
+    assert watcher.pending_documents() == []
+    (ready,) = watcher.pending_documents()
+    assert ready[0] == pdf_path
+    assert watcher.pending_documents() == []
+
+
+def test_processed_documents_survive_restart(tmp_path, processed):
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    (inbox / "a.pdf").write_bytes(b"%PDF-1.4 a")
+    (inbox / "b.pdf").write_bytes(b"%PDF-1.4 b")
+
+    _watcher(tmp_path).run(max_cycles=2)
+    assert processed.call_count == 2
+    lines = (tmp_path / "out" / MANIFEST_FILENAME).read_text().splitlines()
+    assert {json.loads(line)["status"] for line in lines} == {"ok"}
+
+    (inbox / "copy-of-a.pdf").write_bytes(b"%PDF-1.4 a")
+    _watcher(tmp_path).run(max_cycles=3)
+    assert processed.call_count == 2
+
+    (inbox / "c.pdf").write_bytes(b"%PDF-1.4 c")
+    _watcher(tmp_path).run(max_cycles=2)
+    assert processed.call_count == 3
+    assert processed.call_args[0][0].endswith("c.pdf")
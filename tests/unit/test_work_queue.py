@@ -0,0 +1,136 @@
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from evidence_extractor.pipeline.batch import RUN_SUMMARY_FILENAME
+from evidence_extractor.pipeline.work_queue import WorkQueue, run_distributed_batch
+
+
+@pytest.fixture
+def pdf_paths(tmp_path: Path):
+    paths = []
+    for name in ("a.pdf", "b.pdf"):
+        path = tmp_path / "corpus" / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(b"%PDF-1.4")
+        paths.append(path)
+    return paths
+
+
+def test_enqueue_is_idempotent(tmp_path, pdf_paths):
+    queue = WorkQueue(str(tmp_path / "queue"), node_id="node-1")
+    assert queue.enqueue(pdf_paths) == 2
+    assert queue.enqueue(pdf_paths) == 0
+    assert len(queue.task_ids()) == 2
+
+
+def test_enqueue_keeps_same_named_manifest_entries(tmp_path):
+    paths = [tmp_path / folder / "paper.pdf" for folder in ("a", "b")]
+    queue = WorkQueue(str(tmp_path / "queue"), node_id="node-1")
+    assert queue.enqueue(paths) == 2
+
+
+def test_nodes_claim_distinct_tasks(tmp_path, pdf_paths):
+    first = WorkQueue(str(tmp_path / "queue"), node_id="node-1")
+    second = WorkQueue(str(tmp_path / "queue"), node_id="node-2")
+    first.enqueue(pdf_paths)
+
+    task_one = first.claim()
+    task_two = second.claim()
+
+    assert {task_one["pdf_path"], task_two["pdf_path"]} == {str(p) for p in pdf_paths}
+    assert first.claim() is None
+    first.complete(task_one["task_id"], {"status": "ok"})
+    assert not first.is_drained()
+    second.complete(task_two["task_id"], {"status": "ok"})
+    assert first.is_drained()
+
+
+def test_expired_lease_is_reclaimed(tmp_path, pdf_paths):
+    crashed = WorkQueue(str(tmp_path / "queue"), lease_seconds=0.05, node_id="dead")
+    survivor = WorkQueue(str(tmp_path / "queue"), lease_seconds=0.05, node_id="live")
+    crashed.enqueue(pdf_paths[:1])
+    task = crashed.claim()
+    assert survivor.claim() is None
+
+    time.sleep(0.1)
+    reclaimed = survivor.claim()
+
+    assert reclaimed["task_id"] == task["task_id"]
+    assert reclaimed["attempt"] == 2
+    assert not crashed.heartbeat(task["task_id"], task["attempt"])
+    assert survivor.heartbeat(task["task_id"], reclaimed["attempt"])
+
+
+def test_concurrent_reclaim_keeps_the_winners_lease(tmp_path, pdf_paths, mocker):
+    queue_dir = str(tmp_path / "queue")
+    crashed = WorkQueue(queue_dir, lease_seconds=0.05, node_id="dead")
+    winner = WorkQueue(queue_dir, lease_seconds=60, node_id="winner")
+    loser = WorkQueue(queue_dir, lease_seconds=60, node_id="loser")
+    crashed.enqueue(pdf_paths[:1])
+    task = crashed.claim()
+    time.sleep(0.1)
+
+    check_expiry = loser._expired_lease
+    raced = []
+
+    def winner_reclaims_first(lease_path):
+        expired = check_expiry(lease_path)
+        if not raced:
+            raced.append(winner.claim())
+        return expired
+
+    mocker.patch.object(loser, "_expired_lease", side_effect=winner_reclaims_first)
+    assert loser.claim() is None
+    assert raced[0]["attempt"] == 2
+    assert winner.owns(task["task_id"])
+    assert not list((tmp_path / "queue").rglob("*.lease.*"))
+
+
+def test_task_abandoned_after_max_attempts(tmp_path, pdf_paths):
+    queue = WorkQueue(str(tmp_path / "queue"), lease_seconds=0.01, max_attempts=1)
+    queue.enqueue(pdf_paths[:1])
+    assert queue.claim()["attempt"] == 1
+    time.sleep(0.05)
+
+    assert queue.claim() is None
+    (record,) = queue.records()
+    assert record["status"] == "failed"
+    assert "interrupted" in record["error"]
+
+
+def test_run_distributed_batch_merges_results(tmp_path, pdf_paths, mocker):
+    def fake_process(pdf_path, output_path, pipeline_options=None):
+        Path(output_path).write_text("{}")
+        return {
+            "pdf_path": pdf_path,
+            "output_path": output_path,
+            "status": "ok",
+            "error": None,
+            "seconds": 0.1,
+        }
+
+    mocker.patch("evidence_extractor.pipeline.batch._init_worker")
+    mocker.patch(
+        "evidence_extractor.pipeline.batch.process_document", side_effect=fake_process
+    )
+    output_dir = tmp_path / "out"
+
+    summary = run_distributed_batch(
+        pdf_paths,
+        str(output_dir),
+        str(tmp_path / "queue"),
+        root=tmp_path / "corpus",
+    )
+
+    assert summary["documents_succeeded"] == 2
+    assert summary["documents_pending"] == 0
+    assert sorted(p.name for p in output_dir.glob("*.json")) == [
+        "a.json",
+        "b.json",
+        RUN_SUMMARY_FILENAME,
+    ]
+    written = json.loads((output_dir / RUN_SUMMARY_FILENAME).read_text())
+    assert len(written["documents"]) == 2